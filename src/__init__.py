@@ -3,8 +3,8 @@
 from src.core.backend import _backend_init
 _backend_init()
 del _backend_init
-from src.enum import mouseButton, mouseCursor, key, xPos, yPos, corner
-from src.color import Color
+from src.enum import mouseButton, mouseCursor, key, keyModifier, xPos, yPos, corner, presentMode, layoutDirection, layoutAlign, layoutJustify, easing, animationProperty, logLevel, resourceType
+from src.color import Color, PackedColor
 from src.version import get_version
 from src import exceptions, messenger, typedef
 
@@ -12,12 +12,17 @@ from src import exceptions, messenger, typedef
 from src.core.handler.clock import Clock
 from src.core.handler.OID import OID
 from src.core.handler.fps_counter import FPSCounter
+from src.core.handler.animator import Animator
 
 # core/utils
 from src.core.utils.screenunits import dw, dh, screen_units
 from src.core.utils.debugging import enable_debugging, DebugTimer
+from src.core.utils.profiler import Profiler, profiler
+from src.core.utils.widget_costs import WidgetCosts
+from src.core.utils.resource_manager import ResourceManager, shared_resources
 from src.core.utils.aspect_ratio import convert_aspect_ratio, get_height_from_aspect_ratio, get_width_from_aspect_ratio
 from src.core.window.rect import Rect
+from src.core.window.rect_array import RectArray
 from src.core.window.interactive_rect import InteractiveRect
 from src.core.utils.coordinate import Coordinate
 from src.core.utils.font import Font
@@ -25,6 +30,11 @@ from src.core.utils.font import Font
 # core/window
 from src.core.window.window import Window
 from src.core.window.draw import Draw
+from src.core.window.texture_atlas import TextureAtlas, AtlasRegion
+from src.core.window.particle_emitter import ParticleEmitter
+from src.core.window.layout import LayoutNode, LayoutItem, FlexLayout, GridLayout
+from src.core.window.gradient import Gradient, LinearGradient, RadialGradient
+from src.core.window.frame_pipeline import FramePipeline, FrameSnapshot
 
 # widgets
 #   core widgets
@@ -36,10 +46,16 @@ from src.widget.input.button.radio_button import RadioButton
 from src.widget.input.button.checkbox import Checkbox
 from src.widget.input.text.form import Form
 from src.widget.input.text.form_field import FormField
+from src.widget.input.misc.select import Select
 #   static widgets
 from src.widget.static.text_box import TextBox
+from src.widget.static.list_view import ListView
+#   image widgets
+from src.widget.image.image import Image
+from src.widget.image.static_image import StaticImage
 #   debug widgets
 from src.widget.debug.fps_counter_widget import FPScounterWidget
+from src.widget.debug.performance_hud_widget import PerformanceHUDWidget
 
 # cache
 from src.core.utils.cache.font_cache import fonts
@@ -1,8 +1,70 @@
 import random
+import sdl2
+import numpy as np
+from typing import Union
 from .typedef import RGBAvalue, RGBvalue
 from .messenger import Messenger
 from .exceptions import ColorError
 
+# colors converted by 'Color.pack', so converting the same color again is a dict lookup
+_packed_colors: dict[tuple, 'PackedColor'] = {}
+_MAX_PACKED_COLORS = 4096
+
+
+class PackedColor(tuple):
+    """
+    An immutable RGBA color that is validated once when it is created.\n
+    It is a tuple of 4 ints, so it is accepted everywhere an RGB/RGBA tuple is, and also keeps the color packed
+    into one uint32 (0xRRGGBBAA) and as an SDL_Color, so the draw code doesn't check or convert it again.
+    The 'Color' constants are packed colors, 'Color.pack' turns any color tuple into one.
+    """
+
+    def __new__(cls, r: int, g: int, b: int, a: int = 255) -> 'PackedColor':
+        for channel in (r, g, b, a):
+            if not isinstance(channel, (int, np.integer)) or not 0 <= channel <= 255:
+                Messenger.fatalError(ColorError(f"{channel} is out of range 0-255 in {(r, g, b, a)}"))
+        r, g, b, a = int(r), int(g), int(b), int(a)
+        color = super().__new__(cls, (r, g, b, a))
+        color.packed = (r << 24) | (g << 16) | (b << 8) | a
+        color._sdl_color = None
+        return color
+
+    def __repr__(self) -> str:
+        return f"PackedColor{tuple.__repr__(self)}"
+
+    @classmethod
+    def from_packed(cls, packed: int) -> 'PackedColor':
+        """
+        the color of a uint32 in the 0xRRGGBBAA layout
+        """
+        return cls((packed >> 24) & 255, (packed >> 16) & 255, (packed >> 8) & 255, packed & 255)
+
+    @property
+    def r(self) -> int:
+        return self[0]
+
+    @property
+    def g(self) -> int:
+        return self[1]
+
+    @property
+    def b(self) -> int:
+        return self[2]
+
+    @property
+    def a(self) -> int:
+        return self[3]
+
+    @property
+    def sdl_color(self) -> sdl2.SDL_Color:
+        """
+        the color as an SDL_Color, created on first use and shared, don't change it
+        """
+        if self._sdl_color is None:
+            self._sdl_color = sdl2.SDL_Color(*self)
+        return self._sdl_color
+
+
 class Color:
     # TODO add argb
 
@@ -69,8 +131,49 @@ class Color:
     def random():
         return tuple([random.randint(0, 255) for c in range(3)])
 
+    @staticmethod
+    def pack(color: Union[RGBvalue, RGBAvalue, PackedColor]) -> PackedColor:
+        """
+        the color as a PackedColor, a color is only validated and converted the first time it is packed
+        """
+        if type(color) is PackedColor:
+            return color
+        key = tuple(color)
+        packed = _packed_colors.get(key)
+        if packed is None:
+            Color._handle_rgb_rgba(key)
+            if len(_packed_colors) >= _MAX_PACKED_COLORS:
+                # animated colors can create many colors that are used once
+                _packed_colors.clear()
+            packed = _packed_colors[key] = PackedColor(*(int(channel) for channel in key))
+        return packed
+
+    @staticmethod
+    def pack_array(colors: Union[np.ndarray, list]) -> np.ndarray:
+        """
+        many colors as an (N, 4) uint8 RGBA array, for the bulk draw methods\n
+        :param colors: an (N, 3) or (N, 4) array or list of colors, or an (N,) uint32 array of packed 0xRRGGBBAA colors.
+        An (N, 4) uint8 array is returned as it is.
+        """
+        array = np.asarray(colors)
+        if array.dtype == np.uint8 and array.ndim == 2 and array.shape[1] == 4:
+            return array
+        if array.ndim == 1 and array.dtype == np.uint32:
+            # big-endian, so the bytes are in R, G, B, A order
+            return array.astype(">u4").view(np.uint8).reshape(-1, 4)
+        if array.ndim != 2 or array.shape[1] not in (3, 4):
+            Messenger.fatalError(ColorError(f"colors have to be an (N, 3) or (N, 4) array of RGB/RGBA values, got shape {array.shape}"))
+        if len(array) and (array.min() < 0 or array.max() > 255):
+            Messenger.fatalError(ColorError("a color channel is out of range 0-255"))
+        if array.shape[1] == 3:
+            return np.column_stack((array.astype(np.uint8), np.full(len(array), 255, dtype=np.uint8)))
+        return array.astype(np.uint8)
+
     @staticmethod
     def _handle_rgb_rgba(color: (RGBvalue | RGBAvalue)) -> (RGBvalue | RGBAvalue):
+        if type(color) is PackedColor:
+            # validated when it was created
+            return color
         if len(color) < 3:
             Messenger.fatalError(ColorError(f"Length of color tuple|list is shorter than 3 -> {color}\ncorrect notation: (R, G, B, [optional] A)"))
         elif len(color) > 4:
@@ -79,3 +182,10 @@ class Color:
             if _color not in range(0, 256):
                 Messenger.fatalError(ColorError(f"{_color} is out of range 0-255 in {color}"))
         return color
+
+
+# the constants are packed once here, aliases like GRAY and GREY stay the same object
+for _name, _value in list(vars(Color).items()):
+    if isinstance(_value, tuple):
+        setattr(Color, _name, Color.pack(_value))
+del _name, _value
@@ -1,14 +1,56 @@
-import uuid
+_INDEX_BITS = 32
+_INDEX_MASK = (1 << _INDEX_BITS) - 1
+
+# generation of every allocated index, an index is reused through the free list with a higher generation
+_generations: list[int] = []
+_free_indices: list[int] = []
+
 
 class OID:
     """
-    creates an object ID
+    creates an object ID\n
+    The ID is an integer handle made of a slot index and a generation. Indices of released IDs are reused,
+    the generation makes sure an old handle never equals the handle of a newer object with the same index.
+    An ID is released when its owner is garbage collected.
     """
+    __slots__ = ("_handle",)
+
     def __init__(self) -> None:
-        self.OID: uuid.UUID = uuid.uuid4()
-        
-    def __call__(self) -> str:
-        return self.OID.__str__()
-    
+        if _free_indices:
+            index = _free_indices.pop()
+        else:
+            index = len(_generations)
+            _generations.append(0)
+        self._handle: int = (_generations[index] << _INDEX_BITS) | index
+
+    def __call__(self) -> int:
+        return self._handle
+
     def __str__(self) -> str:
-        return self.OID.__str__()
\ No newline at end of file
+        return str(self._handle)
+
+    def __int__(self) -> int:
+        return self._handle
+
+    @property
+    def index(self) -> int:
+        return self._handle & _INDEX_MASK
+
+    @property
+    def generation(self) -> int:
+        return self._handle >> _INDEX_BITS
+
+    def __del__(self) -> None:
+        try:
+            index = self._handle & _INDEX_MASK
+            _generations[index] += 1
+            _free_indices.append(index)
+        except (TypeError, NameError, AttributeError):
+            pass  # interpreter shutdown
+
+
+def handle_index(handle: int) -> int:
+    """
+    the slot index of an OID handle
+    """
+    return handle & _INDEX_MASK
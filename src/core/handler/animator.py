@@ -0,0 +1,220 @@
+import numpy as np
+from time import perf_counter
+from typing import TYPE_CHECKING, Callable, Sequence
+from ...enum import easing, animationProperty
+from ...messenger import Messenger
+
+if TYPE_CHECKING:
+    from ...widget.core.widget import Widget
+
+# the amount of values of every property
+_CHANNELS = {animationProperty.position: 2, animationProperty.size: 2, animationProperty.color: 4,
+             animationProperty.alpha: 1, animationProperty.radius: 1}
+_BACK = 1.70158
+
+
+def _ease(function: int, t: np.ndarray) -> np.ndarray:
+    if function == 0:  # linear
+        return t
+    if function == 1:  # in_quad
+        return t * t
+    if function == 2:  # out_quad
+        return t * (2 - t)
+    if function == 3:  # in_out_quad
+        return np.where(t < 0.5, 2 * t * t, 1 - (-2 * t + 2) ** 2 / 2)
+    if function == 4:  # in_cubic
+        return t ** 3
+    if function == 5:  # out_cubic
+        return 1 - (1 - t) ** 3
+    if function == 6:  # in_out_cubic
+        return np.where(t < 0.5, 4 * t ** 3, 1 - (-2 * t + 2) ** 3 / 2)
+    # out_back
+    return 1 + (_BACK + 1) * (t - 1) ** 3 + _BACK * (t - 1) ** 2
+
+
+def _read(widget: 'Widget', prop: animationProperty) -> tuple:
+    if prop is animationProperty.position:
+        return widget.x, widget.y
+    if prop is animationProperty.size:
+        return widget.w, widget.h
+    if prop is animationProperty.color:
+        return tuple(widget._color) if len(widget._color) == 4 else (*widget._color, 255)
+    if prop is animationProperty.alpha:
+        return (widget._color[3] if len(widget._color) == 4 else 255,)
+    radius = widget._corner_radius()
+    return (radius if isinstance(radius, (int, float)) else radius[0],)
+
+
+class Animator:
+    """
+    Runs tweens of widget properties, all tweens are advanced together in one NumPy step per frame.\n
+    The start and end values, times and easing of every tween are kept in arrays, only writing the results back to the
+    widgets is done per widget, grouped by property. Starting a tween on a property that is already animated replaces it.
+    The window updates its animator every frame after the events are handled
+    ```
+    window.animator.animate(button, animationProperty.position, (200, 50), 0.3, easing.out_cubic)
+    ```
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        self._count = 0
+        self._start_values = np.zeros((capacity, 4))
+        self._end_values = np.zeros((capacity, 4))
+        self._written = np.full((capacity, 4), np.nan)  # the values last written to the widgets
+        self._start_times = np.zeros(capacity)
+        self._durations = np.ones(capacity)
+        self._easings = np.zeros(capacity, dtype=np.int8)
+        self._properties = np.zeros(capacity, dtype=np.int8)
+        # per tween python objects, in the same order as the arrays
+        self._widgets: list['Widget'] = []
+        self._callbacks: list[Callable[['Widget'], None] | None] = []
+        self._slots: dict[tuple[int, int], int] = {}  # (widget handle, property) -> position in the arrays
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _grow(self) -> None:
+        capacity = len(self._start_times) * 2
+        self._start_values = np.resize(self._start_values, (capacity, 4))
+        self._end_values = np.resize(self._end_values, (capacity, 4))
+        self._written = np.resize(self._written, (capacity, 4))
+        self._start_times = np.resize(self._start_times, capacity)
+        self._durations = np.resize(self._durations, capacity)
+        self._easings = np.resize(self._easings, capacity)
+        self._properties = np.resize(self._properties, capacity)
+
+    def animate(self, widget: 'Widget', prop: animationProperty, target: float | Sequence[float], duration: float,
+                easing_function: easing = easing.in_out_quad, delay: float = 0, on_complete: Callable[['Widget'], None] | None = None,
+                start_time: float | None = None) -> None:
+        """
+        tween a property of a widget from its current value to a target\n
+        :param target: x, y for position, w, h for size, r, g, b(, a) for color, a single number for alpha and radius
+        :param duration: in seconds
+        :param delay: seconds before the tween starts, the property keeps its current value until then
+        :param on_complete: called with the widget when the tween finished, not when it was replaced or cancelled
+        """
+        channels = _CHANNELS[prop]
+        target = (target,) if isinstance(target, (int, float)) else tuple(target)
+        if prop is animationProperty.color and len(target) == 3:
+            target = (*target, 255)
+        if len(target) != channels:
+            Messenger.fatalError(ValueError(f"a {prop.name} animation needs {channels} target values, got {len(target)}"))
+        if duration < 0:
+            Messenger.fatalError(ValueError("the duration of an animation can't be negative"))
+
+        key = (widget._handle, prop.value)
+        slot = self._slots.get(key)
+        if slot is None:
+            if self._count == len(self._start_times):
+                self._grow()
+            slot = self._count
+            self._count += 1
+            self._slots[key] = slot
+            self._widgets.append(widget)
+            self._callbacks.append(on_complete)
+        else:
+            self._callbacks[slot] = on_complete
+
+        self._start_values[slot, :channels] = _read(widget, prop)
+        self._end_values[slot, :channels] = target
+        self._written[slot] = np.nan
+        self._start_times[slot] = (perf_counter() if start_time is None else start_time) + delay
+        self._durations[slot] = max(duration, 1e-9)
+        self._easings[slot] = easing_function.value
+        self._properties[slot] = prop.value
+
+    def is_animating(self, widget: 'Widget', prop: animationProperty | None = None) -> bool:
+        if prop is not None:
+            return (widget._handle, prop.value) in self._slots
+        return any((widget._handle, p.value) in self._slots for p in animationProperty)
+
+    def cancel(self, widget: 'Widget', prop: animationProperty | None = None) -> None:
+        """
+        stop tweens of a widget where they are, all its tweens when no property is given
+        """
+        for p in ((prop,) if prop is not None else animationProperty):
+            slot = self._slots.get((widget._handle, p.value))
+            if slot is not None:
+                self._remove(slot)
+
+    def clear(self) -> None:
+        self._count = 0
+        self._widgets = []
+        self._callbacks = []
+        self._slots = {}
+
+    def _remove(self, slot: int) -> None:
+        """
+        swap the last tween into the slot
+        """
+        last = self._count - 1
+        del self._slots[(self._widgets[slot]._handle, int(self._properties[slot]))]
+        if slot != last:
+            for array in (self._start_values, self._end_values, self._written, self._start_times, self._durations, self._easings, self._properties):
+                array[slot] = array[last]
+            self._widgets[slot] = self._widgets[last]
+            self._callbacks[slot] = self._callbacks[last]
+            self._slots[(self._widgets[slot]._handle, int(self._properties[slot]))] = slot
+        self._widgets.pop()
+        self._callbacks.pop()
+        self._count = last
+
+    def update(self, current_time: float | None = None) -> None:
+        """
+        advance all tweens to a perf_counter timestamp, now when not given
+        """
+        count = self._count
+        if count == 0:
+            return
+        if current_time is None:
+            current_time = perf_counter()
+
+        started = self._start_times[:count] <= current_time
+        t = np.clip((current_time - self._start_times[:count]) / self._durations[:count], 0, 1)
+        eased = np.empty(count)
+        easings = self._easings[:count]
+        for function in np.unique(easings):
+            selected = easings == function
+            eased[selected] = _ease(int(function), t[selected])
+        values = self._start_values[:count] + (self._end_values[:count] - self._start_values[:count]) * eased[:, None]
+        # most properties are whole numbers, widgets are only touched when their rounded value changes
+        radius = self._properties[:count] == animationProperty.radius.value
+        values[~radius] = np.rint(values[~radius])
+        changed = started & (values != self._written[:count]).any(axis=1)
+        self._written[:count][changed] = values[changed]
+
+        properties = self._properties[:count]
+        for prop in animationProperty:
+            selected = np.flatnonzero((properties == prop.value) & changed)
+            if len(selected):
+                self._write(prop, selected, values[selected])
+
+        finished = np.flatnonzero(t >= 1)
+        if len(finished):
+            completed = [(self._widgets[slot], self._callbacks[slot]) for slot in finished]
+            # remove from the back so the swapped in tweens are ones that are already handled
+            for slot in finished[::-1]:
+                self._remove(int(slot))
+            for widget, callback in completed:
+                if callback is not None:
+                    callback(widget)
+
+    def _write(self, prop: animationProperty, slots: np.ndarray, values: np.ndarray) -> None:
+        widgets = self._widgets
+        if prop is animationProperty.position or prop is animationProperty.size:
+            moved = prop is animationProperty.position
+            for slot, (a, b) in zip(slots.tolist(), values[:, :2].astype(int).tolist()):
+                if moved:
+                    widgets[slot].reposition(a, b)
+                else:
+                    widgets[slot].resize(a, b)
+        elif prop is animationProperty.color:
+            for slot, color in zip(slots.tolist(), values.astype(int).tolist()):
+                widgets[slot]._color = tuple(color)
+        elif prop is animationProperty.alpha:
+            for slot, alpha in zip(slots.tolist(), values[:, 0].astype(int).tolist()):
+                widget = widgets[slot]
+                widget._color = (*widget._color[:3], alpha)
+        else:
+            for slot, radius in zip(slots.tolist(), values[:, 0].tolist()):
+                widgets[slot]._radius = radius
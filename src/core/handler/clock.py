@@ -1,4 +1,5 @@
 from time import perf_counter, sleep
+from ...messenger import Messenger
 
 class Clock:
     """
@@ -43,6 +44,6 @@ class Clock:
         self._next_frame_time = current_time + self.frame_length
 
     def _frame_delay(self, delay_time):
-        """Handle significant frame delays."""
-        print(f"Frame delayed by {delay_time:.5f} seconds")
+        """Handle significant frame delays, the message is written by the messenger thread so the next frame isn't delayed by it."""
+        Messenger.warning(f"Frame delayed by {delay_time:.5f} seconds")
 
@@ -8,8 +8,13 @@ class FPSCounter:
         self.last_fps_time = self.last_time
         self.update_interval = 0.5  # Update FPS value every 0.5 seconds
 
-    def tick(self):
-        current_time = time.perf_counter()
+    def tick(self, current_time: float | None = None):
+        """
+        Count a frame and return the time since the previous tick\n
+        :param current_time: a perf_counter timestamp of the frame, e.g. the moment it was presented. Defaults to now.
+        """
+        if current_time is None:
+            current_time = time.perf_counter()
         delta_time = current_time - self.last_time
         self.last_time = current_time
 
@@ -24,4 +29,4 @@ class FPSCounter:
         return delta_time
 
     def get_fps(self):
-        return self.fps
\ No newline at end of file
+        return self.fps
@@ -25,6 +25,12 @@ class KeyboardInput:
 
     def get_input_string(self) -> str:
         self._get_input()
+        return self._input_with_caret()
+
+    def _input_with_caret(self) -> str:
+        """
+        the input with the caret while it blinks on, the typed keys are not read
+        """
         if self._caret_status:
             return self._input[:self._caret_pointer] + "|" + self._input[self._caret_pointer:]
         return self._input
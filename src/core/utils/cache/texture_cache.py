@@ -0,0 +1,201 @@
+import os
+import sdl2
+import sdl2.sdlimage
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+from ....messenger import Messenger
+from ....enum import resourceType
+from ...window.frame_pipeline import DeferredTexture, current_pipeline
+
+if TYPE_CHECKING:
+    from ...window.window import Window
+
+# (path, width, height), a size of 0 keeps the size of the file
+texture_key = tuple[str, int, int]
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    the decode threads are shared by all windows and only started when the first image is loaded
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="plang-image")
+    return _executor
+
+
+def _decode(path: str, width: int, height: int) -> sdl2.SDL_Surface:
+    """
+    load and scale an image file into a surface, runs on a decode thread so it can't touch the renderer
+    """
+    loaded = sdl2.sdlimage.IMG_Load(path.encode())
+    if not loaded:
+        raise OSError(f"failed to load image '{path}': {sdl2.sdlimage.IMG_GetError().decode()}")
+    surface = sdl2.SDL_ConvertSurfaceFormat(loaded, sdl2.SDL_PIXELFORMAT_ARGB8888, 0)
+    sdl2.SDL_FreeSurface(loaded)
+    if width and height and (surface.contents.w, surface.contents.h) != (width, height):
+        scaled = sdl2.SDL_CreateRGBSurfaceWithFormat(0, width, height, 32, sdl2.SDL_PIXELFORMAT_ARGB8888)
+        sdl2.SDL_SetSurfaceBlendMode(surface, sdl2.SDL_BLENDMODE_NONE)
+        sdl2.SDL_BlitScaled(surface, None, scaled, None)
+        sdl2.SDL_FreeSurface(surface)
+        surface = scaled
+    return surface
+
+
+def _free_result(future: Future) -> None:
+    if future.exception() is None:
+        sdl2.SDL_FreeSurface(future.result())
+
+
+class TextureCache:
+    """
+    Textures of image files of a window, keyed by path and size.\n
+    Files are decoded and scaled on background threads, the textures are created on the main thread when they are requested
+    again, at most 'max_uploads_per_frame' per frame so a lot of images finishing at once don't stall a frame.
+    The least recently used textures are destroyed when the textures take more than 'max_bytes' of video memory,
+    they are decoded again when they are requested after that.
+    """
+
+    def __init__(self, window: 'Window', max_bytes: int = 256 * 1024 * 1024, max_uploads_per_frame: int = 4) -> None:
+        self._window = window
+        self.max_bytes = max_bytes
+        self.max_uploads_per_frame = max_uploads_per_frame
+        self._textures: OrderedDict[texture_key, tuple[sdl2.SDL_Texture, int, int]] = OrderedDict()
+        self._pending: dict[texture_key, Future] = {}
+        self._failed: set[texture_key] = set()
+        self._bytes = 0
+        self._upload_frame = -1
+        self._uploads = 0
+
+    def __len__(self) -> int:
+        return len(self._textures)
+
+    def __contains__(self, key: texture_key) -> bool:
+        return key in self._textures
+
+    def get_memory_usage(self) -> int:
+        """
+        the video memory taken by the cached textures in bytes
+        """
+        return self._bytes
+
+    def request(self, path: str, width: int = 0, height: int = 0) -> tuple[sdl2.SDL_Texture, int, int] | None:
+        """
+        the texture of an image file with its width and height, or None when it is still being decoded or failed to load\n
+        Call this every frame the image is needed, the first call starts decoding and a later call uploads the result
+        """
+        key = (path, int(width), int(height))
+        cached = self._textures.get(key)
+        if cached is not None:
+            self._textures.move_to_end(key)
+            return cached
+        if key in self._failed:
+            return None
+
+        future = self._pending.get(key)
+        if future is None:
+            self._pending[key] = _get_executor().submit(_decode, *key)
+            return None
+        if not future.done() or not self._can_upload():
+            return None
+        del self._pending[key]
+        try:
+            surface = future.result()
+        except OSError as error:
+            self._failed.add(key)
+            Messenger.warning(str(error))
+            return None
+        return self._upload(key, surface)
+
+    def load(self, path: str, width: int = 0, height: int = 0) -> tuple[sdl2.SDL_Texture, int, int] | None:
+        """
+        like 'request', but decodes on the calling thread and always returns the texture, None when the file failed to load
+        """
+        key = (path, int(width), int(height))
+        cached = self._textures.get(key)
+        if cached is not None:
+            self._textures.move_to_end(key)
+            return cached
+        if key in self._failed:
+            return None
+        future = self._pending.pop(key, None)
+        try:
+            surface = future.result() if future is not None else _decode(*key)
+        except OSError as error:
+            self._failed.add(key)
+            Messenger.warning(str(error))
+            return None
+        return self._upload(key, surface)
+
+    def is_pending(self, path: str, width: int = 0, height: int = 0) -> bool:
+        return (path, int(width), int(height)) in self._pending
+
+    def _can_upload(self) -> bool:
+        frame = self._window.frame_counter
+        if frame != self._upload_frame:
+            self._upload_frame = frame
+            self._uploads = 0
+        if self._uploads >= self.max_uploads_per_frame:
+            return False
+        self._uploads += 1
+        return True
+
+    def _upload(self, key: texture_key, surface: sdl2.SDL_Surface) -> tuple[sdl2.SDL_Texture, int, int] | None:
+        width, height = surface.contents.w, surface.contents.h
+        # on the worker thread of a pipelined window the texture is created on the main thread before the frame is shown
+        pipeline = current_pipeline()
+        texture = pipeline.defer_texture(surface, self._create_texture) if pipeline is not None else self._create_texture(surface)
+        if not texture:
+            self._failed.add(key)
+            Messenger.warning(f"failed to create a texture for image '{key[0]}'")
+            return None
+
+        self._textures[key] = (texture, width, height)
+        self._bytes += width * height * 4
+        self._evict()
+        return self._textures[key]
+
+    def _create_texture(self, surface: sdl2.SDL_Surface) -> sdl2.SDL_Texture | None:
+        texture = sdl2.SDL_CreateTextureFromSurface(self._window._renderer.sdlrenderer, surface)
+        sdl2.SDL_FreeSurface(surface)
+        if not texture:
+            return None
+        self._window.resources.track(texture, resourceType.texture, self)
+        self._window.stats.texture_uploads += 1
+        return texture
+
+    def _evict(self) -> None:
+        # the newest texture is never evicted, even when it is larger than the budget on its own
+        while self._bytes > self.max_bytes and len(self._textures) > 1:
+            _, (texture, width, height) = self._textures.popitem(last=False)
+            self._destroy(texture, width, height)
+
+    def _destroy(self, texture: sdl2.SDL_Texture | DeferredTexture, width: int, height: int) -> None:
+        if isinstance(texture, DeferredTexture):
+            texture.cancel(self._window.resources)
+        else:
+            self._window.resources.release(texture)
+        self._bytes -= width * height * 4
+
+    def remove(self, path: str, width: int = 0, height: int = 0) -> None:
+        key = (path, int(width), int(height))
+        self._failed.discard(key)
+        cached = self._textures.pop(key, None)
+        if cached is not None:
+            self._destroy(*cached)
+
+    def clear(self) -> None:
+        """
+        destroy all textures, the results of decodes that are still running are dropped
+        """
+        for texture, width, height in self._textures.values():
+            self._destroy(texture, width, height)
+        self._textures.clear()
+        for future in self._pending.values():
+            if not future.cancel():
+                future.add_done_callback(_free_result)
+        self._pending.clear()
+        self._failed.clear()
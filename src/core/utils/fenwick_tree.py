@@ -0,0 +1,71 @@
+from typing import Iterable
+import numpy as np
+
+
+class FenwickTree:
+    """
+    Prefix sums over a list of numbers (a binary indexed tree).\n
+    Changing a value, the sum of the first n values and finding the value that contains a running total all take O(log n),
+    used to turn a scroll offset into a row index when every row can have its own height.
+    """
+
+    def __init__(self, values: Iterable[float] = ()) -> None:
+        values = np.asarray(list(values) if not isinstance(values, np.ndarray) else values)
+        self._values: list = values.tolist()
+        # node i (1 based) holds the sum of the values (i - lowbit(i), i], built from the prefix sums in O(n)
+        prefix = np.concatenate(([0], np.cumsum(values))) if len(values) else np.zeros(1)
+        nodes = np.arange(1, len(values) + 1)
+        self._tree: list = [0] + (prefix[nodes] - prefix[nodes - (nodes & -nodes)]).tolist()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, index: int) -> float:
+        return self._values[index]
+
+    def append(self, value: float) -> None:
+        node = len(self._tree)
+        lowbit = node & -node
+        # the new node covers the new value and the lowbit - 1 values before it
+        self._tree.append(value + self.prefix_sum(node - 1) - self.prefix_sum(node - lowbit))
+        self._values.append(value)
+
+    def set(self, index: int, value: float) -> None:
+        delta = value - self._values[index]
+        self._values[index] = value
+        node = index + 1
+        tree = self._tree
+        while node < len(tree):
+            tree[node] += delta
+            node += node & -node
+
+    def prefix_sum(self, count: int) -> float:
+        """
+        the sum of the first 'count' values
+        """
+        total = 0
+        tree = self._tree
+        while count > 0:
+            total += tree[count]
+            count -= count & -count
+        return total
+
+    def total(self) -> float:
+        return self.prefix_sum(len(self._values))
+
+    def find(self, position: float) -> int:
+        """
+        the index of the value that contains the running total 'position',
+        so prefix_sum(index) <= position < prefix_sum(index + 1), clamped to the valid indices
+        """
+        tree = self._tree
+        size = len(tree) - 1
+        node = 0
+        step = 1 << size.bit_length()
+        while step:
+            next_node = node + step
+            if next_node <= size and tree[next_node] <= position:
+                node = next_node
+                position -= tree[next_node]
+            step >>= 1
+        return min(node, max(size - 1, 0))
@@ -0,0 +1,42 @@
+class FrameStats:
+    """
+    Render counters of a window, reset every frame.\n
+    The counters of the last finished frame can be read from 'last'
+    """
+
+    def __init__(self) -> None:
+        self.frame: int = 0
+        self.live_textures: int = 0  # not reset every frame
+        self._reset()
+        self.last: dict[str, int] = self.as_dict()
+
+    def _reset(self) -> None:
+        self.draw_calls: int = 0
+        self.vertices: int = 0
+        self.texture_uploads: int = 0
+        self.geometry_cache_hits: int = 0
+        self.geometry_cache_misses: int = 0
+        self.text_cache_hits: int = 0
+        self.text_cache_misses: int = 0
+        self.culled_widgets: int = 0
+
+    def new_frame(self) -> None:
+        """
+        store the counters of the current frame in 'last' and start counting a new frame
+        """
+        self.last = self.as_dict()
+        self.frame += 1
+        self._reset()
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "draw_calls": self.draw_calls,
+            "vertices": self.vertices,
+            "texture_uploads": self.texture_uploads,
+            "geometry_cache_hits": self.geometry_cache_hits,
+            "geometry_cache_misses": self.geometry_cache_misses,
+            "text_cache_hits": self.text_cache_hits,
+            "text_cache_misses": self.text_cache_misses,
+            "culled_widgets": self.culled_widgets,
+            "live_textures": self.live_textures,
+        }
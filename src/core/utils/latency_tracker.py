@@ -0,0 +1,68 @@
+from time import perf_counter
+import numpy as np
+import sdl2
+
+
+class LatencyTracker:
+    """
+    Measures the time from an input event until the first present after it was handled.\n
+    The start is the SDL timestamp of the event (when SDL received it) and the end is the moment SDL_RenderPresent returns,
+    the time the display needs to show the frame is not included.
+    The latencies of the last 'capacity' input events are kept.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self._capacity = capacity
+        self._latencies = np.zeros(capacity, dtype=np.float64)
+        self._written = 0
+        self._pending: list[float] = []  # perf_counter times of the handled input events that weren't presented yet
+
+    def add_inputs(self, sdl_timestamps: list[int]) -> None:
+        """
+        register handled input events by their SDL timestamp in milliseconds
+        """
+        if not sdl_timestamps:
+            return
+        # convert the SDL ticks to the perf_counter clock
+        now = perf_counter()
+        ticks = sdl2.SDL_GetTicks()
+        self._pending.extend(now - max(ticks - timestamp, 0) / 1000 for timestamp in sdl_timestamps)
+
+    def presented(self, present_time: float) -> None:
+        """
+        resolve the pending input events with the time of the present that shows their result
+        """
+        if not self._pending:
+            return
+        latencies = present_time - np.array(self._pending[-self._capacity:])
+        self._pending = []
+        indices = np.arange(self._written, self._written + len(latencies)) % self._capacity
+        self._latencies[indices] = latencies
+        self._written += len(latencies)
+
+    def clear(self) -> None:
+        self._written = 0
+        self._pending = []
+
+    def latencies(self) -> np.ndarray:
+        """
+        the recorded latencies in seconds, oldest first
+        """
+        if self._written <= self._capacity:
+            return self._latencies[:self._written].copy()
+        return np.roll(self._latencies, -(self._written % self._capacity))
+
+    def summary(self) -> dict[str, float]:
+        """
+        count, mean, median, 95th and 99th percentile and max latency in seconds
+        """
+        latencies = self.latencies()
+        if len(latencies) == 0:
+            return {"count": 0}
+        p50, p95, p99 = np.percentile(latencies, (50, 95, 99))
+        return {"count": len(latencies),
+                "mean": float(latencies.mean()),
+                "p50": float(p50),
+                "p95": float(p95),
+                "p99": float(p99),
+                "max": float(latencies.max())}
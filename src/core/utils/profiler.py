@@ -0,0 +1,292 @@
+import json
+import os
+import threading
+from functools import wraps
+from itertools import count
+from time import perf_counter
+from typing import Any, Callable
+import numpy as np
+
+
+class _NullSpan:
+    """
+    span returned while profiling is disabled, does nothing
+    """
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("_profiler", "_name_id", "_start")
+
+    def __init__(self, profiler: 'Profiler', name_id: int) -> None:
+        self._profiler = profiler
+        self._name_id = name_id
+        self._start = 0.0
+
+    def __enter__(self) -> '_Span':
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._profiler._record(self._name_id, self._start, perf_counter())
+
+
+class Profiler:
+    """
+    A low overhead profiler that records nested time spans into a preallocated ring buffer.\n
+    Spans can be recorded with a context manager or a decorator and exported as Chrome Trace Event JSON
+    (open the file in chrome://tracing or https://ui.perfetto.dev).\n
+    When enabled, the frame phases of plang (event polling, widget cycles, tessellation, text rasterization,
+    SDL_RenderGeometry and SDL_RenderPresent) are instrumented automatically.
+    When disabled, the instrumentation is removed again so it costs nothing.
+    ```
+    profiler.enable()
+    with profiler.span("physics"):
+        world.step()
+    profiler.export_chrome_trace("trace.json")
+    ```
+    """
+
+    def __init__(self, capacity: int = 65536) -> None:
+        self._enabled = False
+        self._capacity = capacity
+        self._name_ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self._allocate(capacity)
+        self._patched: list[tuple[Any, str, Any]] = []
+        self._time_origin = perf_counter()
+
+    def _allocate(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._span_names = np.zeros(capacity, dtype=np.int32)
+        self._starts = np.zeros(capacity, dtype=np.float64)
+        self._ends = np.zeros(capacity, dtype=np.float64)
+        self._thread_ids = np.zeros(capacity, dtype=np.uint64)
+        self._counter = count()
+        self._written_by_thread: dict[int, int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def enable(self, instrument: bool = True, capacity: int | None = None) -> None:
+        """
+        start recording spans\n
+        :param instrument: automatically instrument the window, draw and text internals
+        :param capacity: resize the ring buffer, the oldest spans are overwritten when it is full
+        """
+        if capacity is not None and capacity != self._capacity:
+            self._allocate(capacity)
+        if instrument and not self._patched:
+            self._instrument_plang()
+        self._enabled = True
+
+    def disable(self) -> None:
+        """
+        stop recording spans and remove all automatic instrumentation\n
+        recorded spans are kept until 'clear' is called
+        """
+        self._enabled = False
+        self.uninstrument()
+
+    def clear(self) -> None:
+        """
+        remove all recorded spans
+        """
+        self._counter = count()
+        self._written_by_thread = {}
+
+    def _intern(self, name: str) -> int:
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = len(self._names)
+            self._name_ids[name] = name_id
+            self._names.append(name)
+        return name_id
+
+    def _record(self, name_id: int, start: float, end: float) -> None:
+        # next() on itertools.count is atomic, so spans from multiple threads don't overwrite each other
+        written = next(self._counter)
+        index = written % self._capacity
+        self._span_names[index] = name_id
+        self._starts[index] = start
+        self._ends[index] = end
+        thread_id = threading.get_ident()
+        self._thread_ids[index] = thread_id
+        # a thread only raises its own count, one shared count could be set back by a thread that recorded an older span
+        self._written_by_thread[thread_id] = written + 1
+
+    def _written(self) -> int:
+        """
+        the amount of spans recorded since the last clear
+        """
+        return max(list(self._written_by_thread.values()), default=0)
+
+    ##############
+    # recording #
+    ##############
+    def span(self, name: str) -> _Span | _NullSpan:
+        """
+        time a block of code
+        ```
+        with profiler.span("load level"):
+            ...
+        ```
+        """
+        if not self._enabled:
+            return _NULL_SPAN
+        return _Span(self, self._intern(name))
+
+    def profile(self, name: str | None = None) -> Callable[[Callable], Callable]:
+        """
+        decorator to time every call of a function, the function name is used when no name is given
+        ```
+        @profiler.profile()
+        def update(): ...
+        ```
+        """
+        def decorator(func: Callable) -> Callable:
+            name_id = self._intern(name or func.__qualname__)
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self._enabled:
+                    return func(*args, **kwargs)
+                start = perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self._record(name_id, start, perf_counter())
+            return wrapper
+        return decorator
+
+    ###################
+    # instrumentation #
+    ###################
+    def instrument(self, owner: Any, attribute: str, name: str | None = None) -> None:
+        """
+        wrap a method or function of a class or module with a span until 'uninstrument' is called\n
+        :param owner: the class or module that holds the function
+        :param attribute: the name of the function
+        :param name: the span name, defaults to 'Owner.attribute'
+        """
+        original = owner.__dict__[attribute] if isinstance(owner, type) else getattr(owner, attribute)
+        name_id = self._intern(name or f"{getattr(owner, '__name__', owner)}.{attribute}")
+        record = self._record
+
+        @wraps(original)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                record(name_id, start, perf_counter())
+
+        setattr(owner, attribute, wrapper)
+        self._patched.append((owner, attribute, original))
+
+    def uninstrument(self) -> None:
+        """
+        restore all instrumented functions
+        """
+        for owner, attribute, original in reversed(self._patched):
+            setattr(owner, attribute, original)
+        self._patched = []
+
+    def _instrument_plang(self) -> None:
+        from ..window.window import Window
+        from ..window.event import Event
+        from ..window.draw import Draw
+        from ..handler.clock import Clock
+        from ..handler.animator import Animator
+        from ...widget.core.text import Text
+        from ...widget.static.list_view import ListView
+
+        self.instrument(Window, "event_handler", "frame")
+        self.instrument(Window, "_present", "SDL_RenderPresent")
+        self.instrument(Window, "_cycle_widgets", "widget cycles")
+        self.instrument(Window, "update_layout", "layout")
+        self.instrument(Animator, "update", "animations")
+        self.instrument(Event, "handle", "event polling")
+        self.instrument(Clock, "sleep", "clock sleep")
+
+        for method in ("rectangle", "rectangles", "sprites", "quads", "circle", "circle_with_border", "polygon", "polygon_with_border", "line", "triangle", "triangle_with_border"):
+            self.instrument(Draw, method, f"Draw.{method}")
+        for method in ("_generate_rectangle_vertices", "_generate_rounded_rectangle_vertices", "_generate_circle_vertices",
+                       "_generate_ring_vertices", "_generate_polygon_indices", "_generate_polygon_border"):
+            self.instrument(Draw, method, f"tessellation {method.removeprefix('_generate_')}")
+        self.instrument(Draw, "_render_geometry", "SDL_RenderGeometry")
+
+        self.instrument(Text, "_render_single_line_text", "text rasterization")
+        self.instrument(Text, "_render_multiline_text", "text rasterization multiline")
+        self.instrument(Text, "draw", "Text.draw")
+        self.instrument(Text, "draw_in_rect", "Text.draw_in_rect")
+        self.instrument(ListView, "draw", "ListView.draw")
+
+    ###########
+    # results #
+    ###########
+    def _recorded_slice(self) -> np.ndarray:
+        """
+        indices of the recorded spans, oldest first
+        """
+        written = self._written()
+        if written <= self._capacity:
+            return np.arange(written)
+        start = written % self._capacity
+        return np.concatenate((np.arange(start, self._capacity), np.arange(0, start)))
+
+    def spans(self) -> list[tuple[str, float, float]]:
+        """
+        all recorded spans as (name, start, duration) in seconds, oldest first
+        """
+        order = self._recorded_slice()
+        return [(self._names[name_id], start, end - start)
+                for name_id, start, end in zip(self._span_names[order], self._starts[order], self._ends[order])]
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """
+        total, mean and max duration (in seconds) and the call count per span name
+        """
+        order = self._recorded_slice()
+        if len(order) == 0:
+            return {}
+        name_ids = self._span_names[order]
+        durations = self._ends[order] - self._starts[order]
+        counts = np.bincount(name_ids, minlength=len(self._names))
+        totals = np.bincount(name_ids, weights=durations, minlength=len(self._names))
+        maxima = np.zeros(len(self._names))
+        np.maximum.at(maxima, name_ids, durations)
+
+        return {self._names[name_id]: {"count": int(counts[name_id]),
+                                       "total": float(totals[name_id]),
+                                       "mean": float(totals[name_id] / counts[name_id]),
+                                       "max": float(maxima[name_id])}
+                for name_id in np.nonzero(counts)[0]}
+
+    def export_chrome_trace(self, path: str) -> None:
+        """
+        write the recorded spans as Chrome Trace Event JSON
+        """
+        order = self._recorded_slice()
+        pid = os.getpid()
+        starts = (self._starts[order] - self._time_origin) * 1e6
+        durations = (self._ends[order] - self._starts[order]) * 1e6
+        events = [{"name": self._names[name_id], "cat": "plang", "ph": "X", "ts": round(float(start), 3),
+                   "dur": round(float(duration), 3), "pid": pid, "tid": int(thread_id)}
+                  for name_id, start, duration, thread_id in zip(self._span_names[order], starts, durations, self._thread_ids[order])]
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+
+
+profiler = Profiler()
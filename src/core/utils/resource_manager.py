@@ -0,0 +1,216 @@
+import threading
+import traceback
+import sdl2
+import sdl2.sdlttf as sdlttf
+from ctypes import addressof
+from typing import TYPE_CHECKING, Any, Callable
+from ...enum import resourceType, mouseCursor
+from ...messenger import Messenger
+from ... import data
+
+if TYPE_CHECKING:
+    from .frame_stats import FrameStats
+
+_DESTROY = {
+    resourceType.texture: sdl2.SDL_DestroyTexture,
+    resourceType.surface: sdl2.SDL_FreeSurface,
+    resourceType.font: sdlttf.TTF_CloseFont,
+    resourceType.cursor: sdl2.SDL_FreeCursor,
+}
+
+# the cached system cursors are owned by this key, they live until the manager releases everything
+_SYSTEM_CURSORS = "system cursors"
+
+# the fields of a tracked resource
+_RESOURCE, _KIND, _OWNER, _STACK = range(4)
+
+
+def _owner_key(owner: Any) -> Any:
+    return None if owner is None else id(owner)
+
+
+class ResourceManager:
+    """
+    Owns the native SDL resources (textures, surfaces, fonts and cursors) so they are freed exactly once.\n
+    Resources are tracked with the object that owns them, a widget releases everything it owns when it is destroyed and
+    the window releases everything that is left when it is closed. The live resources can be counted per kind, in debug
+    mode the stack trace of where every resource was created is kept as well, so leaks can be traced back.
+    ```
+    texture = window.resources.track(sdl2.SDL_CreateTextureFromSurface(renderer, surface), resourceType.texture, self)
+    ...
+    window.resources.release_owner(self)
+    ```
+    Every window has its own manager in 'window.resources', fonts are shared by all windows and are tracked in 'shared_resources'.
+    """
+
+    def __init__(self, stats: 'FrameStats | None' = None) -> None:
+        self._stats = stats
+        self._resources: dict[int, list] = {}  # address -> [resource, kind, owner key, creation stack]
+        self._owned: dict[Any, set[int]] = {}  # owner key -> addresses
+        self._system_cursors: dict[mouseCursor, sdl2.SDL_Cursor] = {}
+        # a pipelined window tracks and frees resources on two threads
+        self._lock = threading.Lock()
+        self._deferred: list[tuple[Callable, Any]] | None = None  # frees that wait for the main thread
+
+    def __len__(self) -> int:
+        return len(self._resources)
+
+    def __contains__(self, resource: Any) -> bool:
+        return bool(resource) and addressof(resource.contents) in self._resources
+
+    ############
+    # tracking #
+    ############
+    def track(self, resource: Any, kind: resourceType, owner: Any = None) -> Any:
+        """
+        take ownership of a resource, it is returned so creating and tracking can be one expression\n
+        :param owner: the object the resource belongs to, its resources are released with 'release_owner'
+        """
+        if not resource:
+            return resource
+        address = addressof(resource.contents)
+        stack = traceback.format_stack(limit=12)[:-1] if data.debugging else None
+        owner = _owner_key(owner)
+        with self._lock:
+            if address in self._resources:
+                Messenger.fatalError(ValueError(f"the {kind.name} at {address:#x} is already tracked"))
+            self._resources[address] = [resource, kind, owner, stack]
+            self._owned.setdefault(owner, set()).add(address)
+            if kind == resourceType.texture and self._stats is not None:
+                self._stats.live_textures += 1
+        return resource
+
+    def release(self, resource: Any) -> bool:
+        """
+        free a tracked resource, returns False when it isn't tracked (anymore)
+        """
+        if not resource:
+            return False
+        address = addressof(resource.contents)
+        with self._lock:
+            if address not in self._resources:
+                return False
+            self._free(address)
+        return True
+
+    def release_owner(self, owner: Any) -> int:
+        """
+        free every resource of an owner, returns the amount that was freed
+        """
+        with self._lock:
+            addresses = self._owned.get(_owner_key(owner))
+            if not addresses:
+                return 0
+            count = len(addresses)
+            for address in list(addresses):
+                self._free(address)
+        return count
+
+    def release_all(self) -> int:
+        """
+        free every tracked resource, returns the amount that was freed
+        """
+        with self._lock:
+            count = len(self._resources)
+            for address in list(self._resources):
+                self._free(address)
+            self._system_cursors.clear()
+        return count
+
+    def _free(self, address: int) -> None:
+        """
+        forget a resource and destroy it, or queue the destroy while deferring, the lock is held by the caller
+        """
+        resource, kind, owner, _ = self._resources.pop(address)
+        owned = self._owned[owner]
+        owned.discard(address)
+        if not owned:
+            del self._owned[owner]
+        if kind == resourceType.cursor and owner == _SYSTEM_CURSORS:
+            self._system_cursors = {cursor_type: cursor for cursor_type, cursor in self._system_cursors.items()
+                                    if addressof(cursor.contents) != address}
+        if self._deferred is not None:
+            self._deferred.append((_DESTROY[kind], resource))
+        else:
+            _DESTROY[kind](resource)
+        if kind == resourceType.texture and self._stats is not None:
+            self._stats.live_textures -= 1
+
+    def _start_deferring(self) -> None:
+        """
+        queue the destroys from now on, the resources can still be in use by a frame that is being submitted
+        """
+        with self._lock:
+            if self._deferred is None:
+                self._deferred = []
+
+    def _take_deferred(self) -> tuple[tuple[Callable, Any], ...]:
+        """
+        the (destroy function, resource) pairs queued since the last call
+        """
+        with self._lock:
+            if not self._deferred:
+                return ()
+            deferred, self._deferred = tuple(self._deferred), []
+        return deferred
+
+    def _stop_deferring(self) -> tuple[tuple[Callable, Any], ...]:
+        """
+        stop queueing, the destroys that are still queued are returned
+        """
+        deferred = self._take_deferred()
+        with self._lock:
+            self._deferred = None
+        return deferred
+
+    ###########
+    # cursors #
+    ###########
+    def system_cursor(self, cursor_type: mouseCursor) -> sdl2.SDL_Cursor | None:
+        """
+        a system cursor, every cursor type is created once and reused, None when SDL can't create it
+        """
+        cursor = self._system_cursors.get(cursor_type)
+        if cursor is None:
+            cursor = sdl2.SDL_CreateSystemCursor(cursor_type.value)
+            if not cursor:
+                return None
+            self._system_cursors[cursor_type] = self.track(cursor, resourceType.cursor, _SYSTEM_CURSORS)
+        return cursor
+
+    #############
+    # reporting #
+    #############
+    def get_live_counts(self) -> dict[str, int]:
+        """
+        the amount of live resources per kind
+        """
+        counts = {kind.name: 0 for kind in resourceType}
+        with self._lock:
+            entries = list(self._resources.values())
+        for entry in entries:
+            counts[entry[_KIND].name] += 1
+        return counts
+
+    def get_owned_count(self, owner: Any) -> int:
+        return len(self._owned.get(_owner_key(owner), ()))
+
+    def report(self, limit: int = 10) -> str:
+        """
+        the live resource counts, in debug mode followed by the 'limit' creation stack traces that made the most live resources
+        """
+        lines = ["live resources: " + ", ".join(f"{count} {kind}" for kind, count in self.get_live_counts().items())]
+        stacks: dict[tuple[str, str], int] = {}
+        with self._lock:
+            entries = list(self._resources.values())
+        for entry in entries:
+            if entry[_STACK] is not None:
+                key = (entry[_KIND].name, "".join(entry[_STACK]))
+                stacks[key] = stacks.get(key, 0) + 1
+        for (kind, stack), count in sorted(stacks.items(), key=lambda item: item[1], reverse=True)[:limit]:
+            lines.append(f"{count} {kind} created at:\n{stack.rstrip()}")
+        return "\n".join(lines)
+
+
+# fonts are not bound to a renderer, so all windows share them
+shared_resources = ResourceManager()
@@ -0,0 +1,85 @@
+class SkylinePacker:
+    """
+    Packs rects into a fixed size area with the skyline bottom-left heuristic.\n
+    The top edge of the packed rects is kept as a list of horizontal segments (the skyline), a new rect is placed
+    on the segment where its top ends lowest, ties are broken by the narrowest fit. Fast and dense enough for
+    sprites and icons that are added one by one at runtime.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self._skyline: list[list[int]] = [[0, 0, width]]  # x, y, width of every segment, from left to right
+        self._used_area = 0
+
+    def occupancy(self) -> float:
+        """
+        the share of the area that is covered by packed rects
+        """
+        return self._used_area / (self.width * self.height)
+
+    def _fit(self, index: int, width: int, height: int) -> int:
+        """
+        the y a rect would get when its left edge is at segment 'index', -1 when it doesn't fit there
+        """
+        x = self._skyline[index][0]
+        if x + width > self.width:
+            return -1
+        y = 0
+        remaining = width
+        while remaining > 0:
+            _, segment_y, segment_width = self._skyline[index]
+            y = max(y, segment_y)
+            if y + height > self.height:
+                return -1
+            remaining -= segment_width
+            index += 1
+        return y
+
+    def insert(self, width: int, height: int) -> tuple[int, int] | None:
+        """
+        pack a rect, returns its position or None when there is no room left
+        """
+        if width <= 0 or height <= 0:
+            return None
+        best = None  # top, waste width, index, y
+        for index in range(len(self._skyline)):
+            y = self._fit(index, width, height)
+            if y == -1:
+                continue
+            candidate = (y + height, self._skyline[index][2], index, y)
+            if best is None or candidate < best:
+                best = candidate
+        if best is None:
+            return None
+        _, _, index, y = best
+        x = self._skyline[index][0]
+        self._add_segment(index, x, y + height, width)
+        self._used_area += width * height
+        return x, y
+
+    def _add_segment(self, index: int, x: int, y: int, width: int) -> None:
+        skyline = self._skyline
+        skyline.insert(index, [x, y, width])
+        # cut the segments that are now below the new one
+        right = x + width
+        next_index = index + 1
+        while next_index < len(skyline):
+            segment = skyline[next_index]
+            if segment[0] >= right:
+                break
+            overlap = right - segment[0]
+            if overlap >= segment[2]:
+                del skyline[next_index]
+                continue
+            segment[0] += overlap
+            segment[2] -= overlap
+            break
+        # merge neighbours at the same height
+        i = 0
+        while i < len(skyline) - 1:
+            if skyline[i][1] == skyline[i + 1][1]:
+                skyline[i][2] += skyline[i + 1][2]
+                del skyline[i + 1]
+            else:
+                i += 1
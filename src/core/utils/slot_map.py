@@ -0,0 +1,94 @@
+from typing import Any, Iterator
+from ..handler.OID import handle_index
+
+
+class SlotMap:
+    """
+    A dict-like container keyed by OID handles.\n
+    Values are stored densely so iterating over them is a plain list iteration, the slot index of a handle points
+    to the position of its value. Removing swaps the last value into the gap, so the iteration order is not kept.
+    Handles of an older generation than the stored one are treated as missing.
+    """
+
+    def __init__(self) -> None:
+        self._positions: list[int] = []  # slot index -> position in the dense lists, -1 when empty
+        self._keys: list[int] = []
+        self._values: list[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._keys)
+
+    def _position(self, handle: int) -> int:
+        index = handle_index(handle)
+        if index >= len(self._positions):
+            return -1
+        position = self._positions[index]
+        if position == -1 or self._keys[position] != handle:
+            return -1
+        return position
+
+    def __contains__(self, handle: int) -> bool:
+        return self._position(handle) != -1
+
+    def __getitem__(self, handle: int) -> Any:
+        position = self._position(handle)
+        if position == -1:
+            raise KeyError(handle)
+        return self._values[position]
+
+    def __setitem__(self, handle: int, value: Any) -> None:
+        position = self._position(handle)
+        if position != -1:
+            self._values[position] = value
+            return
+        index = handle_index(handle)
+        if index >= len(self._positions):
+            self._positions.extend([-1] * (index + 1 - len(self._positions)))
+        self._positions[index] = len(self._values)
+        self._keys.append(handle)
+        self._values.append(value)
+
+    def __delitem__(self, handle: int) -> None:
+        position = self._position(handle)
+        if position == -1:
+            raise KeyError(handle)
+        self._remove_at(position)
+
+    def _remove_at(self, position: int) -> Any:
+        value = self._values[position]
+        self._positions[handle_index(self._keys[position])] = -1
+        last_key = self._keys.pop()
+        last_value = self._values.pop()
+        if position < len(self._keys):
+            # move the last value into the gap
+            self._keys[position] = last_key
+            self._values[position] = last_value
+            self._positions[handle_index(last_key)] = position
+        return value
+
+    def get(self, handle: int, default: Any = None) -> Any:
+        position = self._position(handle)
+        return default if position == -1 else self._values[position]
+
+    def pop(self, handle: int, *default: Any) -> Any:
+        position = self._position(handle)
+        if position == -1:
+            if default:
+                return default[0]
+            raise KeyError(handle)
+        return self._remove_at(position)
+
+    def keys(self) -> list[int]:
+        return self._keys
+
+    def values(self) -> list[Any]:
+        """
+        the stored values, don't modify the returned list
+        """
+        return self._values
+
+    def items(self) -> Iterator[tuple[int, Any]]:
+        return zip(self._keys, self._values)
@@ -0,0 +1,105 @@
+from typing import Any, Hashable
+from ...typedef import screen_unit
+
+
+class SpatialGrid:
+    """
+    A uniform grid over rects to quickly find the rects at a point or in an area.\n
+    Every item is stored in all cells its rect overlaps, updating an item only touches the cells it left or entered.
+    """
+
+    def __init__(self, cell_size: int = 64) -> None:
+        if cell_size <= 0:
+            raise ValueError("the cell size of a spatial grid must be a positive number")
+        self.cell_size = cell_size
+        self._cells: dict[tuple[int, int], set[Hashable]] = {}
+        # item -> (x1, y1, x2, y2), (first column, first row, last column, last row)
+        self._items: dict[Hashable, tuple[tuple[screen_unit, screen_unit, screen_unit, screen_unit], tuple[int, int, int, int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._items
+
+    def _cell_range(self, x1: screen_unit, y1: screen_unit, x2: screen_unit, y2: screen_unit) -> tuple[int, int, int, int]:
+        size = self.cell_size
+        return int(x1 // size), int(y1 // size), int(x2 // size), int(y2 // size)
+
+    @staticmethod
+    def _bounds(x: screen_unit, y: screen_unit, w: screen_unit, h: screen_unit) -> tuple[screen_unit, screen_unit, screen_unit, screen_unit]:
+        return min(x, x + w), min(y, y + h), max(x, x + w), max(y, y + h)
+
+    def _add_to_cells(self, item: Hashable, cell_range: tuple[int, int, int, int]) -> None:
+        first_column, first_row, last_column, last_row = cell_range
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                cell = self._cells.get((column, row))
+                if cell is None:
+                    cell = self._cells[(column, row)] = set()
+                cell.add(item)
+
+    def _remove_from_cells(self, item: Hashable, cell_range: tuple[int, int, int, int]) -> None:
+        first_column, first_row, last_column, last_row = cell_range
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                cell = self._cells[(column, row)]
+                cell.discard(item)
+                if not cell:
+                    del self._cells[(column, row)]
+
+    def insert(self, item: Hashable, x: screen_unit, y: screen_unit, w: screen_unit, h: screen_unit) -> None:
+        if item in self._items:
+            self.update(item, x, y, w, h)
+            return
+        bounds = self._bounds(x, y, w, h)
+        cell_range = self._cell_range(*bounds)
+        self._items[item] = (bounds, cell_range)
+        self._add_to_cells(item, cell_range)
+
+    def update(self, item: Hashable, x: screen_unit, y: screen_unit, w: screen_unit, h: screen_unit) -> None:
+        """
+        move an item to a new rect, only the cells it left and entered are changed
+        """
+        bounds = self._bounds(x, y, w, h)
+        cell_range = self._cell_range(*bounds)
+        _, old_cell_range = self._items[item]
+        self._items[item] = (bounds, cell_range)
+        if cell_range != old_cell_range:
+            self._remove_from_cells(item, old_cell_range)
+            self._add_to_cells(item, cell_range)
+
+    def remove(self, item: Hashable) -> None:
+        _, cell_range = self._items.pop(item)
+        self._remove_from_cells(item, cell_range)
+
+    def query_point(self, x: screen_unit, y: screen_unit) -> list[Any]:
+        """
+        all items whose rect contains the point (edges included)
+        """
+        size = self.cell_size
+        cell = self._cells.get((int(x // size), int(y // size)))
+        if not cell:
+            return []
+        items = self._items
+        hits = []
+        for item in cell:
+            x1, y1, x2, y2 = items[item][0]
+            if x1 <= x <= x2 and y1 <= y <= y2:
+                hits.append(item)
+        return hits
+
+    def query_rect(self, x: screen_unit, y: screen_unit, w: screen_unit, h: screen_unit) -> set[Any]:
+        """
+        all items whose rect overlaps the given rect
+        """
+        qx1, qy1, qx2, qy2 = self._bounds(x, y, w, h)
+        first_column, first_row, last_column, last_row = self._cell_range(qx1, qy1, qx2, qy2)
+        hits = set()
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                for item in self._cells.get((column, row), ()):
+                    x1, y1, x2, y2 = self._items[item][0]
+                    if x1 <= qx2 and qx1 <= x2 and y1 <= qy2 and qy1 <= y2:
+                        hits.add(item)
+        return hits
@@ -0,0 +1,128 @@
+from bisect import bisect_left
+from typing import Iterable
+import numpy as np
+
+_NO_MATCHES = np.zeros(0, dtype=np.int32)
+
+
+def _trigram_keys(codepoints: np.ndarray) -> np.ndarray:
+    """
+    one int64 per trigram, unicode code points take at most 21 bits
+    """
+    return (codepoints[:-2] << 42) | (codepoints[1:-1] << 21) | codepoints[2:]
+
+
+def _codepoints(text: str) -> np.ndarray:
+    return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.int64)
+
+
+class TextIndex:
+    """
+    Case-insensitive search over a fixed list of labels.\n
+    Queries shorter than 3 characters match the start of a label and are answered with a binary search over the sorted labels.
+    Longer queries match anywhere in a label: the positions of the rarest trigram of the query are looked up in a trigram index
+    over all labels, then the positions where the rest of the query doesn't follow are dropped. Building and searching
+    is done with NumPy, results are label indices in label order.
+    """
+
+    def __init__(self, labels: Iterable[str]) -> None:
+        self._labels = [str(label).casefold() for label in labels]
+        order = sorted(range(len(self._labels)), key=self._labels.__getitem__)
+        self._sorted_labels = [self._labels[i] for i in order]
+        self._sorted_indices = np.array(order, dtype=np.int32)
+
+        # all labels in one array of code points, separated by 0 so no trigram spans two labels
+        codepoints = _codepoints("\0".join(self._labels) + "\0")
+        lengths = np.fromiter((len(label) + 1 for label in self._labels), dtype=np.int32, count=len(self._labels))
+        self._label_of = np.repeat(np.arange(len(lengths), dtype=np.int32), lengths)  # code point position -> label index
+        if len(codepoints) >= 3:
+            valid = (codepoints[:-2] != 0) & (codepoints[1:-1] != 0) & (codepoints[2:] != 0)
+            positions = np.flatnonzero(valid).astype(np.int32)
+            keys = _trigram_keys(codepoints)[valid]
+        else:
+            positions, keys = np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.int64)
+        # sorted on trigram and then on position, so the positions of every trigram are a sorted slice
+        order = np.lexsort((positions, keys))
+        self._positions = positions[order]
+        self._trigrams, trigram_starts = np.unique(keys[order], return_index=True)
+        self._trigram_starts = np.append(trigram_starts, len(self._positions))
+        self._codepoints = codepoints.astype(np.int32)
+
+        self._last_query: str | None = None
+        self._last_result = _NO_MATCHES
+        self._last_starts: np.ndarray | None = None  # code point positions where the last substring query starts
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def search(self, query: str) -> np.ndarray:
+        """
+        the indices of the labels that match the query, all indices for an empty query
+        """
+        query = query.casefold()
+        if not query:
+            return np.arange(len(self._labels), dtype=np.int32)
+        if query != self._last_query:
+            last_query, last_starts = self._last_query, self._last_starts
+            self._last_starts = None
+            if len(query) < 3:
+                self._last_result = self._prefix_search(query)
+            elif last_starts is not None and last_query is not None and query.startswith(last_query):
+                # typing another character only removes matches, so only the previous matches are checked
+                self._last_result = self._extend_search(query, last_query, last_starts)
+            else:
+                self._last_result = self._substring_search(query)
+            self._last_query = query
+        return self._last_result
+
+    def _prefix_search(self, prefix: str) -> np.ndarray:
+        start = bisect_left(self._sorted_labels, prefix)
+        # every label starting with the prefix sorts before the prefix followed by the highest character
+        end = bisect_left(self._sorted_labels, prefix + "\U0010ffff", start)
+        return np.sort(self._sorted_indices[start:end])
+
+    def _substring_search(self, query: str) -> np.ndarray:
+        query_codepoints = _codepoints(query)
+        keys = _trigram_keys(query_codepoints)
+        found = np.searchsorted(self._trigrams, keys)
+        if (found == len(self._trigrams)).any() or (self._trigrams[np.minimum(found, len(self._trigrams) - 1)] != keys).any():
+            return _NO_MATCHES
+        counts = self._trigram_starts[found + 1] - self._trigram_starts[found]
+        anchor = int(np.argmin(counts))
+        first = self._trigram_starts[found[anchor]]
+        starts = self._positions[first:first + counts[anchor]] - anchor
+        starts = starts[(starts >= 0) & (starts + len(query) <= len(self._codepoints))]
+        starts = self._matching_starts(query_codepoints, starts, range(anchor))
+        starts = self._matching_starts(query_codepoints, starts, range(anchor + 3, len(query)))
+        self._last_starts = starts
+        return self._labels_at(starts)
+
+    def _extend_search(self, query: str, last_query: str, last_starts: np.ndarray) -> np.ndarray:
+        """
+        search for a query that starts with the last query, only the matches of the last query are checked
+        """
+        starts = last_starts[last_starts + len(query) <= len(self._codepoints)]
+        starts = self._matching_starts(_codepoints(query), starts, range(len(last_query), len(query)))
+        self._last_starts = starts
+        return self._labels_at(starts)
+
+    def _matching_starts(self, query_codepoints: np.ndarray, starts: np.ndarray, offsets: range) -> np.ndarray:
+        """
+        the starts where the characters of the query at the offsets follow
+        """
+        codepoints = self._codepoints
+        for offset in offsets:
+            if len(starts) == 0:
+                break
+            starts = starts[codepoints[starts + offset] == query_codepoints[offset]]
+        return starts
+
+    def _labels_at(self, starts: np.ndarray) -> np.ndarray:
+        if len(starts) == 0:
+            return _NO_MATCHES
+        labels = self._label_of[starts]
+        # the starts are sorted, so a label that contains the query more than once is repeated next to itself
+        keep = np.empty(len(labels), dtype=bool)
+        keep[0] = True
+        np.not_equal(labels[1:], labels[:-1], out=keep[1:])
+        return labels[keep]
@@ -0,0 +1,160 @@
+import json
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Iterable
+from ...messenger import Messenger
+from ..window.frame_pipeline import FramePipeline, current_pipeline
+
+if TYPE_CHECKING:
+    from ..window.window import Window
+    from ...widget.core.widget import Widget
+    from .frame_stats import FrameStats
+
+# per widget statistics, one list per widget handle with these fields
+_NAME, _CYCLE_MEAN, _DRAW_MEAN, _CYCLE_MAX, _DRAW_MAX, _CYCLE_TOTAL, _DRAW_TOTAL, _CYCLES, _DRAWS, \
+    _DRAW_CALLS, _VERTICES, _RASTERIZATIONS, _TEXTURE_UPLOADS = range(13)
+_SORT_KEYS = ("mean", "max", "total", "draw_calls", "rasterizations")
+
+
+def _upload_count(stats: 'FrameStats', pipeline: FramePipeline | None) -> int:
+    # the worker of a pipelined window defers its textures to the main thread, they are counted when they are deferred
+    return stats.texture_uploads if pipeline is None else len(pipeline._uploads)
+
+
+class WidgetCosts:
+    """
+    Measures how much time every widget of a window costs, to find the widgets that make frames slow.\n
+    While enabled the '_cycle' and 'draw' of every widget are timed separately, together with the geometry submits (draw calls),
+    vertices, text rasterizations and texture uploads they cause. The results are kept per widget OID as a moving average
+    over about 'frames' calls, the maximum and the totals. Draws are timed in 'Window.draw_widgets', widgets that are drawn
+    in another way aren't measured and a widget that draws another widget is charged for both.
+    In a pipelined window the uploads are the textures a widget made, they are created on the main thread later.
+    When disabled nothing is measured, so it costs nothing.
+    ```
+    window.widget_costs.enable()
+    ...  # run some frames
+    print(window.widget_costs.table(10))
+    ```
+    """
+
+    def __init__(self, window: 'Window', frames: int = 60) -> None:
+        self._window = window
+        self._enabled = False
+        self._smoothing = 2 / (frames + 1)
+        self._stats: dict[int, list] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def enable(self) -> None:
+        self._enabled = True
+
+    def disable(self) -> None:
+        """
+        stop measuring, the results are kept until 'clear' is called
+        """
+        self._enabled = False
+
+    def clear(self) -> None:
+        self._stats = {}
+
+    #############
+    # measuring #
+    #############
+    def _cycle_widgets(self, widgets: Iterable['Widget']) -> None:
+        """
+        the widget cycle of the window while measuring
+        """
+        measure = self._measure
+        for widget in widgets:
+            measure(widget, True)
+
+    def _draw_widgets(self, widgets: Iterable['Widget']) -> None:
+        """
+        'Window.draw_widgets' while measuring
+        """
+        measure = self._measure
+        for widget in widgets:
+            measure(widget, False)
+
+    def _measure(self, widget: 'Widget', is_cycle: bool) -> None:
+        stats = self._window.stats
+        pipeline = current_pipeline()
+        draw_calls, vertices, rasterizations, uploads = stats.draw_calls, stats.vertices, stats.text_cache_misses, _upload_count(stats, pipeline)
+        start = perf_counter()
+        try:
+            if is_cycle:
+                widget._cycle()
+            else:
+                widget.draw()
+        finally:
+            elapsed = perf_counter() - start
+            self._add(widget, is_cycle, elapsed, stats.draw_calls - draw_calls, stats.vertices - vertices,
+                      stats.text_cache_misses - rasterizations, _upload_count(stats, pipeline) - uploads)
+
+    def _add(self, widget: 'Widget', is_cycle: bool, elapsed: float, draw_calls: int, vertices: int, rasterizations: int, uploads: int) -> None:
+        entry = self._stats.get(widget._handle)
+        if entry is None:
+            entry = self._stats[widget._handle] = [type(widget).__name__, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0, 0, 0, 0, 0, 0]
+        mean, peak, total, count = (_CYCLE_MEAN, _CYCLE_MAX, _CYCLE_TOTAL, _CYCLES) if is_cycle else (_DRAW_MEAN, _DRAW_MAX, _DRAW_TOTAL, _DRAWS)
+        # the first sample starts the average, so short runs aren't pulled towards 0
+        entry[mean] = elapsed if entry[count] == 0 else entry[mean] + (elapsed - entry[mean]) * self._smoothing
+        if elapsed > entry[peak]:
+            entry[peak] = elapsed
+        entry[total] += elapsed
+        entry[count] += 1
+        entry[_DRAW_CALLS] += draw_calls
+        entry[_VERTICES] += vertices
+        entry[_RASTERIZATIONS] += rasterizations
+        entry[_TEXTURE_UPLOADS] += uploads
+
+    ###########
+    # results #
+    ###########
+    def get(self, oid: int) -> dict[str, Any] | None:
+        """
+        the statistics of one widget by its OID, None when it wasn't measured, times are in seconds
+        """
+        entry = self._stats.get(oid)
+        return None if entry is None else self._row(oid, entry)
+
+    @staticmethod
+    def _row(oid: int, entry: list) -> dict[str, Any]:
+        return {"oid": oid, "widget": entry[_NAME],
+                "mean": entry[_CYCLE_MEAN] + entry[_DRAW_MEAN],
+                "cycle_mean": entry[_CYCLE_MEAN], "draw_mean": entry[_DRAW_MEAN],
+                "max": max(entry[_CYCLE_MAX], entry[_DRAW_MAX]),
+                "cycle_max": entry[_CYCLE_MAX], "draw_max": entry[_DRAW_MAX],
+                "total": entry[_CYCLE_TOTAL] + entry[_DRAW_TOTAL],
+                "cycles": entry[_CYCLES], "draws": entry[_DRAWS],
+                "draw_calls": entry[_DRAW_CALLS], "vertices": entry[_VERTICES],
+                "rasterizations": entry[_RASTERIZATIONS], "texture_uploads": entry[_TEXTURE_UPLOADS]}
+
+    def top(self, count: int = 10, sort_by: str = "mean") -> list[dict[str, Any]]:
+        """
+        the statistics of the most expensive widgets, most expensive first\n
+        :param sort_by: "mean", "max", "total", "draw_calls" or "rasterizations"
+        """
+        if sort_by not in _SORT_KEYS:
+            Messenger.fatalError(ValueError(f"widget costs can't be sorted by '{sort_by}', use one of {', '.join(_SORT_KEYS)}"))
+        rows = [self._row(oid, entry) for oid, entry in self._stats.items()]
+        rows.sort(key=lambda row: row[sort_by], reverse=True)
+        return rows[:count]
+
+    def table(self, count: int = 10, sort_by: str = "mean") -> str:
+        """
+        'top' as a text table, times in milliseconds
+        """
+        lines = [f"{'oid':>6} {'widget':<20} {'mean ms':>8} {'cycle':>8} {'draw':>8} {'max ms':>8} {'total ms':>9} {'calls':>6} {'raster':>6}"]
+        for row in self.top(count, sort_by):
+            lines.append(f"{row['oid']:>6} {row['widget'][:20]:<20} {row['mean'] * 1000:>8.3f} {row['cycle_mean'] * 1000:>8.3f} "
+                         f"{row['draw_mean'] * 1000:>8.3f} {row['max'] * 1000:>8.3f} {row['total'] * 1000:>9.2f} "
+                         f"{row['draw_calls']:>6} {row['rasterizations']:>6}")
+        return "\n".join(lines)
+
+    def dump(self, path: str, sort_by: str = "mean") -> None:
+        """
+        write the statistics of all measured widgets as JSON, most expensive first
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.top(len(self._stats), sort_by), file, indent=1)
@@ -1,16 +1,38 @@
 import sdl2
 import sdl2.ext
 import numpy as np
-from typing import Union, Annotated
-from ctypes import c_int
+from typing import TYPE_CHECKING, Sequence, Union, Annotated
+from ctypes import c_int, POINTER
 from ...typedef import RGBAvalue, RGBvalue, screen_unit
 from ...core.utils.coordinate import Coordinate
+from ...core.utils.frame_stats import FrameStats
+from .rect_array import RectArray
+from .gradient import Gradient
 from ...color import Color
 
+if TYPE_CHECKING:
+    from .texture_atlas import TextureAtlas
+    from .rect import Rect
+
+# memory layout of SDL_Vertex, so a vertex buffer can be passed to SDL without converting every vertex
+VERTEX_DTYPE = np.dtype([("position", np.float32, 2), ("color", np.uint8, 4), ("tex_coord", np.float32, 2)])
+# two triangles per quad, for quads with their corners in the order top-left, top-right, bottom-right, bottom-left
+QUAD_INDICES = np.array([0, 1, 2, 2, 3, 0], dtype=np.int32)
+# the kinds of recorded draw commands
+_GEOMETRY, _LINE, _COPY, _CLIP = range(4)
+
+
+def _resolve_texture(texture):
+    """
+    the SDL texture of a texture that is created when a recorded frame is submitted, other textures are returned as is
+    """
+    return texture() if callable(texture) else texture
+
 
 class Draw:
-    def __init__(self, window: sdl2.ext.Window, renderer: sdl2.ext.Renderer):
+    def __init__(self, window: sdl2.ext.Window, renderer: sdl2.ext.Renderer, stats: FrameStats | None = None):
         self._renderer = renderer
+        self._stats = stats if stats is not None else FrameStats()
         # Initialize caches for rounded rectangles, circles, and polygons
         self._rounded_rect_cache = {}
         self._circle_cache = {}
@@ -27,10 +49,13 @@ class Draw:
         self._vertex_buffer_size = 20000  # Adjust as needed
         self._index_buffer_size = 40000   # Adjust as needed
         self._vertex_buffer = np.zeros(
-            (self._vertex_buffer_size, 2), dtype=np.float32)
+            self._vertex_buffer_size, dtype=VERTEX_DTYPE)
         self._index_buffer = np.zeros(self._index_buffer_size, dtype=np.int32)
+        self._quad_index_cache = np.zeros(0, dtype=np.int32)
         # Store the viewport dimensions for frustum culling
         self._viewport_w, self._viewport_h = window.size
+        # the draw commands of a frame that is submitted later, None while drawing directly
+        self._commands: list[tuple] | None = None
 
     def _precalculate_angles(self):
         """Precompute sine and cosine values for angles."""
@@ -46,7 +71,7 @@ class Draw:
     # drawing a rectangle #
     #######################
     def rectangle(self, x: screen_unit, y: screen_unit, w: screen_unit, h: screen_unit,
-                  color: Union[RGBvalue, RGBAvalue] = (128, 128, 128, 255), radii: Union[screen_unit, Annotated[tuple[screen_unit], 4]] = (0, 0, 0, 0)):
+                  color: Union[RGBvalue, RGBAvalue, Gradient] = (128, 128, 128, 255), radii: Union[screen_unit, Annotated[tuple[screen_unit], 4]] = (0, 0, 0, 0)):
         """
         Draws a rectangle using hardware-accelerated graphics.\n
         Verticies will be cached after being generated for the first time to improve performance.\n
@@ -54,7 +79,7 @@ class Draw:
         :param y: The y-coordinate of the top-left corner of the rectangle.
         :param w: The width of the rectangle.
         :param h: The height of the rectangle.
-        :param color: The color of the rectangle in RGB/RGBA format.
+        :param color: The color of the rectangle in RGB/RGBA format, or a LinearGradient / RadialGradient.
         :param radii: The radii of the corners. Can either be a single screen_unit (same radii for all corners) or a tuple with 4 values (top-left, top-right, bottom-right, bottom-left). A single radius can be as big as the smallest side of the rectangle. 
         \n*! Using rounded corners comes at a slight performance decrease !*.
         """
@@ -73,11 +98,13 @@ class Draw:
             # Create a cache key based on size, radii, and angle_step
             key = (w, h, radii, angle_step)
             if key in self._rounded_rect_cache:
+                self._stats.geometry_cache_hits += 1
                 # Use cached vertices and indices
                 cached_vertices, indices = self._rounded_rect_cache[key]
                 # Adjust vertices based on x and y using NumPy
                 vertices = cached_vertices + np.array([x, y], dtype=np.float32)
             else:
+                self._stats.geometry_cache_misses += 1
                 vertices, indices = self._generate_rounded_rectangle_vertices(
                     0, 0, w, h, radii, angle_step)
                 # Cache the vertices and indices
@@ -88,14 +115,141 @@ class Draw:
 
             self._render_geometry(vertices, indices, color)
 
-    def circle(self, cx: screen_unit, cy: screen_unit, radius: screen_unit, color: Union[RGBvalue, RGBAvalue], segments: int = 30): 
+    def rectangles(self, rects: Union[RectArray, np.ndarray], color: Union[RGBvalue, RGBAvalue] = (128, 128, 128, 255), colors: np.ndarray | None = None):
+        """
+        Draws many rectangles with a single draw call.\n
+        :param rects: a RectArray or an (N, 4) array of x, y, w, h
+        :param color: The color of all rectangles in RGB/RGBA format.
+        :param colors: optional colors per rectangle, overrides color. An (N, 4) uint8 RGBA array, or any array 'Color.pack_array' takes.
+        """
+        data = rects.data if isinstance(rects, RectArray) else np.asarray(rects).reshape(-1, 4)
+        if colors is not None:
+            colors = Color.pack_array(colors)
+        x, y, w, h = data.T
+        visible = ~((x + w < 0) | (x > self._viewport_w) | (y + h < 0) | (y > self._viewport_h))
+        if not visible.all():
+            data = data[visible]
+            if colors is not None:
+                colors = colors[visible]
+        count = len(data)
+        if count == 0:
+            return
+
+        x, y, w, h = data.T.astype(np.float32)
+        vertices = np.empty((count, 4, 2), dtype=np.float32)
+        vertices[:, 0, 0] = vertices[:, 3, 0] = x
+        vertices[:, 1, 0] = vertices[:, 2, 0] = x + w
+        vertices[:, 0, 1] = vertices[:, 1, 1] = y
+        vertices[:, 2, 1] = vertices[:, 3, 1] = y + h
+        indices = (np.arange(count, dtype=np.int32)[:, None] * 4 + QUAD_INDICES).ravel()
+        if colors is not None:
+            colors = np.repeat(colors, 4, axis=0)
+        self._render_geometry(vertices.reshape(-1, 2), indices, color, colors)
+
+    def sprites(self, atlas: 'TextureAtlas', names: Sequence[str], rects: Union[RectArray, np.ndarray, Sequence[tuple]],
+                color: Union[RGBvalue, RGBAvalue] = (255, 255, 255, 255), colors: np.ndarray | None = None):
+        """
+        Draws images of a texture atlas, with a single draw call per atlas page.\n
+        :param names: the name of the image of every sprite
+        :param rects: a RectArray or an (N, 4) array of x, y, w, h, a sprite is stretched to its rect
+        :param color: multiplied with the colors of all sprites, white keeps the image colors.
+        :param colors: optional colors per sprite, overrides color. An (N, 4) uint8 RGBA array, or any array 'Color.pack_array' takes.
+        """
+        data = rects.data if isinstance(rects, RectArray) else np.asarray(rects).reshape(-1, 4)
+        if colors is not None:
+            colors = Color.pack_array(colors)
+        regions = np.array([atlas.get(name) for name in names], dtype=np.float32).reshape(-1, 5)
+        x, y, w, h = data.T
+        visible = ~((x + w < 0) | (x > self._viewport_w) | (y + h < 0) | (y > self._viewport_h))
+        if not visible.all():
+            data, regions = data[visible], regions[visible]
+            if colors is not None:
+                colors = colors[visible]
+        if len(data) == 0:
+            return
+
+        for page in np.unique(regions[:, 0]).astype(int):
+            on_page = regions[:, 0] == page
+            page_data, page_regions = data[on_page], regions[on_page]
+            count = len(page_data)
+            x, y, w, h = page_data.T.astype(np.float32)
+            vertices = np.empty((count, 4, 2), dtype=np.float32)
+            vertices[:, 0, 0] = vertices[:, 3, 0] = x
+            vertices[:, 1, 0] = vertices[:, 2, 0] = x + w
+            vertices[:, 0, 1] = vertices[:, 1, 1] = y
+            vertices[:, 2, 1] = vertices[:, 3, 1] = y + h
+
+            page_w, page_h = atlas.get_page_size(page)
+            u0, v0 = page_regions[:, 1] / page_w, page_regions[:, 2] / page_h
+            u1, v1 = u0 + page_regions[:, 3] / page_w, v0 + page_regions[:, 4] / page_h
+            tex_coords = np.empty((count, 4, 2), dtype=np.float32)
+            tex_coords[:, 0, 0] = tex_coords[:, 3, 0] = u0
+            tex_coords[:, 1, 0] = tex_coords[:, 2, 0] = u1
+            tex_coords[:, 0, 1] = tex_coords[:, 1, 1] = v0
+            tex_coords[:, 2, 1] = tex_coords[:, 3, 1] = v1
+
+            indices = (np.arange(count, dtype=np.int32)[:, None] * 4 + QUAD_INDICES).ravel()
+            page_colors = None if colors is None else np.repeat(colors[on_page], 4, axis=0)
+            self._render_geometry(vertices.reshape(-1, 2), indices, color, page_colors,
+                                  texture=atlas._frame_texture(page), tex_coords=tex_coords.reshape(-1, 2))
+
+    def sprite(self, atlas: 'TextureAtlas', name: str, x: screen_unit, y: screen_unit, width: screen_unit | None = None, height: screen_unit | None = None,
+               color: Union[RGBvalue, RGBAvalue] = (255, 255, 255, 255)):
+        """
+        Draws an image of a texture atlas, in the size of the image when no width and height are given.
+        Use 'sprites' to draw many sprites at once.
+        """
+        region = atlas.get(name)
+        self.sprites(atlas, (name,), ((x, y, region.w if width is None else width, region.h if height is None else height),), color)
+
+    def quads(self, centers: np.ndarray, sizes: Union[np.ndarray, screen_unit], colors: np.ndarray,
+              atlas: Union['TextureAtlas', None] = None, name: str | None = None):
+        """
+        Draws squares around center points with a single draw call, e.g. for particles.\n
+        :param centers: (N, 2) array of x, y
+        :param sizes: (N,) array with the width of every square, or one width for all squares
+        :param colors: (N, 4) uint8 array with an RGBA color per square, or any array 'Color.pack_array' takes
+        :param atlas: optional texture atlas, every square shows the atlas image 'name' multiplied with its color
+        """
+        count = len(centers)
+        if count == 0:
+            return
+        half = np.broadcast_to(np.asarray(sizes, dtype=np.float32) / 2, (count,))
+        x, y = centers[:, 0], centers[:, 1]
+        vertices = np.empty((count, 4, 2), dtype=np.float32)
+        vertices[:, 0, 0] = vertices[:, 3, 0] = x - half
+        vertices[:, 1, 0] = vertices[:, 2, 0] = x + half
+        vertices[:, 0, 1] = vertices[:, 1, 1] = y - half
+        vertices[:, 2, 1] = vertices[:, 3, 1] = y + half
+
+        texture = tex_coords = None
+        if atlas is not None:
+            region = atlas.get(name)
+            page_w, page_h = atlas.get_page_size(region.page)
+            u0, v0 = region.x / page_w, region.y / page_h
+            u1, v1 = u0 + region.w / page_w, v0 + region.h / page_h
+            tex_coords = np.broadcast_to(np.array([[u0, v0], [u1, v0], [u1, v1], [u0, v1]], dtype=np.float32), (count, 4, 2)).reshape(-1, 2)
+            texture = atlas._frame_texture(region.page)
+        self._render_geometry(vertices.reshape(-1, 2), self._quad_indices(count), None,
+                              np.repeat(Color.pack_array(colors), 4, axis=0), texture, tex_coords)
+
+    def _quad_indices(self, count: int) -> np.ndarray:
+        """
+        the indices of 'count' quads, the indices of the first quads are the same for any count so they are generated once
+        """
+        if len(self._quad_index_cache) < count * 6:
+            capacity = max(count, len(self._quad_index_cache) // 3)
+            self._quad_index_cache = (np.arange(capacity, dtype=np.int32)[:, None] * 4 + QUAD_INDICES).ravel()
+        return self._quad_index_cache[:count * 6]
+
+    def circle(self, cx: screen_unit, cy: screen_unit, radius: screen_unit, color: Union[RGBvalue, RGBAvalue, Gradient], segments: int = 30): 
         """
         Draws a circle using hardware-accelerated graphics.
         Vertices will be cached after being generated for the first time to improve performance.
         :param cx: The x-coordinate of the center of the circle.
         :param cy: The y-coordinate of the center of the circle.
         :param radius: The radius of the circle.
-        :param color: The color of the circle in RGB/RGBA format.
+        :param color: The color of the circle in RGB/RGBA format, or a LinearGradient / RadialGradient.
         :param segments: The number of segments to use for the circle. Higher values result in smoother circles but more vertices, hence a slight performance decrease.
         """
         if not self._is_visible(cx - radius, cy - radius, radius * 2, radius * 2):
@@ -147,11 +301,13 @@ class Draw:
         # Generate or retrieve cached ring vertices and indices (for border)
         ring_key = ('circle_ring', outer_radius, inner_radius, segments)
         if ring_key in self._circle_cache:
+            self._stats.geometry_cache_hits += 1
             ring_vertices, ring_indices = self._circle_cache[ring_key]
             # Adjust vertices based on cx and cy
             ring_vertices = ring_vertices + \
                 np.array([cx, cy], dtype=np.float32)
         else:
+            self._stats.geometry_cache_misses += 1
             ring_vertices, ring_indices = self._generate_ring_vertices(
                 0, 0, outer_radius, inner_radius, segments)
             self._circle_cache[ring_key] = (
@@ -170,8 +326,10 @@ class Draw:
         # Create a cache key based on radius and segments
         key = (radius, segments)
         if key in self._circle_cache:
+            self._stats.geometry_cache_hits += 1
             cached_vertices, indices = self._circle_cache[key]
         else:
+            self._stats.geometry_cache_misses += 1
             vertices, indices = self._generate_circle_vertices(
                 0, 0, radius, segments)
             # Cache the vertices and indices
@@ -235,12 +393,12 @@ class Draw:
         indices = np.array(indices, dtype=np.int32)
         return vertices, indices
 
-    def polygon(self, points: list[Coordinate], color: Union[RGBvalue, RGBAvalue]):
+    def polygon(self, points: list[Coordinate], color: Union[RGBvalue, RGBAvalue, Gradient]):
         """
         Draws a polygon using hardware-accelerated graphics.
         Vertices will be cached after being generated for the first time to improve performance.
         :param points: A list of (x, y) points that define the polygon.
-        :param color: The color of the polygon in RGB/RGBA format.
+        :param color: The color of the polygon in RGB/RGBA format, or a LinearGradient / RadialGradient.
         """
         # Convert points to NumPy array
         points_array = np.array(points, dtype=np.float32)
@@ -297,8 +455,10 @@ class Draw:
         # Create a cache key based on the points
         key = tuple(map(tuple, points_array))
         if key in self._polygon_cache:
+            self._stats.geometry_cache_hits += 1
             vertices, indices = self._polygon_cache[key]
         else:
+            self._stats.geometry_cache_misses += 1
             vertices = points_array
             indices = self._generate_polygon_indices(vertices)
             self._polygon_cache[key] = (vertices.copy(), indices.copy())
@@ -351,48 +511,127 @@ class Draw:
         if not self._is_line_visible(x1, y1, x2, y2):
             return  # Frustum culling: Skip rendering if not visible
 
-        sdl2.SDL_SetRenderDrawColor(self._renderer.sdlrenderer, *color)
+        self._stats.draw_calls += 1
+        if self._commands is not None:
+            self._commands.append((_LINE, Color.pack(color), x1, y1, x2, y2))
+            return
+        sdl2.SDL_SetRenderDrawColor(self._renderer.sdlrenderer, *Color.pack(color))
         sdl2.SDL_RenderDrawLineF(self._renderer.sdlrenderer, x1, y1, x2, y2)
 
-    def _render_geometry(self, vertices, indices, color):
-        """Helper function to send vertex data to SDL_RenderGeometry."""
-        r, g, b, a = Color._handle_rgb_rgba(color)
+    def texture(self, texture, x: screen_unit, y: screen_unit, w: screen_unit, h: screen_unit):
+        """
+        Copies a whole texture into a rect, the texture is stretched to the size of the rect.
+        :param texture: an SDL texture, or a texture of a text or image that is created when the frame is submitted
+        """
+        if texture is None:
+            return
+        self._stats.draw_calls += 1
+        rect = sdl2.SDL_Rect(int(x), int(y), int(w), int(h))
+        if self._commands is not None:
+            self._commands.append((_COPY, texture, rect))
+            return
+        sdl2.SDL_RenderCopy(self._renderer.sdlrenderer, _resolve_texture(texture), None, rect)
+
+    def set_clip(self, rect: Union['Rect', None]):
+        """
+        Only draw inside a rect until the clip is set again, None draws in the whole window again.
+        """
+        clip = None if rect is None else sdl2.SDL_Rect(int(rect.x), int(rect.y), int(rect.w), int(rect.h))
+        if self._commands is not None:
+            self._commands.append((_CLIP, clip))
+            return
+        sdl2.SDL_RenderSetClipRect(self._renderer.sdlrenderer, clip)
+
+    ###################
+    # recorded frames #
+    ###################
+    def _begin_recording(self) -> None:
+        """
+        record the draw commands instead of sending them to SDL, used to make a frame on another thread than the main thread
+        """
+        self._commands = []
+
+    def _end_recording(self) -> tuple[tuple, ...]:
+        commands, self._commands = self._commands, None
+        return tuple(commands) if commands is not None else ()
+
+    def _submit(self, commands: tuple[tuple, ...]) -> None:
+        """
+        send recorded draw commands to SDL, only on the main thread
+        """
+        renderer = self._renderer.sdlrenderer
+        for command in commands:
+            kind = command[0]
+            if kind == _GEOMETRY:
+                _, texture, vertices, indices = command
+                sdl2.SDL_RenderGeometry(renderer, _resolve_texture(texture),
+                                        vertices.ctypes.data_as(POINTER(sdl2.SDL_Vertex)), len(vertices),
+                                        indices.ctypes.data_as(POINTER(c_int)), len(indices))
+            elif kind == _COPY:
+                texture = _resolve_texture(command[1])
+                if texture:
+                    sdl2.SDL_RenderCopy(renderer, texture, None, command[2])
+            elif kind == _LINE:
+                _, color, x1, y1, x2, y2 = command
+                sdl2.SDL_SetRenderDrawColor(renderer, *color)
+                sdl2.SDL_RenderDrawLineF(renderer, x1, y1, x2, y2)
+            else:
+                sdl2.SDL_RenderSetClipRect(renderer, command[1])
+
+    def _render_geometry(self, vertices, indices, color, colors=None, texture=None, tex_coords=None):
+        """
+        Helper function to send vertex data to SDL_RenderGeometry.
+        The vertices are written into a buffer with the memory layout of SDL_Vertex, so no per vertex conversion is needed.
+        :param colors: optional (N, 4) uint8 array with a color per vertex, overrides color.
+        :param texture: optional texture sampled with tex_coords, an (N, 2) array of normalized coordinates per vertex.
+        A gradient as color is turned into per vertex colors, the shape may be split into more triangles for it.
+        """
+        if colors is None and isinstance(color, Gradient):
+            vertices, indices, colors = color._apply(np.asarray(vertices, dtype=np.float32), np.asarray(indices, dtype=np.int32))
         num_vertices = len(vertices)
+        num_indices = len(indices)
 
-        # Ensure buffers are large enough
-        if num_vertices > self._vertex_buffer_size:
-            self._vertex_buffer_size = num_vertices * 2
-            self._vertex_buffer = np.zeros(
-                (self._vertex_buffer_size, 2), dtype=np.float32)
-        if len(indices) > self._index_buffer_size:
-            self._index_buffer_size = len(indices) * 2
-            self._index_buffer = np.zeros(
-                self._index_buffer_size, dtype=np.int32)
-
-        # Copy vertices into the buffer
-        self._vertex_buffer[:num_vertices] = vertices[:]
-        # Copy indices into the buffer
-        self._index_buffer[:len(indices)] = indices[:]
-
-        # Prepare SDL_Vertex array
-        vertex_array = (sdl2.SDL_Vertex * num_vertices)()
-        for i in range(num_vertices):
-            vx, vy = self._vertex_buffer[i]
-            vertex_array[i] = sdl2.SDL_Vertex(
-                sdl2.SDL_FPoint(vx, vy),
-                sdl2.SDL_Color(r, g, b, a),
-                sdl2.SDL_FPoint(0, 0)
-            )
+        if self._commands is not None:
+            # a recorded frame keeps its own buffers, it is submitted while the next frame is recorded
+            vertex_buffer = np.empty(num_vertices, dtype=VERTEX_DTYPE)
+            index_buffer = np.array(indices, dtype=np.int32)
+        else:
+            # Ensure buffers are large enough
+            if num_vertices > self._vertex_buffer_size:
+                self._vertex_buffer_size = num_vertices * 2
+                self._vertex_buffer = np.zeros(
+                    self._vertex_buffer_size, dtype=VERTEX_DTYPE)
+            if num_indices > self._index_buffer_size:
+                self._index_buffer_size = num_indices * 2
+                self._index_buffer = np.zeros(
+                    self._index_buffer_size, dtype=np.int32)
+            vertex_buffer = self._vertex_buffer[:num_vertices]
+            index_buffer = self._index_buffer[:num_indices]
+            index_buffer[:] = indices
+
+        # Copy vertices and colors into the buffer
+        vertex_buffer["position"] = vertices
+        if colors is None:
+            vertex_buffer["color"] = Color.pack(color)
+        else:
+            vertex_buffer["color"] = colors
+        if tex_coords is not None:
+            vertex_buffer["tex_coord"] = tex_coords
+
+        self._stats.draw_calls += 1
+        self._stats.vertices += num_vertices
 
-        # Convert indices to c_int array
-        index_array = (
-            c_int * len(indices)).from_buffer_copy(self._index_buffer[:len(indices)].tobytes())
+        if self._commands is not None:
+            vertex_buffer.flags.writeable = False
+            index_buffer.flags.writeable = False
+            self._commands.append((_GEOMETRY, texture, vertex_buffer, index_buffer))
+            return
 
         # Render geometry
         sdl2.SDL_RenderGeometry(
-            self._renderer.sdlrenderer, None,
-            vertex_array, num_vertices,
-            index_array, len(indices)
+            self._renderer.sdlrenderer, _resolve_texture(texture),
+            vertex_buffer.ctypes.data_as(POINTER(sdl2.SDL_Vertex)), num_vertices,
+            index_buffer.ctypes.data_as(POINTER(c_int)), num_indices
         )
 
     def _generate_rectangle_vertices(self, x, y, w, h):
@@ -689,8 +928,10 @@ class Draw:
         """
         key = tuple(map(tuple, points_array))
         if key in self._triangle_cache:
+            self._stats.geometry_cache_hits += 1
             vertices, indices = self._triangle_cache[key]
         else:
+            self._stats.geometry_cache_misses += 1
             # For a triangle, vertices are just the points and indices are [0,1,2].
             vertices = points_array
             indices = np.array([0, 1, 2], dtype=np.int32)
@@ -4,8 +4,12 @@ from .mouse import Mouse
 from .keyboard import Keyboard
 from typing import Callable
 from ...core.handler.clock import Clock
+from .event_recorder import EventRecorder, EventReplay
 from ... import data
 
+_MOUSE_EVENTS = frozenset((sdl2.SDL_MOUSEMOTION, sdl2.SDL_MOUSEBUTTONDOWN, sdl2.SDL_MOUSEBUTTONUP, sdl2.SDL_MOUSEWHEEL))
+_INPUT_EVENTS = _MOUSE_EVENTS | {sdl2.SDL_KEYDOWN, sdl2.SDL_KEYUP, sdl2.SDL_TEXTINPUT}
+
 
 class Event:
     def __init__(self, fps: int) -> None:
@@ -14,40 +18,84 @@ class Event:
         self.keyboard: Keyboard = Keyboard()
         self.clock: Clock = Clock(fps)
         self._fps = fps
+        self.vsync: bool = False  # the display paces the frames, the clock won't sleep
+        self.unthrottled: bool = False  # frames run as fast as possible, used for replays
+        self._recorder: EventRecorder | None = None
+        self._replay: EventReplay | None = None
+        self.input_timestamps: list[int] = []  # SDL timestamps of the input events of this frame, empty during replays
     
-    def handle(self, fps: int, on_quit: Callable[[], None]) -> bool:
+    def handle(self, fps: int, on_quit: Callable[[], None], on_resize: Callable[[int, int], None] | None = None) -> bool:
         if fps != self._fps:
             self._fps = fps
             self.clock.fps = fps
-        if not self._fps == -1:
+        if not self._fps == -1 and not self.vsync and not self.unthrottled:
             self.clock.sleep()
         self.events = sdl2.ext.get_events()
+        if self._replay is not None:
+            self.events = self._next_replay_frame(self.events, on_quit)
+        if self._recorder is not None:
+            self._recorder.record(self.events)
         
         #* reset vars
-        self.mouse._reset_mouse_button_status()
+        self.input_timestamps = [] if self._replay is not None else [event.common.timestamp for event in self.events if event.type in _INPUT_EVENTS]
+        self.mouse._begin_frame()
         self.keyboard._reset_keys()       
         data.widget_pressed = False
         
         #* handle events
         if not self.is_build_frame():
             for event in self.events:
-                if event.type == sdl2.SDL_QUIT:
+                event_type = event.type
+                if event_type == sdl2.SDL_QUIT:
                     on_quit()
-                elif event.type == sdl2.SDL_MOUSEBUTTONDOWN:
-                    self.mouse.mouse_buttons_status[event.button.button] = True
-                    self.mouse.mouse_flank[event.button.button] = True
-                elif event.type == sdl2.SDL_MOUSEBUTTONUP:
-                    self.mouse.mouse_buttons_status[event.button.button] = False
-                    self.mouse.mouse_flank[event.button.button] = True
-                elif event.type == sdl2.SDL_KEYDOWN:
-                    self.keyboard.active_keys.append(event.key.keysym.sym)
-                    self.keyboard.clicked_keys.append(event.key.keysym.sym)
-                elif event.type == sdl2.SDL_KEYUP:
-                    index = self.keyboard.active_keys.index(event.key.keysym.sym)
-                    self.keyboard.released_keys.append(self.keyboard.active_keys.pop(index))
+                elif event_type in _MOUSE_EVENTS:
+                    self.mouse._handle_event(event)
+                elif event_type == sdl2.SDL_KEYDOWN or event_type == sdl2.SDL_KEYUP:
+                    self.keyboard._handle_event(event)
+                elif event_type == sdl2.SDL_WINDOWEVENT and event.window.event == sdl2.SDL_WINDOWEVENT_SIZE_CHANGED and on_resize is not None:
+                    on_resize(event.window.data1, event.window.data2)
+        self.mouse._end_frame()
+        self.keyboard._end_frame()
                     
         
         
+    # recording
+    def start_recording(self, path: str) -> None:
+        self.stop_recording()
+        self._recorder = EventRecorder(path)
+
+    def stop_recording(self) -> None:
+        if self._recorder is not None:
+            self._recorder.close()
+            self._recorder = None
+
+    def start_replay(self, path: str, unthrottled: bool = False) -> None:
+        self._replay = EventReplay(path)
+        self.unthrottled = unthrottled
+        # the keyboard state has to follow the replayed events instead of the real keyboard
+        self.keyboard._set_track_state(True)
+
+    def stop_replay(self) -> None:
+        if self._replay is not None:
+            self._replay = None
+            self.unthrottled = False
+            self.keyboard._set_track_state(False)
+
+    def is_replaying(self) -> bool:
+        return self._replay is not None
+
+    def _next_replay_frame(self, real_events: list[sdl2.SDL_Event], on_quit: Callable[[], None]) -> list[sdl2.SDL_Event]:
+        """
+        the replayed events of this frame, real input is ignored except for closing the window
+        """
+        for event in real_events:
+            if event.type == sdl2.SDL_QUIT:
+                on_quit()
+        events = self._replay.next_frame()
+        if self._replay.finished:
+            self.stop_replay()
+        return events
+
     def is_build_frame(self) -> bool:
         
         pass
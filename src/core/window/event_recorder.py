@@ -0,0 +1,128 @@
+import struct
+import sdl2
+from ctypes import sizeof
+from time import perf_counter
+from typing import BinaryIO
+from ...exceptions import InvalidRecordingError
+from ...messenger import Messenger
+
+# file layout (little endian):
+#   header: magic, format version, size of an SDL_Event in bytes
+#   blocks: frame number, seconds since the recording started, event count, followed by the raw SDL_Events
+# frames without events are not written, except for the last frame so the length of the recording is known
+_MAGIC = b"PLEV"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHH")
+_FRAME = struct.Struct("<IdH")
+_EVENT_SIZE = sizeof(sdl2.SDL_Event)
+_MAX_EVENTS_PER_BLOCK = 0xFFFF
+
+
+class EventRecorder:
+    """
+    Writes the SDL events of every frame to a compact binary file that can be replayed with 'EventReplay'
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file: BinaryIO = open(path, "wb")
+        self._file.write(_HEADER.pack(_MAGIC, _VERSION, _EVENT_SIZE))
+        self._start_time = perf_counter()
+        self._frame = 0
+        self._last_written_frame = -1
+
+    def record(self, events: list[sdl2.SDL_Event]) -> None:
+        """
+        record the events of the next frame
+        """
+        if events:
+            self._write_block(events)
+        self._frame += 1
+
+    def _write_block(self, events: list[sdl2.SDL_Event]) -> None:
+        timestamp = perf_counter() - self._start_time
+        for start in range(0, max(len(events), 1), _MAX_EVENTS_PER_BLOCK):
+            chunk = events[start:start + _MAX_EVENTS_PER_BLOCK]
+            self._file.write(_FRAME.pack(self._frame, timestamp, len(chunk)))
+            self._file.write(b"".join(bytes(event) for event in chunk))
+        self._last_written_frame = self._frame
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        if self._frame > 0 and self._last_written_frame != self._frame - 1:
+            self._frame -= 1
+            self._write_block([])
+        self._file.close()
+
+    def __enter__(self) -> 'EventRecorder':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class EventReplay:
+    """
+    Plays a recording of 'EventRecorder' back frame by frame, in the order and frames the events were recorded in
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as file:
+            data = file.read()
+        self._frames: dict[int, list[sdl2.SDL_Event]] = {}
+        self._timestamps: dict[int, float] = {}
+        self.frame_count = self._parse(data)
+        self._frame = 0
+
+    def _parse(self, data: bytes) -> int:
+        if len(data) < _HEADER.size:
+            Messenger.fatalError(InvalidRecordingError(f"'{self.path}' is too short to be an event recording"))
+        magic, version, event_size = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            Messenger.fatalError(InvalidRecordingError(f"'{self.path}' is not an event recording"))
+        if version != _VERSION or event_size != _EVENT_SIZE:
+            Messenger.fatalError(InvalidRecordingError(
+                f"'{self.path}' was recorded with format version {version} and {event_size} byte events, expected version {_VERSION} and {_EVENT_SIZE} byte events"))
+
+        offset = _HEADER.size
+        last_frame = -1
+        while offset < len(data):
+            if offset + _FRAME.size > len(data):
+                Messenger.fatalError(InvalidRecordingError(f"'{self.path}' ends in the middle of a frame"))
+            frame, timestamp, count = _FRAME.unpack_from(data, offset)
+            offset += _FRAME.size
+            end = offset + count * _EVENT_SIZE
+            if end > len(data):
+                Messenger.fatalError(InvalidRecordingError(f"'{self.path}' ends in the middle of frame {frame}"))
+            events = self._frames.setdefault(frame, [])
+            events.extend(sdl2.SDL_Event.from_buffer_copy(data, position) for position in range(offset, end, _EVENT_SIZE))
+            self._timestamps[frame] = timestamp
+            offset = end
+            last_frame = frame
+        return last_frame + 1
+
+    @property
+    def finished(self) -> bool:
+        return self._frame >= self.frame_count
+
+    def get_frame(self) -> int:
+        """
+        the frame that will be played next
+        """
+        return self._frame
+
+    def get_timestamp(self, frame: int) -> float | None:
+        """
+        seconds since the start of the recording when a frame with events was recorded
+        """
+        return self._timestamps.get(frame)
+
+    def next_frame(self) -> list[sdl2.SDL_Event]:
+        """
+        the events of the next frame
+        """
+        events = self._frames.get(self._frame, [])
+        self._frame += 1
+        return events
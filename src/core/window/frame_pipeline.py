@@ -0,0 +1,211 @@
+import sdl2
+import threading
+from queue import SimpleQueue
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
+from ...color import Color
+from ...typedef import RGBAvalue, RGBvalue
+
+if TYPE_CHECKING:
+    from .window import Window
+    from ..utils.resource_manager import ResourceManager
+
+# the pipeline of the worker thread that runs on this thread, if any
+_local = threading.local()
+# taken while a deferred texture is created or cancelled, so a texture is never created after it was cancelled
+_upload_lock = threading.Lock()
+
+
+def current_pipeline() -> 'FramePipeline | None':
+    """
+    the pipeline when called from its worker thread, None on every other thread
+    """
+    return getattr(_local, "pipeline", None)
+
+
+class DeferredTexture:
+    """
+    A texture that is created from a surface on the main thread when the frame it was made in is submitted.\n
+    SDL textures can only be created on the main thread, in a pipelined window texts and images that are rendered on the
+    worker thread get one of these instead. Calling it returns the SDL texture, None until it is created.
+    """
+
+    __slots__ = ("texture", "_surface", "_create", "_cancelled")
+
+    def __init__(self, surface: sdl2.SDL_Surface, create: Callable[[sdl2.SDL_Surface], sdl2.SDL_Texture | None]) -> None:
+        self.texture: sdl2.SDL_Texture | None = None
+        self._surface = surface
+        self._create = create  # creates the texture and frees the surface
+        self._cancelled = False
+
+    def __call__(self) -> sdl2.SDL_Texture | None:
+        return self.texture
+
+    def _resolve(self) -> None:
+        """
+        create the texture, only called on the main thread
+        """
+        with _upload_lock:
+            surface, self._surface = self._surface, None
+            if surface is None:
+                return
+            if self._cancelled:
+                sdl2.SDL_FreeSurface(surface)
+            else:
+                self.texture = self._create(surface)
+
+    def cancel(self, resources: 'ResourceManager') -> None:
+        """
+        the texture isn't needed anymore, it is released when it was created already and not created otherwise
+        """
+        with _upload_lock:
+            self._cancelled = True
+            texture = self.texture
+        if texture:
+            resources.release(texture)
+
+
+class FrameSnapshot(NamedTuple):
+    """
+    Everything the main thread needs to submit a frame, made on the worker thread and not changed afterwards.\n
+    - releases: (destroy function, resource) of the resources freed while the frame was made\n
+    - uploads: the textures made during the frame, they are created before the commands are submitted\n
+    - commands: the draw commands recorded by 'Draw'
+    """
+    frame: int
+    background_color: tuple[int, int, int, int]
+    releases: tuple[tuple[Callable, Any], ...]
+    uploads: tuple[DeferredTexture, ...]
+    commands: tuple[tuple, ...]
+
+
+class FramePipeline:
+    """
+    Runs the update of a window on a worker thread, one frame ahead of the main thread that submits to SDL.\n
+    Every frame the main thread handles the events, starts the worker on the next frame and submits the snapshot of the
+    previous frame while the worker updates the widgets, runs the update function and records the draw commands.
+    The worker only runs while the main thread submits, so widgets and input never change while the worker reads them.
+    Use it through 'Window.run' with 'pipelined=True'.
+    """
+
+    def __init__(self, window: 'Window') -> None:
+        self._window = window
+        self._requests: SimpleQueue = SimpleQueue()  # update functions for the worker, None stops it
+        self._results: SimpleQueue = SimpleQueue()  # snapshots or the exception of the update
+        self._worker: threading.Thread | None = None
+        self._uploads: list[DeferredTexture] = []  # textures made by the frame the worker is making
+        self._snapshot: FrameSnapshot | None = None  # made but not submitted yet
+        self._background_color = Color.pack(Color.BLACK)
+        self._close_request: bool | None = None  # 'quit_program' of a 'Window.close' from the worker
+
+    def is_running(self) -> bool:
+        return self._worker is not None
+
+    def defer_texture(self, surface: sdl2.SDL_Surface, create: Callable[[sdl2.SDL_Surface], sdl2.SDL_Texture | None]) -> DeferredTexture:
+        """
+        a texture that 'create' makes from the surface on the main thread before the current frame is submitted
+        """
+        texture = DeferredTexture(surface, create)
+        self._uploads.append(texture)
+        return texture
+
+    def request_close(self, quit_program: bool) -> None:
+        """
+        close the window on the main thread once the worker finished the frame
+        """
+        self._close_request = quit_program
+
+    ###############
+    # main thread #
+    ###############
+    def run(self, update: Callable[[], None], background_color: RGBvalue | RGBAvalue, fps: int) -> None:
+        """
+        run frames until the window is closed
+        """
+        window = self._window
+        self._background_color = Color.pack(background_color)
+        self._start()
+        try:
+            while not window._closed:
+                window.frame_counter += 1
+                if not window.is_init_frame():
+                    window._handle_events(fps)
+                    if window._closed:
+                        break  # closing stopped the worker, there is no frame to wait for
+                self._requests.put(update)
+                if self._snapshot is not None:
+                    self._submit(self._snapshot)
+                    self._snapshot = None
+                result = self._results.get()
+                if isinstance(result, BaseException):
+                    raise result
+                self._snapshot = result
+                window.stats.new_frame()
+                if self._close_request is not None:
+                    window.close(self._close_request)
+        finally:
+            self.stop()
+
+    def _start(self) -> None:
+        self._window.resources._start_deferring()
+        self._worker = threading.Thread(target=self._work, name="plang-frame", daemon=True)
+        self._worker.start()
+
+    def stop(self) -> None:
+        """
+        stop the worker, the frame it made last is not shown but its textures are created and its resources freed
+        """
+        if self._worker is None:
+            return
+        self._requests.put(None)
+        self._worker.join()
+        self._worker = None
+        if self._snapshot is not None:
+            self._apply_resources(self._snapshot)
+            self._snapshot = None
+        for texture in self._uploads:
+            texture._resolve()
+        self._uploads = []
+        for destroy, resource in self._window.resources._stop_deferring():
+            destroy(resource)
+
+    def _submit(self, snapshot: FrameSnapshot) -> None:
+        window = self._window
+        self._apply_resources(snapshot)
+        renderer = window._renderer.sdlrenderer
+        sdl2.SDL_SetRenderDrawColor(renderer, *snapshot.background_color)
+        sdl2.SDL_RenderClear(renderer)
+        window.draw._submit(snapshot.commands)
+        window._present(new_frame=False)
+
+    @staticmethod
+    def _apply_resources(snapshot: FrameSnapshot) -> None:
+        # the freed resources were last drawn by the frame before, which is submitted already
+        for destroy, resource in snapshot.releases:
+            destroy(resource)
+        for texture in snapshot.uploads:
+            texture._resolve()
+
+    #################
+    # worker thread #
+    #################
+    def _work(self) -> None:
+        _local.pipeline = self
+        while True:
+            update = self._requests.get()
+            if update is None:
+                return
+            try:
+                self._results.put(self._make_frame(update))
+            except BaseException as error:
+                self._window.draw._end_recording()
+                self._results.put(error)
+
+    def _make_frame(self, update: Callable[[], None]) -> FrameSnapshot:
+        window = self._window
+        window.draw._begin_recording()
+        if not window.is_init_frame():
+            window._update_frame()
+        update()
+        commands = window.draw._end_recording()
+        uploads, self._uploads = tuple(self._uploads), []
+        return FrameSnapshot(window.frame_counter, self._background_color, window.resources._take_deferred(), uploads, commands)
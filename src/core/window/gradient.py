@@ -0,0 +1,155 @@
+import numpy as np
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Sequence, Union
+from ...typedef import RGBAvalue, RGBvalue
+from ...color import Color
+from ...messenger import Messenger
+from ...exceptions import ColorError
+
+# longest triangle edge in pixels after a shape is subdivided for a gradient
+_MAX_EDGE = 32
+_MAX_SUBDIVISIONS = 5
+# shapes a gradient keeps its vertices and colors for, most shapes are drawn with the same size every frame
+_CACHE_SIZE = 16
+
+
+def _subdivide(vertices: np.ndarray, indices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    split every triangle into 4 at the middle of its edges, the vertices are not shared between triangles
+    """
+    triangles = vertices[indices].reshape(-1, 3, 2)
+    a, b, c = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+    ab, bc, ca = (a + b) / 2, (b + c) / 2, (c + a) / 2
+    new_vertices = np.stack((a, ab, ca, ab, b, bc, ca, bc, c, ab, bc, ca), axis=1).reshape(-1, 2)
+    return new_vertices, np.arange(len(new_vertices), dtype=np.int32)
+
+
+class Gradient(ABC):
+    """
+    Base of the gradients, a gradient can be passed as the color of 'Draw.rectangle', 'Draw.circle' and 'Draw.polygon'.\n
+    The gradient is placed relative to the bounding box of the shape, (0, 0) is its top-left and (1, 1) its bottom-right
+    corner, so the same gradient can fill shapes of any size and position. The colors are computed per vertex and
+    interpolated by the GPU, the shape is still a single draw call. Shapes are split into smaller triangles when their
+    corners alone can't show the gradient (more than 2 colors, radial gradients).
+    :param colors: the colors of the gradient in RGB/RGBA format
+    :param offsets: where every color is, between 0 and 1 in ascending order, evenly spaced when not given
+
+    Gradients can't be changed, the filled shapes are cached per gradient. Create a new gradient for other colors.
+    """
+
+    def __init__(self, colors: Sequence[Union[RGBvalue, RGBAvalue]], offsets: Sequence[float] | None = None) -> None:
+        if len(colors) < 2:
+            Messenger.fatalError(ColorError("a gradient needs at least 2 colors"))
+        if offsets is None:
+            offsets = np.linspace(0, 1, len(colors))
+        if len(offsets) != len(colors):
+            Messenger.fatalError(ValueError(f"a gradient with {len(colors)} colors needs {len(colors)} offsets, got {len(offsets)}"))
+        self._offsets = np.asarray(offsets, dtype=np.float32)
+        if (np.diff(self._offsets) < 0).any():
+            Messenger.fatalError(ValueError("the offsets of a gradient have to be in ascending order"))
+        self._colors = np.array([Color.pack(color) for color in colors], dtype=np.float32)
+        # (shape relative to its top-left corner, indices) -> relative vertices, indices and colors
+        self._shapes: OrderedDict[tuple[bytes, bytes], tuple[np.ndarray, np.ndarray, np.ndarray]] = OrderedDict()
+
+    @abstractmethod
+    def _positions(self, vertices: np.ndarray, origin: np.ndarray, size: np.ndarray) -> np.ndarray:
+        """
+        the position in the gradient of every vertex, 0 at the first and 1 at the last color
+        """
+
+    def _is_affine(self) -> bool:
+        """
+        True when the colors change linearly over the whole plane, then the corners of a shape are enough
+        """
+        return False
+
+    def _vertex_colors(self, positions: np.ndarray) -> np.ndarray:
+        offsets = self._offsets
+        positions = np.clip(positions, offsets[0], offsets[-1]).astype(np.float32)
+        # the pair of colors every position is between
+        first = np.clip(np.searchsorted(offsets, positions, side="right") - 1, 0, len(offsets) - 2)
+        span = np.maximum(offsets[first + 1] - offsets[first], 1e-6)
+        t = ((positions - offsets[first]) / span)[:, None]
+        colors = self._colors[first] + (self._colors[first + 1] - self._colors[first]) * t
+        return (colors + 0.5).astype(np.uint8)
+
+    def _apply(self, vertices: np.ndarray, indices: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        the vertices, indices and per vertex colors of a shape filled with the gradient
+        """
+        origin = vertices.min(axis=0)
+        vertices = vertices - origin
+        key = (vertices.tobytes(), indices.tobytes())
+        cached = self._shapes.get(key)
+        if cached is None:
+            cached = self._shapes[key] = self._fill(vertices, indices)
+            if len(self._shapes) > _CACHE_SIZE:
+                self._shapes.popitem(last=False)
+        else:
+            self._shapes.move_to_end(key)
+        relative_vertices, indices, colors = cached
+        return relative_vertices + origin, indices, colors
+
+    def _fill(self, vertices: np.ndarray, indices: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        fill a shape with its top-left corner at (0, 0)
+        """
+        origin = np.zeros(2, dtype=np.float32)
+        size = np.maximum(vertices.max(axis=0), 1e-6)
+        positions = self._positions(vertices, origin, size)
+        # past the first and the last color the colors stop changing linearly
+        if not self._is_affine() or positions.min() < self._offsets[0] or positions.max() > self._offsets[-1]:
+            triangles = vertices[indices].reshape(-1, 3, 2)
+            longest_edge = max(float(np.abs(triangles - np.roll(triangles, 1, axis=1)).max()), 1)
+            for _ in range(min(int(np.ceil(np.log2(longest_edge / _MAX_EDGE))), _MAX_SUBDIVISIONS)):
+                vertices, indices = _subdivide(vertices, indices)
+            positions = self._positions(vertices, origin, size)
+        return vertices, indices, self._vertex_colors(positions)
+
+
+class LinearGradient(Gradient):
+    """
+    Colors change along the line from 'start' to 'end', the default goes from the top to the bottom of the shape.
+    ```
+    window.draw.rectangle(0, 0, 800, 600, LinearGradient([Color.NAVY_BLUE, Color.SKY_BLUE]))
+    ```
+    :param start: the point of the first color, relative to the bounding box of the shape
+    :param end: the point of the last color, relative to the bounding box of the shape
+    """
+
+    def __init__(self, colors: Sequence[Union[RGBvalue, RGBAvalue]], offsets: Sequence[float] | None = None,
+                 start: tuple[float, float] = (0, 0), end: tuple[float, float] = (0, 1)) -> None:
+        super().__init__(colors, offsets)
+        self._start = start
+        self._end = end
+
+    def _is_affine(self) -> bool:
+        return len(self._offsets) == 2
+
+    def _positions(self, vertices: np.ndarray, origin: np.ndarray, size: np.ndarray) -> np.ndarray:
+        start = origin + np.asarray(self._start, dtype=np.float32) * size
+        direction = (np.asarray(self._end, dtype=np.float32) - self._start) * size
+        length = max(float(direction @ direction), 1e-6)
+        return ((vertices - start) @ direction) / length
+
+
+class RadialGradient(Gradient):
+    """
+    Colors change from 'center' outwards, the default fills the bounding box of the shape with the last color at its edges.
+    ```
+    window.draw.circle(400, 300, 50, RadialGradient([Color.WHITE, Color.LIGHT_BLUE]))
+    ```
+    :param center: the point of the first color, relative to the bounding box of the shape
+    :param radius: the distance of the last color, relative to the bounding box, so the gradient is an ellipse in a non square box
+    """
+
+    def __init__(self, colors: Sequence[Union[RGBvalue, RGBAvalue]], offsets: Sequence[float] | None = None,
+                 center: tuple[float, float] = (0.5, 0.5), radius: float = 0.5) -> None:
+        super().__init__(colors, offsets)
+        self._center = center
+        self._radius = radius
+
+    def _positions(self, vertices: np.ndarray, origin: np.ndarray, size: np.ndarray) -> np.ndarray:
+        relative = (vertices - origin) / size - np.asarray(self._center, dtype=np.float32)
+        return np.sqrt((relative * relative).sum(axis=1)) / max(self._radius, 1e-6)
@@ -9,17 +9,52 @@ if TYPE_CHECKING:
     from .window import Window
 
 
+class _IndexedField:
+    """
+    A field of the SDL_Rect that keeps the spatial index of the window up to date when it is set.\n
+    It only takes over setting the field, the value is mirrored in the instance dict so reading it stays a plain
+    attribute lookup, widgets read their geometry far more often than they change it.
+    """
+
+    __slots__ = ("_name", "_field")
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._field = getattr(Rect, name)  # the ctypes field
+
+    def __set__(self, rect: 'InteractiveRect', value: screen_unit) -> None:
+        self._write(rect, value)
+        if rect._indexed:
+            rect.update_geometry()
+
+    def _write(self, rect: 'InteractiveRect', value: screen_unit) -> None:
+        """
+        set the field without updating the index, to change several fields with one update
+        """
+        field = self._field
+        field.__set__(rect, value)
+        rect.__dict__[self._name] = field.__get__(rect)
+
+
 class InteractiveRect(Rect):
     """
     adds interactions to a rect
     """
 
+    x = _IndexedField("x")
+    y = _IndexedField("y")
+    w = _IndexedField("w")
+    h = _IndexedField("h")
+    _indexed = False  # SDL_Rect sets the fields before __init__ runs
+
     def __init__(self, window: 'Window', x: screen_unit, y: screen_unit, width: screen_unit, height: screen_unit) -> None:
         super().__init__(x, y, width, height)
         self.oid: OID = OID()
+        self._handle: int = self.oid()
         self.window: 'Window' = window
         self._is_clicked_in_rect = False
         self._enabled = True        
+        self._indexed = False # True when the window keeps this rect in its spatial index
 
     def _cycle(self):
         if self.is_clicked():
@@ -28,17 +63,28 @@ class InteractiveRect(Rect):
         if self.window.mouse.is_mouse_released():
             self._is_clicked_in_rect = False
 
+    def _contains_point(self, x: screen_unit, y: screen_unit) -> bool:
+        """
+        the exact hit test of the shape, the window only calls it for rects that contain the point
+        """
+        return True
+
     def is_mouse_over(self) -> bool:
-        return self.window.mouse.is_mouse_over(self.pack())
+        # the window works out which of its widgets are under the mouse once per frame
+        if self._indexed:
+            return self._handle in self.window._pointer_targets
+        x, y = self.window.mouse.get_position()
+        return self.point_collision(x, y) and self._contains_point(x, y)
 
     def is_clicked(self, mouse_button: mouseButton = mouseButton.left, overwrite_widget_already_pressed: bool = False, overwrite_deactivated: bool = False) -> bool:
-        return self._eligible_for_click(overwrite_widget_already_pressed, overwrite_deactivated) and self.window.mouse.is_mouse_clicked_in_rect(self.pack(), mouse_button)
+        # cheapest check first, the mouse is not clicked in most frames
+        return self.window.mouse.is_mouse_clicked(mouse_button) and self.is_mouse_over() and self._eligible_for_click(overwrite_widget_already_pressed, overwrite_deactivated)
 
     def is_released(self, mouse_button: mouseButton = mouseButton.left, overwrite_widget_already_pressed: bool = False, overwrite_deactivated: bool = False) -> bool:
-        return self._eligible_for_click(overwrite_widget_already_pressed, overwrite_deactivated) and self.window.mouse.is_mouse_released_in_rect(self.pack(), mouse_button)
+        return self.window.mouse.is_mouse_released(mouse_button) and self.is_mouse_over() and self._eligible_for_click(overwrite_widget_already_pressed, overwrite_deactivated)
 
     def is_pressing(self, mouse_button: mouseButton = mouseButton.left, overwrite_widget_already_pressed: bool = False, overwrite_deactivated: bool = False) -> bool:
-        return self._eligible_for_click(overwrite_widget_already_pressed, overwrite_deactivated) and self.window.mouse.is_mouse_pressing_in_rect(self.pack(), mouse_button) and self._is_clicked_in_rect
+        return self._is_clicked_in_rect and self.window.mouse.is_mouse_pressing(mouse_button) and self.is_mouse_over() and self._eligible_for_click(overwrite_widget_already_pressed, overwrite_deactivated)
 
     def _eligible_for_click(self, overwrite_widget_already_pressed, overwrite_deactivated):
         if not overwrite_widget_already_pressed and data.widget_pressed:
@@ -59,9 +105,41 @@ class InteractiveRect(Rect):
         """
         return self
 
+    # setting x, y, w or h keeps the spatial index of the window up to date
+    def update_geometry(self) -> None:
+        """
+        Move the rect in the spatial index of the window, setting the fields or calling the rect methods does this already
+        """
+        if self._indexed:
+            self.window._spatial_index.update(self._handle, self.x, self.y, self.w, self.h)
+            self.window._update_pointer_target(self)
+
+    def reposition(self, x: screen_unit, y: screen_unit) -> None:
+        _X._write(self, x)
+        _Y._write(self, y)
+        self.update_geometry()
+
+    def resize(self, width: screen_unit, height: screen_unit) -> None:
+        _W._write(self, width)
+        _H._write(self, height)
+        self.update_geometry()
+
+    def _set_rect(self, x: screen_unit, y: screen_unit, width: screen_unit, height: screen_unit) -> None:
+        """
+        reposition and resize the rect at once
+        """
+        _X._write(self, x)
+        _Y._write(self, y)
+        _W._write(self, width)
+        _H._write(self, height)
+        self.update_geometry()
+
     def rect_collision(self, rect: Rect) -> bool:
         raise NotImplementedError
 
     def point_collision(self, x: screen_unit, y: screen_unit) -> bool:
-        return x in range(self.x, self.x + self.w + 1) and y in range(self.y, self.y + self.h + 1)
+        return self.x <= x <= self.x + self.w and self.y <= y <= self.y + self.h
+
+
+_X, _Y, _W, _H = InteractiveRect.x, InteractiveRect.y, InteractiveRect.w, InteractiveRect.h
         
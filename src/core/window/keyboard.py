@@ -1,21 +1,110 @@
-from ...enum import key
+import sdl2
+import numpy as np
+from ctypes import c_int
+from typing import Union
+from ...enum import key, keyModifier
+
 
 class Keyboard:
-    def __init__(self) -> None:
-        self.active_keys: list = []
-        self.released_keys: list = []
-        self.clicked_keys: list = []
-        
+    """
+    The keyboard state of a window, indexed by scancode so every key query is a single array lookup.\n
+    The pressed keys are a zero-copy view of the SDL keyboard state, which SDL keeps correct when key events are
+    missed (for example when the window loses focus).\n
+    'clicked_keys' keeps the keycodes of all key presses of the frame in order, key repeats included, for text input.
+    :param track_state: keep the pressed keys in an own array that is only updated by the handled events instead of
+    viewing the SDL keyboard state, needed when the events don't come from SDL (replays)
+    """
+
+    def __init__(self, track_state: bool = False) -> None:
+        self._set_track_state(track_state)
+        # per frame edges, the indices list is used to reset only the keys that changed
+        self._clicked = bytearray(sdl2.SDL_NUM_SCANCODES)
+        self._released = bytearray(sdl2.SDL_NUM_SCANCODES)
+        self._changed: list[int] = []
+        self._scancodes: dict[int, int] = {}
+        self._modifiers = 0
+        self.clicked_keys: list[int] = []
+        self.released_keys: list[int] = []
+
+    def _set_track_state(self, track_state: bool) -> None:
+        self._track_state = track_state
+        if track_state:
+            self._pressed = np.zeros(sdl2.SDL_NUM_SCANCODES, dtype=np.uint8)
+            self._modifiers = 0
+        else:
+            numkeys = c_int()
+            state = sdl2.SDL_GetKeyboardState(numkeys)
+            self._pressed = np.ctypeslib.as_array(state, shape=(numkeys.value,))
+
+    @property
+    def active_keys(self) -> list[int]:
+        """
+        the keycodes of all keys that are held down
+        """
+        return [sdl2.SDL_GetKeyFromScancode(int(scancode)) for scancode in np.flatnonzero(self._pressed)]
+
     def _reset_keys(self) -> None:
+        for scancode in self._changed:
+            self._clicked[scancode] = 0
+            self._released[scancode] = 0
+        self._changed = []
         self.clicked_keys = []
         self.released_keys = []
-    
-    #TODO set type for key param
+
+    def _handle_event(self, event: sdl2.SDL_Event) -> None:
+        """
+        update the edges of the frame with a key event, other events are ignored
+        """
+        keysym = event.key.keysym
+        scancode = keysym.scancode
+        if event.type == sdl2.SDL_KEYDOWN:
+            self.clicked_keys.append(keysym.sym)
+            if event.key.repeat:
+                return
+            self._clicked[scancode] = 1
+            pressed = 1
+        elif event.type == sdl2.SDL_KEYUP:
+            self.released_keys.append(keysym.sym)
+            self._released[scancode] = 1
+            pressed = 0
+        else:
+            return
+        self._changed.append(scancode)
+        if self._track_state:
+            self._pressed[scancode] = pressed
+            self._modifiers = keysym.mod
+
+    def _end_frame(self) -> None:
+        if not self._track_state:
+            self._modifiers = sdl2.SDL_GetModState()
+
+    def _scancode(self, _key: Union[key, int]) -> int:
+        keycode = _key if type(_key) == int else _key.value
+        scancode = self._scancodes.get(keycode)
+        if scancode is None:
+            scancode = self._scancodes[keycode] = sdl2.SDL_GetScancodeFromKey(keycode)
+        return scancode
+
     def is_key_pressed(self, key: key) -> bool:
-        return key.value in self.active_keys
-    
+        return bool(self._pressed[self._scancode(key)])
+
     def is_key_clicked(self, key: key) -> bool:
-        return key.value in self.clicked_keys
-    
+        """
+        True in the frame the key went down, key repeats are ignored
+        """
+        return bool(self._clicked[self._scancode(key)])
+
     def is_key_released(self, key: key) -> bool:
-        return key.value in self.released_keys
+        return bool(self._released[self._scancode(key)])
+
+    def get_modifiers(self) -> int:
+        """
+        the bitmask of the active modifiers (shift, ctrl, alt, ...), test it with the values of 'keyModifier'
+        """
+        return self._modifiers
+
+    def is_modifier_active(self, modifier: keyModifier) -> bool:
+        """
+        checks if a modifier is active, keyModifier.SHIFT / CTRL / ALT / GUI accept both the left and the right key
+        """
+        return bool(self._modifiers & modifier.value)
@@ -0,0 +1,287 @@
+from math import ceil
+from typing import TYPE_CHECKING, Iterator, Union
+from ...enum import layoutDirection, layoutAlign, layoutJustify
+from ...typedef import screen_unit
+from ...messenger import Messenger
+
+if TYPE_CHECKING:
+    from ...widget.core.widget import Widget
+
+# a size is a number of pixels, a percentage of the parent like "50%" or None to use the natural size
+size = Union[screen_unit, str, None]
+
+
+def _parse_size(value: size) -> tuple[str, float] | None:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        if not value.endswith("%"):
+            Messenger.fatalError(ValueError(f"'{value}' is not a valid layout size, use a number of pixels or a percentage like '50%'"))
+        return ("%", float(value[:-1]) / 100)
+    return ("px", float(value))
+
+
+def _resolve(parsed: tuple[str, float] | None, available: float, natural: float) -> float:
+    if parsed is None:
+        return natural
+    kind, value = parsed
+    return value * available if kind == "%" else value
+
+
+class LayoutNode:
+    """
+    A node of a layout tree. Every node remembers the rect it was laid out in and only lays out its children again
+    when it was marked dirty or got a different size, a node that only moved shifts its subtree instead.\n
+    :param width: pixels, a percentage of the parent ("50%") or None for the natural size
+    :param height: pixels, a percentage of the parent ("50%") or None for the natural size
+    :param grow: share of the free space of a FlexLayout parent this node takes, 0 takes none
+    :param shrink: share of the missing space of a FlexLayout parent this node gives up when its children don't fit
+    """
+
+    def __init__(self, width: size = None, height: size = None, grow: float = 0, shrink: float = 1,
+                 min_width: screen_unit = 0, min_height: screen_unit = 0, max_width: screen_unit = float("inf"), max_height: screen_unit = float("inf")) -> None:
+        self.parent: LayoutNode | None = None
+        self.children: list[LayoutNode] = []
+        self._width = _parse_size(width)
+        self._height = _parse_size(height)
+        self.grow = grow
+        self.shrink = shrink
+        self.min_width = min_width
+        self.min_height = min_height
+        self.max_width = max_width
+        self.max_height = max_height
+
+        self._dirty = True
+        self._natural_size: tuple[float, float] | None = None
+        self.rect: tuple[float, float, float, float] | None = None  # x, y, w, h of the last layout pass
+
+    def __iter__(self) -> Iterator['LayoutNode']:
+        return iter(self.children)
+
+    def add(self, *children: 'LayoutNode') -> 'LayoutNode':
+        for child in children:
+            if child.parent is not None:
+                child.parent.remove(child)
+            child.parent = self
+            self.children.append(child)
+        self.mark_dirty()
+        return self
+
+    def remove(self, child: 'LayoutNode') -> None:
+        self.children.remove(child)
+        child.parent = None
+        self.mark_dirty()
+
+    def set_size(self, width: size = None, height: size = None) -> None:
+        self._width = _parse_size(width)
+        self._height = _parse_size(height)
+        self.mark_dirty()
+
+    def mark_dirty(self) -> None:
+        """
+        lay this node out again in the next pass, the parents are marked too because this node's size can change theirs
+        """
+        node = self
+        while node is not None:
+            node._dirty = True
+            node._natural_size = None
+            node = node.parent
+
+    def natural_size(self) -> tuple[float, float]:
+        """
+        the size the node wants without constraints, cached until the node is marked dirty
+        """
+        if self._natural_size is None:
+            self._natural_size = self._measure()
+        return self._natural_size
+
+    def _measure(self) -> tuple[float, float]:
+        return 0, 0
+
+    def _clamp(self, width: float, height: float) -> tuple[float, float]:
+        return min(max(width, self.min_width), self.max_width), min(max(height, self.min_height), self.max_height)
+
+    def layout(self, x: float, y: float, width: float, height: float) -> None:
+        """
+        place the node in a rect, skips all work when the node is clean and the rect didn't change
+        """
+        if not self._dirty and self.rect is not None:
+            old_x, old_y, old_width, old_height = self.rect
+            if (old_width, old_height) == (width, height):
+                if (old_x, old_y) != (x, y):
+                    self._shift(x - old_x, y - old_y)
+                return
+        self.rect = (x, y, width, height)
+        self._dirty = False
+        self._arrange(x, y, width, height)
+
+    def _shift(self, dx: float, dy: float) -> None:
+        x, y, width, height = self.rect
+        self.rect = (x + dx, y + dy, width, height)
+        for child in self.children:
+            child._shift(dx, dy)
+
+    def _arrange(self, x: float, y: float, width: float, height: float) -> None:
+        pass
+
+
+class LayoutItem(LayoutNode):
+    """
+    Places a widget, the natural size of the item is the size the widget had when it was added
+    """
+
+    def __init__(self, widget: 'Widget', width: size = None, height: size = None, grow: float = 0, shrink: float = 1, **limits) -> None:
+        super().__init__(width, height, grow, shrink, **limits)
+        self.widget = widget
+        self._widget_size = (widget.w, widget.h)
+
+    def _measure(self) -> tuple[float, float]:
+        return self._widget_size
+
+    def set_natural_size(self, width: screen_unit, height: screen_unit) -> None:
+        """
+        change the size the widget wants, only the layouts containing this item are laid out again
+        """
+        self._widget_size = (width, height)
+        self.mark_dirty()
+
+    def _shift(self, dx: float, dy: float) -> None:
+        super()._shift(dx, dy)
+        self._apply()
+
+    def _arrange(self, x: float, y: float, width: float, height: float) -> None:
+        self._apply()
+
+    def _apply(self) -> None:
+        x, y, width, height = (int(round(value)) for value in self.rect)
+        widget = self.widget
+        if (widget.x, widget.y, widget.w, widget.h) != (x, y, width, height):
+            widget._set_rect(x, y, width, height)
+
+
+class FlexLayout(LayoutNode):
+    """
+    Places its children in a row or column.\n
+    Children get their width (row) or height (column) first, the free space is shared by the children with grow
+    and missing space is taken from children with shrink, relative to their size.
+    :param gap: space between 2 children
+    :param padding: space between the edges and the children
+    :param align: placement of the children on the other axis
+    :param justify: placement of the children on the main axis when no child grows
+    """
+
+    def __init__(self, direction: layoutDirection = layoutDirection.horizontal, gap: screen_unit = 0, padding: screen_unit = 0,
+                 align: layoutAlign = layoutAlign.stretch, justify: layoutJustify = layoutJustify.start, **node_options) -> None:
+        super().__init__(**node_options)
+        self.direction = direction
+        self.gap = gap
+        self.padding = padding
+        self.align = align
+        self.justify = justify
+
+    def _measure(self) -> tuple[float, float]:
+        sizes = [child.natural_size() for child in self.children]
+        gaps = self.gap * max(len(sizes) - 1, 0) + self.padding * 2
+        if not sizes:
+            return gaps, self.padding * 2
+        if self.direction == layoutDirection.horizontal:
+            return sum(w for w, _ in sizes) + gaps, max(h for _, h in sizes) + self.padding * 2
+        return max(w for w, _ in sizes) + self.padding * 2, sum(h for _, h in sizes) + gaps
+
+    def _arrange(self, x: float, y: float, width: float, height: float) -> None:
+        children = self.children
+        if not children:
+            return
+        horizontal = self.direction == layoutDirection.horizontal
+        inner_main = (width if horizontal else height) - self.padding * 2
+        inner_cross = (height if horizontal else width) - self.padding * 2
+
+        # sizes on the main axis
+        mains = []
+        for child in children:
+            natural_w, natural_h = child.natural_size()
+            if horizontal:
+                mains.append(_resolve(child._width, inner_main, natural_w))
+            else:
+                mains.append(_resolve(child._height, inner_main, natural_h))
+        free = inner_main - sum(mains) - self.gap * (len(children) - 1)
+        if free > 0:
+            total_grow = sum(child.grow for child in children)
+            if total_grow > 0:
+                mains = [main + free * child.grow / total_grow for main, child in zip(mains, children)]
+                free = 0
+        elif free < 0:
+            total_shrink = sum(main * child.shrink for main, child in zip(mains, children))
+            if total_shrink > 0:
+                mains = [main + free * main * child.shrink / total_shrink for main, child in zip(mains, children)]
+                free = 0
+
+        # start position and spacing on the main axis
+        spacing = self.gap
+        offset = self.padding
+        if free > 0:
+            if self.justify == layoutJustify.center:
+                offset += free / 2
+            elif self.justify == layoutJustify.end:
+                offset += free
+            elif self.justify == layoutJustify.space_between and len(children) > 1:
+                spacing += free / (len(children) - 1)
+
+        for child, main in zip(children, mains):
+            natural_w, natural_h = child.natural_size()
+            if self.align == layoutAlign.stretch:
+                cross = _resolve(child._height if horizontal else child._width, inner_cross, inner_cross)
+            else:
+                cross = _resolve(child._height if horizontal else child._width, inner_cross, natural_h if horizontal else natural_w)
+            child_w, child_h = child._clamp(main, cross) if horizontal else child._clamp(cross, main)
+            main, cross = (child_w, child_h) if horizontal else (child_h, child_w)
+
+            cross_offset = self.padding
+            if self.align == layoutAlign.center:
+                cross_offset += (inner_cross - cross) / 2
+            elif self.align == layoutAlign.end:
+                cross_offset += inner_cross - cross
+
+            if horizontal:
+                child.layout(x + offset, y + cross_offset, child_w, child_h)
+            else:
+                child.layout(x + cross_offset, y + offset, child_w, child_h)
+            offset += main + spacing
+
+
+class GridLayout(LayoutNode):
+    """
+    Places its children in cells of equal size, filled row by row.\n
+    :param columns: the amount of columns
+    :param row_height: the height of a row, the rows share the height of the grid when not given
+    """
+
+    def __init__(self, columns: int, row_height: screen_unit | None = None, gap: screen_unit = 0, padding: screen_unit = 0, **node_options) -> None:
+        super().__init__(**node_options)
+        if columns <= 0:
+            Messenger.fatalError(ValueError("a grid layout needs at least 1 column"))
+        self.columns = columns
+        self.row_height = row_height
+        self.gap = gap
+        self.padding = padding
+
+    def _rows(self) -> int:
+        return ceil(len(self.children) / self.columns)
+
+    def _measure(self) -> tuple[float, float]:
+        rows = self._rows()
+        cell_w = max((child.natural_size()[0] for child in self.children), default=0)
+        cell_h = self.row_height if self.row_height is not None else max((child.natural_size()[1] for child in self.children), default=0)
+        return (cell_w * self.columns + self.gap * (self.columns - 1) + self.padding * 2,
+                cell_h * rows + self.gap * max(rows - 1, 0) + self.padding * 2)
+
+    def _arrange(self, x: float, y: float, width: float, height: float) -> None:
+        rows = self._rows()
+        if rows == 0:
+            return
+        cell_w = (width - self.padding * 2 - self.gap * (self.columns - 1)) / self.columns
+        cell_h = self.row_height if self.row_height is not None else (height - self.padding * 2 - self.gap * (rows - 1)) / rows
+        for i, child in enumerate(self.children):
+            row, column = divmod(i, self.columns)
+            child_w, child_h = child._clamp(cell_w, cell_h)
+            child.layout(x + self.padding + column * (cell_w + self.gap), y + self.padding + row * (cell_h + self.gap), child_w, child_h)
@@ -1,46 +1,174 @@
-from ...enum import mouseButton, mouseCursor
+from ...enum import mouseButton, mouseCursor, resourceType
 from ...typedef import screen_unit
 from .rect import Rect
 from ...core.utils.coordinate import Coordinate
 from ...messenger import Messenger
+from ...core.utils.resource_manager import ResourceManager
 import sdl2
 from sdl2.ext import load_image
-from typing import Union, Annotated
+from typing import Union, Annotated, NamedTuple
 import math
+import threading
+
+
+_BUTTONS = 8 # SDL mouse buttons are 1 based, index 0 is unused
+
+
+class MouseMotion(NamedTuple):
+    """
+    a single mouse motion event, 'timestamp' is in milliseconds since SDL was initialized
+    """
+    x: int
+    y: int
+    dx: int
+    dy: int
+    timestamp: int
+
+
+class MouseState(NamedTuple):
+    """
+    The state of the mouse for one frame, built from the events of that frame.\n
+    - pressed: buttons that are held down at the end of the frame\n
+    - clicked / released: buttons that went down / up during the frame, a button can be both when it was clicked and released within one frame\n
+    - wheel_x / wheel_y: the summed scroll amount of the frame, positive y scrolls up\n
+    - motion: every motion event of the frame in order, for drag and gesture handling
+    """
+    x: int
+    y: int
+    dx: int
+    dy: int
+    pressed: tuple[bool, ...]
+    clicked: tuple[bool, ...]
+    released: tuple[bool, ...]
+    wheel_x: float
+    wheel_y: float
+    motion: tuple[MouseMotion, ...]
 
 
 class Mouse:
     def __init__(self) -> None:
-        self.mouse_buttons_status: list[bool] = [False, False, False, False, False, False, False]
-        self.mouse_flank: list[bool] = [False, False, False, False, False, False, False]
         self._cursor = None
-  
-    def _reset_mouse_button_status(self) -> None:
-        for i in range(7):
-            self.mouse_flank[i] = False
-            
+        self._cursor_key: mouseCursor | str | None = None  # the cursor type or image path of the shown cursor
+        self._resources: ResourceManager | None = None  # set by the window
+        # SDL cursors can only be changed on the thread that handles the events, other threads leave the change for the next frame
+        self._thread = threading.get_ident()
+        self._pending_cursor: tuple | None = None  # (method, arguments)
+        # the state of the mouse is kept in these while the events of a frame are handled
+        self._pressed: list[bool] = [False] * _BUTTONS
+        self._clicked: list[bool] = [False] * _BUTTONS
+        self._released: list[bool] = [False] * _BUTTONS
+        self._wheel_x = 0.0
+        self._wheel_y = 0.0
+        self._motion: list[MouseMotion] = []
+        x, y = self._query_position()
+        self._x = x
+        self._y = y
+        self._frame_start_position = (x, y)
+        self.state: MouseState = self._snapshot()
+
+    @staticmethod
+    def _query_position() -> tuple[int, int]:
+        x = sdl2.Sint32()
+        y = sdl2.Sint32()
+        sdl2.mouse.SDL_GetMouseState(x, y)
+        return x.value, y.value
+
+    def _snapshot(self) -> MouseState:
+        start_x, start_y = self._frame_start_position
+        return MouseState(self._x, self._y, self._x - start_x, self._y - start_y, tuple(self._pressed), tuple(self._clicked),
+                          tuple(self._released), self._wheel_x, self._wheel_y, tuple(self._motion))
+
+    def _begin_frame(self) -> None:
+        if self._pending_cursor is not None:
+            method, arguments = self._pending_cursor
+            self._pending_cursor = None
+            method(*arguments)
+        for i in range(_BUTTONS):
+            self._clicked[i] = False
+            self._released[i] = False
+        self._wheel_x = 0.0
+        self._wheel_y = 0.0
+        self._motion = []
+        self._frame_start_position = (self._x, self._y)
+
+    def _handle_event(self, event: sdl2.SDL_Event) -> None:
+        """
+        update the state of the mouse with a mouse event, other events are ignored
+        """
+        event_type = event.type
+        if event_type == sdl2.SDL_MOUSEMOTION:
+            motion = event.motion
+            self._x = motion.x
+            self._y = motion.y
+            self._motion.append(MouseMotion(motion.x, motion.y, motion.xrel, motion.yrel, motion.timestamp))
+
+        elif event_type == sdl2.SDL_MOUSEBUTTONDOWN or event_type == sdl2.SDL_MOUSEBUTTONUP:
+            button = event.button
+            self._x = button.x
+            self._y = button.y
+            if button.button < _BUTTONS:
+                pressed = event_type == sdl2.SDL_MOUSEBUTTONDOWN
+                self._pressed[button.button] = pressed
+                if pressed:
+                    self._clicked[button.button] = True
+                else:
+                    self._released[button.button] = True
+
+        elif event_type == sdl2.SDL_MOUSEWHEEL:
+            wheel = event.wheel
+            direction = -1 if wheel.direction == sdl2.SDL_MOUSEWHEEL_FLIPPED else 1
+            self._wheel_x += wheel.x * direction
+            self._wheel_y += wheel.y * direction
+
+    def _end_frame(self) -> None:
+        self.state = self._snapshot()
+
+    def _check_if_int(self, mouse_button: Union[int, mouseButton]) -> int:
+        if type(mouse_button) == int:
+            return mouse_button
+        return mouse_button._value_ # skips the descriptor behind Enum.value, this runs for every click query of every widget
+    
     def _pos_flank(self, mouse_button: mouseButton) -> bool:
-        mouse_button = self._check_if_int(mouse_button)
-        return self.mouse_flank[mouse_button] and self.mouse_buttons_status[mouse_button]
+        return self.state.clicked[self._check_if_int(mouse_button)]
     
     def _neg_flank(self, mouse_button: mouseButton) -> bool:
-        mouse_button = self._check_if_int(mouse_button)
-        return self.mouse_flank[mouse_button] and not self.mouse_buttons_status[mouse_button]
+        return self.state.released[self._check_if_int(mouse_button)]
     
-    def _pressed(self, mouse_button: mouseButton) -> bool:
-        mouse_button = self._check_if_int(mouse_button)
-        return self.mouse_buttons_status[mouse_button]
-    
-    def _check_if_int(self, mouse_button: Union[int, mouseButton]) -> int:
-        if type(mouse_button) == int:
-            return mouse_button
-        return mouse_button.value
+    def _pressed_button(self, mouse_button: mouseButton) -> bool:
+        return self.state.pressed[self._check_if_int(mouse_button)]
     
+    def get_state(self) -> MouseState:
+        """
+        The immutable state of the mouse for the current frame
+        """
+        return self.state
+
     def get_position(self) -> Annotated[tuple, 2]:
-        x = sdl2.Sint32()
-        y = sdl2.Sint32()
-        sdl2.mouse.SDL_GetMouseState(x, y)
-        return x.value, y.value
+        """
+        The position of the mouse in the window at the start of the frame
+        """
+        state = self.state
+        return state.x, state.y
+
+    def get_motion(self) -> Annotated[tuple, 2]:
+        """
+        How far the mouse moved during the last frame
+        """
+        state = self.state
+        return state.dx, state.dy
+
+    def get_motion_history(self) -> tuple[MouseMotion, ...]:
+        """
+        All motion events of the last frame in order
+        """
+        return self.state.motion
+
+    def get_wheel(self) -> Annotated[tuple, 2]:
+        """
+        The horizontal and vertical scroll amount of the last frame
+        """
+        state = self.state
+        return state.wheel_x, state.wheel_y
         
     def get_absolute_position(self) -> Annotated[tuple, 2]:
         x_global = sdl2.Sint32()
@@ -51,7 +179,8 @@ class Mouse:
     
     # area detection
     def is_mouse_over(self, rect: Rect) -> bool:
-        return rect.point_collision(*self.get_position())
+        state = self.state
+        return rect.collide_with_point(state.x, state.y)
     
     def is_mouse_in_area(self, topCord: Coordinate, bottomCord: Coordinate) -> bool:
         size = (abs(bottomCord[0] - topCord[0]), abs(bottomCord[1] - topCord[1]))
@@ -62,10 +191,9 @@ class Mouse:
         raise NotImplementedError
     
     def is_mouse_in_circle(self, center: Coordinate, radius: int) -> bool:
-        if not isinstance(center, Coordinate):
-            center = Coordinate(*center)
-        dx, dy = center.difference(self.get_position())
-        return math.hypot(dx, dy) <= radius
+        cx, cy = (center.x, center.y) if isinstance(center, Coordinate) else center
+        state = self.state
+        return math.hypot(cx - state.x, cy - state.y) <= radius
 
 
 
@@ -122,7 +250,7 @@ class Mouse:
     
     # hold detection
     def is_mouse_pressing(self, mouse_button: mouseButton = mouseButton.left) -> bool:
-        return self._pressed(mouse_button)
+        return self._pressed_button(mouse_button)
     
     def is_mouse_pressing_in_rect(self, rect: Rect, mouse_button: mouseButton = mouseButton.left) -> bool:
         return self.is_mouse_over(rect) and self.is_mouse_pressing(mouse_button)
@@ -135,7 +263,7 @@ class Mouse:
     
     #? not variations
     def is_mouse_pressing_outside_rect(self, rect: Rect, mouse_button: mouseButton = mouseButton.left) -> bool:
-        return not self.is_mouse_over(rect) and self._pressed(mouse_button)
+        return not self.is_mouse_over(rect) and self.is_mouse_pressing(mouse_button)
     
     def is_mouse_pressing_outside_polygon(self, polygon: Union[list[Union[list, tuple]], tuple[Union[list, tuple]]], mouse_button: mouseButton = mouseButton.left) -> bool:
         return not self.is_mouse_in_polygon(polygon) and self.is_mouse_pressing(mouse_button)
@@ -146,13 +274,14 @@ class Mouse:
         
     # scrolling detection
     def isScrolledUp(self) -> bool:
-        return self._pressed(mouseButton.scroll_up)
+        return self.state.wheel_y > 0
     
     def isScrolledDown(self) -> bool:
-        return self._pressed(mouseButton.scroll_down)
+        return self.state.wheel_y < 0
     
     def isScrolled(self) -> bool:
-        return self._pressed(mouseButton.scroll_up) or self._pressed(mouseButton.scroll_down)
+        state = self.state
+        return state.wheel_y != 0 or state.wheel_x != 0
 
 
     def set_position(self, x: int, y: int) -> None:
@@ -164,15 +293,17 @@ class Mouse:
     def set_cursor(self, cursor_type: mouseCursor) -> None:
         """
         Sets the mouse cursor to a system cursor.
+        Every system cursor is created once and reused, so changing the cursor every frame doesn't allocate.
         :param cursor_type: Type of cursor fount in the mouseCursor enum.
         """
-        cursor = sdl2.SDL_CreateSystemCursor(cursor_type.value)
+        if threading.get_ident() != self._thread:
+            self._pending_cursor = (self.set_cursor, (cursor_type,))
+            return
+        cursor = self._get_resources().system_cursor(cursor_type)
         if cursor:
-            sdl2.SDL_SetCursor(cursor)
-            if self._cursor != None:
-                sdl2.SDL_FreeCursor(self._cursor)
-            self._cursor = cursor
-            
+            if self._cursor_key != cursor_type:
+                sdl2.SDL_SetCursor(cursor)
+                self._replace_cursor(cursor, cursor_type)
         else:
             Messenger.warning("Failed to set system cursor.")
 
@@ -184,21 +315,37 @@ class Mouse:
         :param hot_x: Hotspot X coordinate (focus point of the cursor).
         :param hot_y: Hotspot Y coordinate (focus point of the cursor).
         """
+        if threading.get_ident() != self._thread:
+            self._pending_cursor = (self.set_custom_cursor, (image_path, hot_x, hot_y))
+            return
         surface = load_image(image_path)
         if not surface:
             Messenger.warning("Failed to load cursor image.")
             return
 
-        cursor = sdl2.SDL_CreateColorCursor(surface, hot_x, hot_y)
+        cursor = sdl2.SDL_CreateColorCursor(surface, int(hot_x), int(hot_y))
         if cursor:
-            # Set the custom cursor
+            # the cursor is freed when it is replaced, not while it is shown
+            self._get_resources().track(cursor, resourceType.cursor, self)
             sdl2.SDL_SetCursor(cursor)
-            if self._cursor != None:
-                sdl2.SDL_FreeCursor(self._cursor)
-            self._cursor = cursor
+            self._replace_cursor(cursor, image_path)
         else:
             Messenger.warning("Failed to set custom cursor.")
 
-        # Clean up
-        sdl2.SDL_FreeCursor(cursor)
-        sdl2.SDL_FreeSurface(surface)
\ No newline at end of file
+        # the cursor has its own copy of the image
+        sdl2.SDL_FreeSurface(surface)
+
+    def _replace_cursor(self, cursor: sdl2.SDL_Cursor, key: mouseCursor | str) -> None:
+        """
+        remember the cursor that is shown, the previous custom cursor is freed, system cursors stay cached
+        """
+        if self._cursor is not None and not isinstance(self._cursor_key, mouseCursor):
+            self._get_resources().release(self._cursor)
+        self._cursor = cursor
+        self._cursor_key = key
+
+    def _get_resources(self) -> ResourceManager:
+        # a mouse without a window owns its cursors itself
+        if self._resources is None:
+            self._resources = ResourceManager()
+        return self._resources
\ No newline at end of file
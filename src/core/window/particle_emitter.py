@@ -0,0 +1,149 @@
+import numpy as np
+from time import perf_counter
+from typing import TYPE_CHECKING, Union
+from ...typedef import screen_unit, RGBAvalue, RGBvalue
+from ...color import Color
+from ...messenger import Messenger
+
+if TYPE_CHECKING:
+    from .window import Window
+    from .texture_atlas import TextureAtlas
+
+
+def _rgba(color: Union[RGBvalue, RGBAvalue]) -> np.ndarray:
+    return np.array(Color.pack(color), dtype=np.float32)
+
+
+class ParticleEmitter:
+    """
+    Emits short-lived particles and draws all of them with a single draw call.\n
+    The particles are kept in preallocated arrays (position, velocity, age and lifetime), the arrays are updated
+    for all particles at once. The slots of dead particles are pushed on a free stack and reused by new particles,
+    so emitting doesn't allocate. Particles fade from 'color' to 'end_color' and scale from 'size' to 'end_size' over their life.
+    ```
+    sparks = ParticleEmitter(window, 400, 300, rate=500, gravity=(0, 300))
+    while True:
+        window.event_handler()
+        sparks.update()
+        sparks.draw()
+    ```
+    :param capacity: the maximum amount of living particles, emitting more while full is skipped
+    :param rate: particles emitted per second, 0 only emits with 'burst'
+    :param lifetime: (min, max) lifetime of a particle in seconds
+    :param speed: (min, max) start speed in pixels per second
+    :param angle: (min, max) direction of the start velocity in degrees, 0 is to the right and 90 down
+    :param gravity: acceleration of all particles in pixels per second squared
+    :param atlas: optional texture atlas, the particles show the atlas image 'sprite' instead of a square
+    """
+
+    def __init__(self, window: 'Window', x: screen_unit, y: screen_unit, capacity: int = 2048, rate: float = 100,
+                 lifetime: tuple[float, float] = (0.5, 1.5), speed: tuple[float, float] = (50, 150), angle: tuple[float, float] = (0, 360),
+                 gravity: tuple[float, float] = (0, 0), size: screen_unit = 4, end_size: screen_unit = 0,
+                 color: Union[RGBvalue, RGBAvalue] = Color.WHITE, end_color: Union[RGBvalue, RGBAvalue] = (255, 255, 255, 0),
+                 atlas: Union['TextureAtlas', None] = None, sprite: str | None = None, seed: int | None = None) -> None:
+        if capacity <= 0:
+            Messenger.fatalError(ValueError("the capacity of a particle emitter has to be positive"))
+        if atlas is not None and sprite not in atlas:
+            Messenger.fatalError(KeyError(f"the atlas has no image named '{sprite}'"))
+        self.window = window
+        self.x = x
+        self.y = y
+        self.rate = rate
+        self.lifetime = lifetime
+        self.speed = speed
+        self.angle = angle
+        self.gravity = gravity
+        self.size = size
+        self.end_size = end_size
+        self.set_colors(color, end_color)
+        self.atlas = atlas
+        self.sprite = sprite
+        self.emitting = True
+        self._rng = np.random.default_rng(seed)
+        self._emit_remainder = 0.0
+        self._last_update: float | None = None
+
+        # particle pool, a structure of arrays
+        self._capacity = capacity
+        self._positions = np.zeros((capacity, 2), dtype=np.float32)
+        self._velocities = np.zeros((capacity, 2), dtype=np.float32)
+        self._ages = np.zeros(capacity, dtype=np.float32)
+        self._lifetimes = np.ones(capacity, dtype=np.float32)
+        self._alive = np.zeros(capacity, dtype=bool)
+        # indices of the free slots, the top of the stack is at _free_count - 1
+        self._free = np.arange(capacity - 1, -1, -1, dtype=np.int32)
+        self._free_count = capacity
+
+    def set_position(self, x: screen_unit, y: screen_unit) -> None:
+        self.x = x
+        self.y = y
+
+    def set_colors(self, color: Union[RGBvalue, RGBAvalue], end_color: Union[RGBvalue, RGBAvalue]) -> None:
+        self._start_color = _rgba(color)
+        self._end_color = _rgba(end_color)
+
+    def get_particle_count(self) -> int:
+        return self._capacity - self._free_count
+
+    def clear(self) -> None:
+        """
+        remove all particles
+        """
+        self._alive[:] = False
+        self._free[:] = np.arange(self._capacity - 1, -1, -1, dtype=np.int32)
+        self._free_count = self._capacity
+
+    def burst(self, count: int) -> None:
+        """
+        emit 'count' particles at once at the position of the emitter
+        """
+        count = min(count, self._free_count)
+        if count <= 0:
+            return
+        self._free_count -= count
+        slots = self._free[self._free_count:self._free_count + count]
+        rng = self._rng
+        angles = np.radians(rng.uniform(*self.angle, count))
+        speeds = rng.uniform(*self.speed, count)
+        self._positions[slots] = (self.x, self.y)
+        self._velocities[slots, 0] = np.cos(angles) * speeds
+        self._velocities[slots, 1] = np.sin(angles) * speeds
+        self._ages[slots] = 0
+        self._lifetimes[slots] = rng.uniform(*self.lifetime, count)
+        self._alive[slots] = True
+
+    def update(self, delta_time: float | None = None) -> None:
+        """
+        emit new particles and move all particles, 'delta_time' is the time since the last update in seconds
+        """
+        if delta_time is None:
+            now = perf_counter()
+            delta_time = 0.0 if self._last_update is None else now - self._last_update
+            self._last_update = now
+
+        # dead slots are updated too, that is cheaper than selecting the living ones and they are reset when reused
+        self._velocities += np.asarray(self.gravity, dtype=np.float32) * delta_time
+        self._positions += self._velocities * delta_time
+        self._ages += delta_time
+
+        alive = self._alive
+        dead = np.flatnonzero(alive & (self._ages >= self._lifetimes))
+        if len(dead):
+            alive[dead] = False
+            self._free[self._free_count:self._free_count + len(dead)] = dead
+            self._free_count += len(dead)
+
+        if self.emitting and self.rate > 0:
+            self._emit_remainder += self.rate * delta_time
+            count = int(self._emit_remainder)
+            self._emit_remainder -= count
+            self.burst(count)
+
+    def draw(self) -> None:
+        slots = np.flatnonzero(self._alive)
+        if len(slots) == 0:
+            return
+        t = (self._ages[slots] / self._lifetimes[slots])[:, None]
+        colors = (self._start_color + (self._end_color - self._start_color) * t).astype(np.uint8)
+        sizes = self.size + (self.end_size - self.size) * t[:, 0]
+        self.window.draw.quads(self._positions[slots], sizes, colors, self.atlas, self.sprite)
@@ -0,0 +1,162 @@
+from typing import Iterable, Union
+import numpy as np
+from ...typedef import screen_unit
+from .rect import Rect
+
+# rows of the all-pairs overlap test that are compared at once, bounds the memory of the (rows, N) masks
+_PAIR_BLOCK = 1024
+
+
+class RectArray:
+    """
+    Many rects in a single (N, 4) NumPy array of x, y, w, h, for collision tests and geometry on all rects at once.\n
+    Collision rules are the same as 'Rect': points on the edge are inside a rect, rects that only touch don't collide
+    and rects without area never collide with other rects.
+    ```
+    enemies = RectArray([(10, 10, 20, 20), (50, 50, 20, 20)])
+    hit = enemies.collide_with_point(*window.mouse.get_position())  # bool mask
+    enemies.translate(0, 5)
+    window.draw.rectangles(enemies, Color.RED)
+    ```
+    """
+
+    def __init__(self, rects: Union[np.ndarray, Iterable[Union[Rect, tuple]]] = (), dtype: np.dtype = np.int32) -> None:
+        if isinstance(rects, np.ndarray):
+            data = rects.astype(dtype, copy=False)
+        else:
+            data = np.array([rect.unpack() if isinstance(rect, Rect) else rect for rect in rects], dtype=dtype)
+        self.data: np.ndarray = data.reshape(-1, 4)
+
+    @classmethod
+    def zeros(cls, count: int, dtype: np.dtype = np.int32) -> 'RectArray':
+        return cls(np.zeros((count, 4), dtype=dtype))
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index) -> Union[Rect, 'RectArray']:
+        """
+        an integer index returns a new 'Rect', a slice, index array or bool mask returns a new 'RectArray'
+        """
+        if isinstance(index, (int, np.integer)):
+            return Rect(*(int(value) for value in self.data[index]))
+        return RectArray(self.data[index])
+
+    def __setitem__(self, index, rect: Union[Rect, tuple, np.ndarray]) -> None:
+        self.data[index] = rect.unpack() if isinstance(rect, Rect) else rect
+
+    def __iter__(self):
+        for i in range(len(self.data)):
+            yield self[i]
+
+    def to_rects(self) -> list[Rect]:
+        return list(self)
+
+    # columns, these are views so writing to them changes the rects
+    @property
+    def x(self) -> np.ndarray:
+        return self.data[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.data[:, 1]
+
+    @property
+    def w(self) -> np.ndarray:
+        return self.data[:, 2]
+
+    @property
+    def h(self) -> np.ndarray:
+        return self.data[:, 3]
+
+    def _edges(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        left, top, right and bottom of every rect, negative sizes are handled like 'Rect.collide_with_point'
+        """
+        x, y, w, h = self.data.T
+        return np.minimum(x, x + w), np.minimum(y, y + h), np.maximum(x, x + w), np.maximum(y, y + h)
+
+    ##############
+    # collisions #
+    ##############
+    def collide_with_point(self, x: screen_unit, y: screen_unit) -> np.ndarray:
+        """
+        bool mask of the rects that contain the point
+        """
+        left, top, right, bottom = self._edges()
+        return (left <= x) & (x <= right) & (top <= y) & (y <= bottom)
+
+    def collide_with_rect(self, rect: Union[Rect, tuple]) -> np.ndarray:
+        """
+        bool mask of the rects that overlap the rect
+        """
+        x, y, w, h = rect.unpack() if isinstance(rect, Rect) else rect
+        if w <= 0 or h <= 0:
+            return np.zeros(len(self.data), dtype=bool)
+        data = self.data
+        return (data[:, 2] > 0) & (data[:, 3] > 0) & (data[:, 0] < x + w) & (x < data[:, 0] + data[:, 2]) & \
+               (data[:, 1] < y + h) & (y < data[:, 1] + data[:, 3])
+
+    def collide_with_rects(self, other: 'RectArray') -> np.ndarray:
+        """
+        (len(self), len(other)) bool matrix, [i, j] is True when rect i of this array overlaps rect j of the other array
+        """
+        a = self.data[:, None, :]
+        b = other.data[None, :, :]
+        return (a[..., 2] > 0) & (a[..., 3] > 0) & (b[..., 2] > 0) & (b[..., 3] > 0) & \
+               (a[..., 0] < b[..., 0] + b[..., 2]) & (b[..., 0] < a[..., 0] + a[..., 2]) & \
+               (a[..., 1] < b[..., 1] + b[..., 3]) & (b[..., 1] < a[..., 1] + a[..., 3])
+
+    def colliding_pairs(self) -> np.ndarray:
+        """
+        (K, 2) array with the index pairs (i < j) of all rects in this array that overlap each other
+        """
+        pairs = []
+        for start in range(0, len(self.data), _PAIR_BLOCK):
+            block = RectArray(self.data[start:start + _PAIR_BLOCK]).collide_with_rects(self)
+            rows, columns = np.nonzero(block)
+            rows += start
+            upper = rows < columns
+            pairs.append(np.column_stack((rows[upper], columns[upper])))
+        if not pairs:
+            return np.zeros((0, 2), dtype=np.intp)
+        return np.concatenate(pairs)
+
+    ############
+    # geometry #
+    ############
+    def union(self) -> Rect:
+        """
+        the smallest rect that contains all rects
+        """
+        if len(self.data) == 0:
+            raise ValueError("the union of an empty RectArray is undefined")
+        left, top, right, bottom = self._edges()
+        x1, y1, x2, y2 = left.min(), top.min(), right.max(), bottom.max()
+        return Rect(int(x1), int(y1), int(x2 - x1), int(y2 - y1))
+
+    def translate(self, dx: Union[screen_unit, np.ndarray], dy: Union[screen_unit, np.ndarray]) -> None:
+        """
+        move all rects, dx and dy can also be arrays with a value per rect
+        """
+        self.data[:, 0] += dx
+        self.data[:, 1] += dy
+
+    def expand(self, expansion: Union[screen_unit, np.ndarray]) -> None:
+        """
+        expand all sides of every rect, like 'Rect.expand'
+        """
+        self.data[:, :2] -= np.asarray(expansion)[..., None] // 2 if np.ndim(expansion) else expansion // 2
+        self.data[:, 2:] += np.asarray(expansion)[..., None] if np.ndim(expansion) else expansion
+
+    def shrink(self, shrinkage: Union[screen_unit, np.ndarray]) -> None:
+        self.expand(-np.asarray(shrinkage) if np.ndim(shrinkage) else -shrinkage)
+
+    def abs(self) -> None:
+        """
+        Correct negative widths and heights to positive values
+        """
+        for position, size in ((0, 2), (1, 3)):
+            negative = self.data[:, size] < 0
+            self.data[negative, position] += self.data[negative, size]
+            self.data[negative, size] *= -1
@@ -0,0 +1,109 @@
+from bisect import bisect_left, bisect_right
+from itertools import count
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    from ...widget.core.widget import Widget
+
+# an area that is split in more pieces than this is treated as visible, to bound the cost of a single check
+_MAX_UNCOVERED_PIECES = 32
+
+
+class RenderList:
+    """
+    Keeps the widgets of a window sorted from back to front on (layer, z-index, insertion order).\n
+    Inserting and removing a widget keeps the list sorted, it is never sorted as a whole.
+    """
+
+    def __init__(self) -> None:
+        self._keys: list[tuple[int, int, int]] = []
+        self._widgets: list['Widget'] = []
+        self._insertion_counter = count()
+
+    def __len__(self) -> int:
+        return len(self._widgets)
+
+    def __iter__(self) -> Iterator['Widget']:
+        return iter(self._widgets)
+
+    def __contains__(self, widget: 'Widget') -> bool:
+        key = getattr(widget, "_render_key", None)
+        if key is None:
+            return False
+        index = bisect_left(self._keys, key)
+        return index < len(self._keys) and self._keys[index] == key
+
+    def insert(self, widget: 'Widget') -> None:
+        """
+        insert a widget on top of the widgets with the same layer and z-index
+        """
+        key = (widget._layer, widget._z_index, next(self._insertion_counter))
+        widget._render_key = key
+        index = bisect_right(self._keys, key)
+        self._keys.insert(index, key)
+        self._widgets.insert(index, widget)
+
+    def remove(self, widget: 'Widget') -> None:
+        if widget not in self:
+            raise ValueError(f"{widget} is not in the render list")
+        index = bisect_left(self._keys, widget._render_key)
+        del self._keys[index]
+        del self._widgets[index]
+        widget._render_key = None
+
+    def reorder(self, widget: 'Widget') -> None:
+        """
+        move a widget to the position of its current layer and z-index
+        """
+        self.remove(widget)
+        self.insert(widget)
+
+    def visible_widgets(self, viewport_width: float, viewport_height: float) -> tuple[list['Widget'], int]:
+        """
+        The widgets that need to be drawn from back to front and the amount of culled widgets.\n
+        A widget is culled when it is outside the viewport or fully covered by opaque widgets above it.
+        """
+        visible = []
+        occluders: list[tuple[float, float, float, float]] = []
+        culled = 0
+        for widget in reversed(self._widgets):
+            area = (widget.x, widget.y, widget.x + widget.w, widget.y + widget.h)
+            if area[2] < 0 or area[0] > viewport_width or area[3] < 0 or area[1] > viewport_height or _is_covered(area, occluders):
+                culled += 1
+                continue
+            visible.append(widget)
+            if widget._is_opaque():
+                occluders.append(area)
+        visible.reverse()
+        return visible, culled
+
+
+def _is_covered(area: tuple[float, float, float, float], occluders: list[tuple[float, float, float, float]]) -> bool:
+    """
+    checks if the union of the occluders covers the area by subtracting every occluder from the uncovered pieces of the area
+    """
+    pieces = [area]
+    for ox1, oy1, ox2, oy2 in occluders:
+        uncovered = []
+        for piece in pieces:
+            x1, y1, x2, y2 = piece
+            if ox1 >= x2 or ox2 <= x1 or oy1 >= y2 or oy2 <= y1:
+                uncovered.append(piece)
+                continue
+            # split the uncovered part of the piece in up to 4 rects
+            if oy1 > y1:
+                uncovered.append((x1, y1, x2, oy1))
+            if oy2 < y2:
+                uncovered.append((x1, oy2, x2, y2))
+            top = max(y1, oy1)
+            bottom = min(y2, oy2)
+            if ox1 > x1:
+                uncovered.append((x1, top, ox1, bottom))
+            if ox2 < x2:
+                uncovered.append((ox2, top, x2, bottom))
+        if not uncovered:
+            return True
+        if len(uncovered) > _MAX_UNCOVERED_PIECES:
+            return False
+        pieces = uncovered
+    return False
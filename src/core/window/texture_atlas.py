@@ -0,0 +1,232 @@
+import os
+import json
+import sdl2
+import sdl2.sdlimage
+from functools import partial
+from typing import TYPE_CHECKING, Callable, NamedTuple
+from ...core.utils.skyline_packer import SkylinePacker
+from .frame_pipeline import DeferredTexture, current_pipeline
+from ...messenger import Messenger
+from ...enum import resourceType
+
+if TYPE_CHECKING:
+    from .window import Window
+
+
+class AtlasRegion(NamedTuple):
+    page: int
+    x: int
+    y: int
+    w: int
+    h: int
+
+
+class _AtlasPage:
+    """
+    One texture of an atlas with the surface it is built on, the texture is updated when the surface changed
+    """
+
+    def __init__(self, surface: sdl2.SDL_Surface, packer: SkylinePacker | None) -> None:
+        self.surface = surface
+        self.packer = packer  # None for pages loaded from a file, they can't take more images
+        self.texture: sdl2.SDL_Texture | None = None
+        self.dirty = True
+        self.uploads: list[DeferredTexture] = []  # copies of the surface a pipelined window hasn't uploaded yet
+
+    def get_texture(self) -> sdl2.SDL_Texture | None:
+        return self.texture
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self.surface.contents.w, self.surface.contents.h
+
+
+def _load_surface(path: str) -> sdl2.SDL_Surface:
+    loaded = sdl2.sdlimage.IMG_Load(path.encode())
+    if not loaded:
+        Messenger.fatalError(OSError(f"failed to load image '{path}': {sdl2.sdlimage.IMG_GetError().decode()}"))
+    surface = sdl2.SDL_ConvertSurfaceFormat(loaded, sdl2.SDL_PIXELFORMAT_ARGB8888, 0)
+    sdl2.SDL_FreeSurface(loaded)
+    return surface
+
+
+class TextureAtlas:
+    """
+    Packs many small images into a few large textures, so sprites and icons share a texture.\n
+    Sprites of the same atlas page can be drawn with a single draw call by 'Draw.sprites'.
+    Images are packed at runtime with 'add', or an atlas saved with 'save' is loaded with 'TextureAtlas.load'
+    ```
+    icons = TextureAtlas(window)
+    icons.add("play", "icons/play.png")
+    icons.add("stop", "icons/stop.png")
+    window.draw.sprites(icons, ["play", "stop"], [(10, 10, 16, 16), (30, 10, 16, 16)])
+    ```
+    :param page_size: width and height of a page texture
+    :param padding: empty pixels around every image, prevents neighbours bleeding in when sprites are scaled
+    """
+
+    def __init__(self, window: 'Window', page_size: int = 1024, padding: int = 1) -> None:
+        self._window = window
+        self.page_size = page_size
+        self.padding = padding
+        self._pages: list[_AtlasPage] = []
+        self._regions: dict[str, AtlasRegion] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._regions
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    def get(self, name: str) -> AtlasRegion:
+        return self._regions[name]
+
+    def names(self) -> list[str]:
+        return list(self._regions)
+
+    def get_page_count(self) -> int:
+        return len(self._pages)
+
+    def get_page_size(self, page: int) -> tuple[int, int]:
+        return self._pages[page].size
+
+    ###########
+    # packing #
+    ###########
+    def add(self, name: str, path: str) -> AtlasRegion:
+        """
+        pack an image file into the atlas under a name
+        """
+        surface = _load_surface(path)
+        try:
+            return self.add_surface(name, surface)
+        finally:
+            sdl2.SDL_FreeSurface(surface)
+
+    def add_surface(self, name: str, surface: sdl2.SDL_Surface) -> AtlasRegion:
+        """
+        copy a surface into the atlas under a name, the surface is not freed
+        """
+        if name in self._regions:
+            Messenger.fatalError(KeyError(f"the atlas already has an image named '{name}'"))
+        width, height = surface.contents.w, surface.contents.h
+        padded_width, padded_height = width + self.padding * 2, height + self.padding * 2
+        if padded_width > self.page_size or padded_height > self.page_size:
+            Messenger.fatalError(ValueError(f"image '{name}' ({width}x{height}) doesn't fit on an atlas page of {self.page_size}x{self.page_size}"))
+
+        for index, page in enumerate(self._pages):
+            if page.packer is not None and (position := page.packer.insert(padded_width, padded_height)) is not None:
+                break
+        else:
+            index, page = len(self._pages), self._new_page()
+            position = page.packer.insert(padded_width, padded_height)
+
+        x, y = position[0] + self.padding, position[1] + self.padding
+        sdl2.SDL_SetSurfaceBlendMode(surface, sdl2.SDL_BLENDMODE_NONE)
+        sdl2.SDL_BlitSurface(surface, None, page.surface, sdl2.SDL_Rect(x, y, width, height))
+        page.dirty = True
+        region = AtlasRegion(index, x, y, width, height)
+        self._regions[name] = region
+        return region
+
+    def _new_page(self) -> _AtlasPage:
+        surface = sdl2.SDL_CreateRGBSurfaceWithFormat(0, self.page_size, self.page_size, 32, sdl2.SDL_PIXELFORMAT_ARGB8888)
+        self._window.resources.track(surface, resourceType.surface, self)
+        page = _AtlasPage(surface, SkylinePacker(self.page_size, self.page_size))
+        self._pages.append(page)
+        return page
+
+    ############
+    # textures #
+    ############
+    def _get_texture(self, page_index: int) -> sdl2.SDL_Texture:
+        """
+        the texture of a page, images added since the last draw are uploaded first
+        """
+        page = self._pages[page_index]
+        if page.dirty:
+            self._upload_page(page, page.surface)
+            page.dirty = False
+        return page.texture
+
+    def _frame_texture(self, page_index: int) -> sdl2.SDL_Texture | Callable[[], sdl2.SDL_Texture | None]:
+        """
+        the texture of a page for a draw, on the worker thread of a pipelined window a callable that returns the texture
+        when the frame is submitted. The worker keeps adding images while the main thread submits, so a changed page is
+        copied and the copy is uploaded before the frame is submitted.
+        """
+        pipeline = current_pipeline()
+        if pipeline is None:
+            return self._get_texture(page_index)
+        page = self._pages[page_index]
+        if not page.dirty:
+            return page.get_texture
+        page.dirty = False
+        upload = pipeline.defer_texture(sdl2.SDL_DuplicateSurface(page.surface), partial(self._create_page_texture, page))
+        page.uploads = [pending for pending in page.uploads if pending._surface is not None]
+        page.uploads.append(upload)
+        return upload
+
+    def _create_page_texture(self, page: _AtlasPage, surface: sdl2.SDL_Surface) -> sdl2.SDL_Texture:
+        """
+        upload a copy of a page surface, the copy is freed
+        """
+        self._upload_page(page, surface)
+        sdl2.SDL_FreeSurface(surface)
+        return page.texture
+
+    def _upload_page(self, page: _AtlasPage, surface: sdl2.SDL_Surface) -> None:
+        contents = surface.contents
+        if page.texture is None:
+            page.texture = sdl2.SDL_CreateTexture(self._window._renderer.sdlrenderer, sdl2.SDL_PIXELFORMAT_ARGB8888,
+                                                  sdl2.SDL_TEXTUREACCESS_STATIC, contents.w, contents.h)
+            sdl2.SDL_SetTextureBlendMode(page.texture, sdl2.SDL_BLENDMODE_BLEND)
+            self._window.resources.track(page.texture, resourceType.texture, self)
+        sdl2.SDL_UpdateTexture(page.texture, None, contents.pixels, contents.pitch)
+        self._window.stats.texture_uploads += 1
+
+    def destroy(self) -> None:
+        """
+        free the textures and surfaces of all pages, the atlas is empty afterwards\n
+        Frames that are already made keep drawing the pages, a pipelined window frees them after those frames are shown
+        """
+        for page in self._pages:
+            for upload in page.uploads:
+                upload.cancel(self._window.resources)
+        self._window.resources.release_owner(self)
+        self._pages = []
+        self._regions = {}
+
+    ###############
+    # atlas files #
+    ###############
+    def save(self, path: str) -> None:
+        """
+        save the atlas as a JSON index at 'path' with a PNG per page next to it
+        """
+        directory, file_name = os.path.split(path)
+        stem = os.path.splitext(file_name)[0]
+        page_files = []
+        for index, page in enumerate(self._pages):
+            page_file = f"{stem}_{index}.png"
+            if sdl2.sdlimage.IMG_SavePNG(page.surface, os.path.join(directory, page_file).encode()) != 0:
+                Messenger.fatalError(OSError(f"failed to save atlas page '{page_file}': {sdl2.sdlimage.IMG_GetError().decode()}"))
+            page_files.append(page_file)
+        with open(path, "w") as file:
+            json.dump({"pages": page_files, "sprites": {name: list(region) for name, region in self._regions.items()}}, file)
+
+    @classmethod
+    def load(cls, window: 'Window', path: str, padding: int = 1) -> 'TextureAtlas':
+        """
+        load an atlas saved with 'save', images added later are packed on new pages
+        """
+        with open(path) as file:
+            index = json.load(file)
+        if not isinstance(index, dict) or "pages" not in index or "sprites" not in index:
+            Messenger.fatalError(ValueError(f"'{path}' is not a texture atlas index, 'pages' or 'sprites' is missing"))
+        directory = os.path.dirname(path)
+        surfaces = [_load_surface(os.path.join(directory, page_file)) for page_file in index["pages"]]
+        atlas = cls(window, max((surface.contents.w for surface in surfaces), default=1024), padding)
+        atlas._pages = [_AtlasPage(window.resources.track(surface, resourceType.surface, atlas), None) for surface in surfaces]
+        atlas._regions = {name: AtlasRegion(*region) for name, region in index["sprites"].items()}
+        return atlas
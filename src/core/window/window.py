@@ -1,12 +1,27 @@
 import sdl2
 import sdl2.ext
+from ctypes import byref
+from time import perf_counter
 from typing import Any, Callable, TYPE_CHECKING
 from ...typedef import screen_unit, RGBAvalue, RGBvalue
+from ...enum import presentMode
+from ...core.handler.fps_counter import FPSCounter
+from ...core.handler.animator import Animator
+from ...core.utils.frame_stats import FrameStats
+from ...core.utils.latency_tracker import LatencyTracker
+from ...core.utils.widget_costs import WidgetCosts
+from ...core.utils.resource_manager import ResourceManager, shared_resources
 from ...core.window.event import Event
 from ...core.window.keyboard import Keyboard
 from ...core.window.mouse import Mouse
 from ...core.utils.screenunits import screen_units
 from ...core.window.draw import Draw
+from ...core.window.frame_pipeline import FramePipeline, current_pipeline
+from ...core.window.render_list import RenderList
+from ...core.utils.spatial_grid import SpatialGrid
+from ...core.utils.slot_map import SlotMap
+from ...core.utils.cache.texture_cache import TextureCache
+from ...core.window.layout import LayoutNode
 from ... import data, Color
 from ...messenger import Messenger
 import sys
@@ -17,9 +32,22 @@ if TYPE_CHECKING:
 
 class Window:
     """
-    Create a window to draw on and take events from. Multiple windows can be created
+    Create a window to draw on and take events from. Multiple windows can be created\n
+    The present mode decides how frames are paced:\n
+    - immediate: frames are presented directly and the clock sleeps to reach the fps\n
+    - vsync: frames are synced to the display refresh rate, the fps is ignored\n
+    - adaptive: like vsync, but frames that miss the refresh are presented immediately instead of waiting for the next one, the fps is ignored too\n
+    A resizable window lays out the widgets of its layout ('set_layout') again every frame its size changes.\n
+    A frame is presented at the start of the next 'event_handler' call, unless 'present' was already called at the end of the frame.
+    Calling 'present' after drawing shows the frame as soon as it is done and keeps the input polling as late as possible:
+    ```
+    while True:
+        window.event_handler()  # sleeps, then polls the input
+        ...  # update and draw
+        window.present()
+    ```
     """
-    def __init__(self, width: screen_unit, height: screen_unit, fps: int = 60, show_on_creation: bool = True, title: str = data.default_window_name):
+    def __init__(self, width: screen_unit, height: screen_unit, fps: int = 60, show_on_creation: bool = True, title: str = data.default_window_name, present_mode: presentMode = presentMode.immediate, resizable: bool = False):
         self.title: str = title
         self.width: screen_unit = width
         self.height: screen_unit = height
@@ -28,20 +56,50 @@ class Window:
         self._fps = fps
         
         sdl2.ext.init()
-        self._window = sdl2.ext.Window(self.title, size=(self.width, self.height))
-        self._renderer = sdl2.ext.Renderer(self._window, flags=sdl2.SDL_RENDERER_ACCELERATED)
+        window_flags = sdl2.ext.Window.DEFAULTFLAGS
+        if resizable:
+            window_flags |= sdl2.SDL_WINDOW_RESIZABLE
+        self._window = sdl2.ext.Window(self.title, size=(self.width, self.height), flags=window_flags)
+        self._present_mode = present_mode
+        self._vsync = present_mode != presentMode.immediate
+        flags = sdl2.SDL_RENDERER_ACCELERATED
+        if self._vsync:
+            flags |= sdl2.SDL_RENDERER_PRESENTVSYNC
+        self._renderer = sdl2.ext.Renderer(self._window, flags=flags)
+        self._refresh_interval = self._get_refresh_interval()
         
+        # present timing
+        self._fps_counter = FPSCounter()
+        self._last_present_time = perf_counter()
+        self._present_interval = 0.0
+        self._adaptive_streak = 0
+        self._frame_presented = False
+        self.latency: LatencyTracker = LatencyTracker()
             
         data.window_count += 1
             
         self._event = Event(self._fps)
+        self._event.vsync = self._vsync
         self.keyboard: Keyboard  = self._event.keyboard
         self.mouse: Mouse = self._event.mouse
         self.sc: screen_units = screen_units(width, height)
-        self.draw: Draw = Draw(self._window, self._renderer)
+        self.stats: FrameStats = FrameStats()
+        self.resources: ResourceManager = ResourceManager(self.stats)
+        self.mouse._resources = self.resources
+        self.draw: Draw = Draw(self._window, self._renderer, self.stats)
+        self.textures: TextureCache = TextureCache(self)
         self.frame_counter = 0
         self.shared_data: dict[str, Any] = {}
-        self._widgets: dict[str, Widget] = {}
+        self._widgets: SlotMap = SlotMap() # oid -> widget
+        self._removed_while_cycling: set[int] | None = None # oids of the widgets destroyed during the widget cycle
+        self._render_list: RenderList = RenderList()
+        self._spatial_index: SpatialGrid = SpatialGrid()
+        self._pointer_targets: set[int] = set() # oids of the widgets under the mouse this frame
+        self._layout: LayoutNode | None = None
+        self.animator: Animator = Animator()
+        self.widget_costs: WidgetCosts = WidgetCosts(self)
+        self._pipeline: FramePipeline | None = None  # set while 'run' runs pipelined
+        self._closed = False
 
         if show_on_creation:
             self._window.show()
@@ -51,24 +109,217 @@ class Window:
         Handle keyboard, mouse, clock and window events\n
         Fps can be changed dynamically
         """
-        if fps == None:
-            fps = self._fps
-        elif fps < -1 or fps == 0:
-            Messenger.fatalError(ValueError("fps can't be negative or 0 (-1 can be used for unlimited fps)"))
+        fps = self._check_fps(fps)
         self.frame_counter += 1
 
-        sdl2.SDL_RenderPresent(self._renderer.sdlrenderer)   
-        sdl2.SDL_SetRenderDrawColor(self._renderer.sdlrenderer, *Color._handle_rgb_rgba(background_color))
+        if not self._frame_presented:
+            self._present()
+        self._frame_presented = False
+        sdl2.SDL_SetRenderDrawColor(self._renderer.sdlrenderer, *Color.pack(background_color))
      
         sdl2.SDL_RenderClear(self._renderer.sdlrenderer)
         
         if not self.is_init_frame():
-            self._event.handle(fps, self.close)
+            self._handle_events(fps)
+            if not self._closed:
+                self._update_frame()
+
+    def run(self, update: Callable[[], None], background_color: (RGBvalue | RGBAvalue) = Color.BLACK, fps: int = None,
+            pipelined: bool = False) -> None:
+        """
+        Run the frame loop until the window is closed, 'update' is called every frame after the events are handled
+        to update the program and draw the frame. Returns when the window is closed while other windows stay open\n
+        :param pipelined: run the widgets and 'update' on a worker thread one frame ahead, while the main thread submits
+        the frame before it to SDL, so the update and the rendering of two frames overlap. Frames are shown one frame later.
+        Draw with 'window.draw', widgets and texts in 'update', they record their SDL work for the main thread.
+        Other SDL calls in 'update' are not safe.
+        ```
+        def update():
+            world.step()
+            window.draw_widgets()
+
+        window.run(update, pipelined=True)
+        ```
+        """
+        fps = self._check_fps(fps)
+        if not pipelined:
+            while not self._closed:
+                self.event_handler(background_color, fps)
+                if not self._closed:
+                    update()
+            return
+        self._pipeline = FramePipeline(self)
+        try:
+            self._pipeline.run(update, background_color, fps)
+        finally:
+            self._pipeline = None
+
+    def _check_fps(self, fps: int | None) -> int:
+        if fps == None:
+            return self._fps
+        if fps < -1 or fps == 0:
+            Messenger.fatalError(ValueError("fps can't be negative or 0 (-1 can be used for unlimited fps)"))
+        return fps
+
+    def _handle_events(self, fps: int) -> None:
+        self._event.handle(fps, self.close, self._on_resize)
+        self.latency.add_inputs(self._event.input_timestamps)
+
+    def _update_frame(self) -> None:
+        """
+        the updates of the window every frame after the events are handled, on the worker thread when pipelined
+        """
+        self.update_layout()
+        self.animator.update()
+        self._update_pointer_targets()
+        self._cycle_widgets()
+    
+    def _update_pointer_targets(self) -> None:
+        """
+        find the widgets under the mouse once per frame, widgets read the result in 'is_mouse_over' and the click checks
+        """
+        x, y = self.mouse.get_position()
+        widgets = self._widgets
+        self._pointer_targets = {handle for handle in self._spatial_index.query_point(x, y) if widgets[handle]._contains_point(x, y)}
+
+    def _update_pointer_target(self, widget: 'Widget') -> None:
+        """
+        correct the pointer targets of this frame for a widget that moved or resized
+        """
+        x, y = self.mouse.get_position()
+        if widget.point_collision(x, y) and widget._contains_point(x, y):
+            self._pointer_targets.add(widget._handle)
+        else:
+            self._pointer_targets.discard(widget._handle)
+
+    def _cycle_widgets(self) -> None:
+        # widgets destroyed during the cycle are removed after it, removing swaps another widget into their slot
+        removed = self._removed_while_cycling = set()
+        try:
+            if self.widget_costs._enabled:
+                self.widget_costs._cycle_widgets(widget for widget in self._widgets.values() if widget._handle not in removed)
+                return
             for widget in self._widgets.values():
-                widget._cycle()        
+                if widget._handle not in removed:
+                    widget._cycle()
+        finally:
+            self._removed_while_cycling = None
+            for handle in removed:
+                self._widgets.pop(handle, None)
+            
+    def _add_widget(self, widget: 'Widget') -> None:
+        self._widgets[widget._handle] = widget
+        self._render_list.insert(widget)
+        self._spatial_index.insert(widget._handle, widget.x, widget.y, widget.w, widget.h)
+        widget._indexed = True
+        self._update_pointer_target(widget)
+        
+    def _remove_widget(self, widget: 'Widget') -> None:
+        if self._removed_while_cycling is not None:
+            self._removed_while_cycling.add(widget._handle)
+        else:
+            self._widgets.pop(widget._handle, None)
+        if widget in self._render_list:
+            self._render_list.remove(widget)
+        if widget._indexed:
+            self._spatial_index.remove(widget._handle)
+            self._pointer_targets.discard(widget._handle)
+            widget._indexed = False
+            
+    def draw_widgets(self) -> None:
+        """
+        Draw all widgets of the window from back to front, sorted on layer and z-index\n
+        Widgets that are outside the window or hidden behind opaque widgets are skipped
+        """
+        widgets, culled = self._render_list.visible_widgets(self.width, self.height)
+        self.stats.culled_widgets += culled
+        if self.widget_costs._enabled:
+            self.widget_costs._draw_widgets(widgets)
+            return
+        for widget in widgets:
+            widget.draw()
     
+    def present(self) -> None:
+        """
+        Present the frame now instead of at the start of the next 'event_handler' call, call it after everything is drawn\n
+        A pipelined window presents its frames itself, then this does nothing
+        """
+        if self._pipeline is None and not self._frame_presented:
+            self._present()
+            self._frame_presented = True
 
-      
+    def _present(self, new_frame: bool = True) -> None:
+        """
+        :param new_frame: start counting the next frame in 'stats', a pipelined window does this when its worker is done
+        """
+        sdl2.SDL_RenderPresent(self._renderer.sdlrenderer)
+        present_time = perf_counter()
+        self.latency.presented(present_time)
+        self._present_interval = present_time - self._last_present_time
+        self._last_present_time = present_time
+        self._fps_counter.tick(present_time)
+        if new_frame:
+            self.stats.new_frame()
+        
+        if self._present_mode == presentMode.adaptive:
+            self._adapt_vsync()
+            
+    def _adapt_vsync(self) -> None:
+        """
+        SDL2 renderers don't support adaptive vsync, so it is emulated:\n
+        vsync is turned off after a few frames that missed the refresh and turned back on once frames fit in a refresh again.
+        The clock doesn't sleep in this mode, so with vsync off the present interval is the time the frame took
+        """
+        if self._vsync:
+            missed = self._present_interval > self._refresh_interval * 1.5
+        else:
+            missed = self._present_interval > self._refresh_interval * 0.9
+        
+        if missed == self._vsync:
+            self._adaptive_streak += 1
+        else:
+            self._adaptive_streak = 0
+            
+        if self._adaptive_streak >= 3:
+            self._adaptive_streak = 0
+            self._set_vsync(not self._vsync)
+            
+    def _set_vsync(self, vsync: bool) -> None:
+        if sdl2.SDL_RenderSetVSync(self._renderer.sdlrenderer, int(vsync)) != 0:
+            Messenger.warning(f"Failed to turn {'on' if vsync else 'off'} vsync: {sdl2.SDL_GetError().decode()}")
+            return
+        self._vsync = vsync
+        self._event.vsync = vsync or self._present_mode == presentMode.adaptive
+        
+    def _get_refresh_interval(self) -> float:
+        mode = sdl2.SDL_DisplayMode()
+        display_index = sdl2.SDL_GetWindowDisplayIndex(self._window.window)
+        if display_index < 0 or sdl2.SDL_GetCurrentDisplayMode(display_index, byref(mode)) != 0 or mode.refresh_rate <= 0:
+            return 1 / 60 # refresh rate is unknown
+        return 1 / mode.refresh_rate
+    
+    def set_present_mode(self, present_mode: presentMode) -> None:
+        """
+        Change how frames are paced (immediate, vsync or adaptive)
+        """
+        self._present_mode = present_mode
+        self._adaptive_streak = 0
+        self._set_vsync(present_mode != presentMode.immediate)
+        
+    def get_present_mode(self) -> presentMode:
+        return self._present_mode
+    
+    def get_fps(self) -> float:
+        """
+        The amount of frames presented per second, this is the real display cadence
+        """
+        return self._fps_counter.get_fps()
+    
+    def get_present_interval(self) -> float:
+        """
+        Time in seconds between the last 2 presented frames
+        """
+        return self._present_interval
                             
     def hide(self) -> None:
         """
@@ -91,24 +342,87 @@ class Window:
         """
         self._renderer.clear(color)
 
+    def record_events(self, path: str) -> None:
+        """
+        Record the events of every frame to a binary file until 'stop_recording' is called or the window closes\n
+        The recording can be replayed with 'replay_events' to reproduce a session, for example as a repeatable benchmark
+        """
+        self._event.start_recording(path)
+
+    def stop_recording(self) -> None:
+        self._event.stop_recording()
+
+    def replay_events(self, path: str, headless: bool = False, unthrottled: bool = False) -> None:
+        """
+        Replace the real input with a recording of 'record_events', starting at the next frame\n
+        Real input is ignored during the replay, except for closing the window\n
+        :param headless: hide the window during the replay, set the environment variable SDL_VIDEODRIVER=dummy before importing plang to run without a display
+        :param unthrottled: don't wait for the fps between frames, vsync present modes still wait for the display
+        """
+        self._event.start_replay(path, unthrottled)
+        if headless:
+            self.hide()
+
+    def is_replaying(self) -> bool:
+        return self._event.is_replaying()
+
     def close(self, quit_program: bool = False) -> None:
         """
-        close the window
+        close the window, closing it again does nothing\n
+        When called in the update of a pipelined window, the window is closed after the frame
         """
+        if self._closed:
+            return
+        if self._pipeline is not None:
+            if current_pipeline() is self._pipeline:
+                self._pipeline.request_close(quit_program)
+                return
+            self._pipeline.stop()
+        self._event.stop_recording()
+        self.widget_costs.disable()
+        self.textures.clear()
+        if data.debugging:
+            Messenger.info(f"resources of window '{self.title}' at close\n{self.resources.report()}")
+        self.resources.release_all()
         self._window.close()
+        self._closed = True
         data.window_count -= 1
         if quit_program or data.window_count == 0:
+            shared_resources.release_all()
             sdl2.ext.quit()
             if data.debugging and data.window_count == 0:
                 print("PLANG exited because there are 0 windows left")
             sys.exit(0) # using sys library to be able to compile to EXE
     
-    def resize(self, width: screen_unit, height: screen_unit):
+    def resize(self, width: screen_unit, height: screen_unit) -> None:
+        sdl2.SDL_SetWindowSize(self._window.window, int(width), int(height))
+        self._on_resize(int(width), int(height))
+
+    def _on_resize(self, width: int, height: int) -> None:
         self.width = width
         self.height = height
         self.sc.width = width
         self.sc.height = height
-        self.update()
+        self.draw._viewport_w, self.draw._viewport_h = width, height
+
+    # layout
+    def set_layout(self, layout: LayoutNode | None) -> None:
+        """
+        lay out widgets in the whole window, the layout is updated every frame after the events are handled
+        """
+        self._layout = layout
+        if layout is not None:
+            layout.mark_dirty()
+
+    def get_layout(self) -> LayoutNode | None:
+        return self._layout
+
+    def update_layout(self) -> None:
+        """
+        lay out the widgets of the layout now, only the parts that changed since the last update are laid out again
+        """
+        if self._layout is not None:
+            self._layout.layout(0, 0, self.width, self.height)
         
     
     # frame indentifiers
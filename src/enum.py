@@ -24,7 +24,10 @@ from sdl2 import (
     SDL_SYSTEM_CURSOR_SIZENESW,
     SDL_SYSTEM_CURSOR_SIZENS,
     SDL_SYSTEM_CURSOR_SIZENWSE,
-    SDL_SYSTEM_CURSOR_SIZEWE
+    SDL_SYSTEM_CURSOR_SIZEWE,
+    # SDL key modifiers
+    KMOD_NONE, KMOD_LSHIFT, KMOD_RSHIFT, KMOD_LCTRL, KMOD_RCTRL, KMOD_LALT, KMOD_RALT,
+    KMOD_LGUI, KMOD_RGUI, KMOD_NUM, KMOD_CAPS, KMOD_SHIFT, KMOD_CTRL, KMOD_ALT, KMOD_GUI
 )
 
 
@@ -141,6 +144,24 @@ class key(Enum):
     F11 = SDLK_F11
     F12 = SDLK_F12
 
+class keyModifier(Enum):
+    NONE = KMOD_NONE
+    LSHIFT = KMOD_LSHIFT
+    RSHIFT = KMOD_RSHIFT
+    LCTRL = KMOD_LCTRL
+    RCTRL = KMOD_RCTRL
+    LALT = KMOD_LALT
+    RALT = KMOD_RALT
+    LGUI = KMOD_LGUI
+    RGUI = KMOD_RGUI
+    NUM = KMOD_NUM
+    CAPS = KMOD_CAPS
+    # either the left or the right key
+    SHIFT = KMOD_SHIFT
+    CTRL = KMOD_CTRL
+    ALT = KMOD_ALT
+    GUI = KMOD_GUI
+
 class mouseCursor(Enum):
     ARROW = SDL_SYSTEM_CURSOR_ARROW
     IBEAM = SDL_SYSTEM_CURSOR_IBEAM
@@ -171,3 +192,62 @@ class corner(Enum):
     top_right = 1
     bottom_left = 2
     bottom_right = 3
+
+
+class presentMode(Enum):
+    immediate = 0
+    vsync = 1
+    adaptive = 2
+
+
+class layoutDirection(Enum):
+    horizontal = 0
+    vertical = 1
+
+
+class layoutAlign(Enum):
+    start = 0
+    center = 1
+    end = 2
+    stretch = 3
+
+
+class layoutJustify(Enum):
+    start = 0
+    center = 1
+    end = 2
+    space_between = 3
+
+
+class easing(Enum):
+    linear = 0
+    in_quad = 1
+    out_quad = 2
+    in_out_quad = 3
+    in_cubic = 4
+    out_cubic = 5
+    in_out_cubic = 6
+    out_back = 7
+
+
+class animationProperty(Enum):
+    position = 0
+    size = 1
+    color = 2
+    alpha = 3
+    radius = 4
+
+
+class logLevel(Enum):
+    debug = 10
+    info = 20
+    warning = 30
+    error = 40
+    critical = 50
+
+
+class resourceType(Enum):
+    texture = 0
+    surface = 1
+    font = 2
+    cursor = 3
@@ -11,6 +11,10 @@ class Negativescreen_unitError(Exception):
 # window
 class NoWindowSizeError(Exception): ...
 class MultipleWindowsInSingleWindowAppError(Exception): ... # TODO remove if not needed
+class InvalidRecordingError(Exception):
+    """
+    raises when an event recording can't be read
+    """
 
 class ExpectedLengthError(Exception):
     """
@@ -1,64 +1,255 @@
+import os
+import sys
+import atexit
+import threading
+from queue import SimpleQueue, Empty
+from time import monotonic, time, strftime, localtime
 from .typedef import *
+from .enum import logLevel
 from . import data
 from typing import NoReturn
 
-log_file_location: str = "" # TODO: set to a log dir
+log_file_location: str = ""  # set with 'Messenger.configure', no log file when empty
+
+# settings, changed with 'Messenger.configure'
+_level: logLevel = logLevel.info
+_console: bool = True
+_rate_limit: int = 10  # records per call site per second, 0 disables the limit
+_max_file_bytes: int = 1024 * 1024
+_backup_count: int = 3
+
+# records are (level, message, time, suppressed count), a threading.Event is a flush request
+_queue: SimpleQueue = SimpleQueue()
+_writer: threading.Thread | None = None
+_writer_lock = threading.Lock()
+_call_sites: dict[tuple, list] = {}  # (code, line) -> [window start, records in window, suppressed in window]
+_counters: dict[str, int] = {"written": 0, "deduplicated": 0, "rate_limited": 0, "filtered": 0}
+# a repeated message is summarized when no other message came for this long
+_IDLE_SECONDS = 0.5
+
+
+def _log(level: logLevel, message: str, depth: int = 2) -> None:
+    """
+    queue a record for the writer thread, only called from the Messenger methods so 'depth' is their caller
+    """
+    if level.value < _level.value:
+        _counters["filtered"] += 1
+        return
+    suppressed = 0
+    if _rate_limit:
+        frame = sys._getframe(depth)
+        site = (frame.f_code, frame.f_lineno)
+        now = monotonic()
+        window = _call_sites.get(site)
+        if window is None or now - window[0] >= 1.0:
+            suppressed = window[2] if window is not None else 0
+            _call_sites[site] = [now, 1, 0]
+        elif window[1] < _rate_limit:
+            window[1] += 1
+        else:
+            window[2] += 1
+            _counters["rate_limited"] += 1
+            return
+    if _writer is None:
+        _start_writer()
+    _queue.put((level, str(message), time(), suppressed))
+
+
+def _start_writer() -> None:
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = threading.Thread(target=_write_records, name="plang-messenger", daemon=True)
+            _writer.start()
+
+
+class _LogFile:
+    """
+    the log file of the writer thread, renamed to '<name>.1', '<name>.2', ... when it gets larger than the limit
+    """
+
+    def __init__(self) -> None:
+        self.path = ""
+        self.file = None
+
+    def write(self, line: str) -> None:
+        if self.path != log_file_location:
+            self.close()
+            self.path = log_file_location
+            if self.path:
+                self.file = open(self.path, "a", encoding="utf-8")
+        if self.file is None:
+            return
+        self.file.write(line)
+        if self.file.tell() > _max_file_bytes:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        self.file.close()
+        for index in range(_backup_count - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{index}"):
+                os.replace(f"{self.path}.{index}", f"{self.path}.{index + 1}")
+        if _backup_count > 0:
+            os.replace(self.path, f"{self.path}.1")
+        self.file = open(self.path, "w", encoding="utf-8")
+
+    def flush(self) -> None:
+        if self.file is not None:
+            self.file.flush()
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+def _write_records() -> None:
+    """
+    the writer thread, consecutive identical records are written once followed by a repeat count
+    """
+    log_file = _LogFile()
+    last = None  # (level, message) of the last written record
+    repeats = 0
+
+    def emit(level: logLevel, message: str, created: float) -> None:
+        if _console:
+            print(message, file=sys.stdout)
+        if log_file_location or log_file.file is not None:
+            log_file.write(f"{strftime('%Y-%m-%d %H:%M:%S', localtime(created))} {level.name.upper()}: {message}\n")
+        _counters["written"] += 1
+
+    while True:
+        try:
+            item = _queue.get(timeout=_IDLE_SECONDS if repeats else None)
+        except Empty:
+            emit(last[0], f"last message repeated {repeats} times", time())
+            last, repeats = None, 0
+            continue
+
+        if isinstance(item, threading.Event):
+            if repeats:
+                emit(last[0], f"last message repeated {repeats} times", time())
+            last, repeats = None, 0
+            sys.stdout.flush()
+            log_file.flush()
+            item.set()
+            continue
+
+        level, message, created, suppressed = item
+        if (level, message) == last and not suppressed:
+            repeats += 1
+            _counters["deduplicated"] += 1
+            continue
+        if repeats:
+            emit(last[0], f"last message repeated {repeats} times", created)
+        last, repeats = (level, message), 0
+        emit(level, message if not suppressed else f"{message} ({suppressed} similar messages suppressed)", created)
+
 
 class Messenger:
+    """
+    Sends messages to the console and an optional log file without blocking the caller.\n
+    Messages are queued and written by a background thread, so a slow terminal or disk doesn't slow the render loop down.
+    Messages below the configured level are dropped, every call site is limited to 'rate_limit' messages per second
+    (the amount that was dropped is added to its next message) and repeated messages are written once with a count.
+    Use 'Messenger.flush' to wait until everything that was sent is written.
+    """
+
     @staticmethod
-    def configure(log_file_location: path = None):
-        log_file_location = log_file_location
-    
-    
-    
+    def configure(log_file_location: path | None = None, level: logLevel | None = None, console: bool | None = None,
+                  rate_limit: int | None = None, max_file_bytes: int | None = None, backup_count: int | None = None) -> None:
+        """
+        change the settings, arguments that are not given keep their value\n
+        :param log_file_location: a file all messages are appended to, "" to stop writing to a file
+        :param level: messages below this level are dropped
+        :param console: write messages to stdout
+        :param rate_limit: messages per call site per second, 0 for no limit
+        :param max_file_bytes: the log file is rotated when it gets larger, the old files are kept as '<file>.1' ... '<file>.<backup_count>'
+        """
+        global _level, _console, _rate_limit, _max_file_bytes, _backup_count
+        if log_file_location is not None:
+            globals()["log_file_location"] = log_file_location
+        if level is not None:
+            _level = level
+        if console is not None:
+            _console = console
+        if rate_limit is not None:
+            _rate_limit = rate_limit
+        if max_file_bytes is not None:
+            _max_file_bytes = max_file_bytes
+        if backup_count is not None:
+            _backup_count = backup_count
+
+    @staticmethod
+    def flush(timeout: float | None = 2.0) -> bool:
+        """
+        wait until all queued messages are written, returns False when the timeout ran out first
+        """
+        if _writer is None:
+            return True
+        done = threading.Event()
+        _queue.put(done)
+        return done.wait(timeout)
+
+    @staticmethod
+    def get_counters() -> dict[str, int]:
+        """
+        the amount of messages that were written, merged into a repeat count, dropped by the rate limit and dropped by the level
+        """
+        return dict(_counters)
+
+    @staticmethod
+    def debug(message: str) -> None:
+        _log(logLevel.debug, message)
+
     @staticmethod
     def info(message: str) -> None:
         """
         send info to the terminal when in not in production mode
         """
-        print(message)
-       
-    @staticmethod 
+        _log(logLevel.info, message)
+
+    @staticmethod
     def warning(message: str) -> None:
         """
-        send a yellow colored warning to stdout when in not in production mode\n
-        message will be send in yellow
+        send a warning to stdout when in not in production mode
         """
-        print(message)
-        
-    @staticmethod    
+        _log(logLevel.warning, message)
+
+    @staticmethod
     def error(error: str | Exception, terminate: bool = False) -> (NoReturn | None):
         """
         a non critical error\n
-        send a red colored error message to stdout when not in production mode\n
+        send an error message to stdout when not in production mode\n
         error can cause a termination when selected and not in debug mode
         """
         if terminate and not data.debugging:
-            if isinstance(error) == Exception:
+            if isinstance(error, Exception):
                 raise error
             raise Exception(error)
-        print(error)
-        
-    @staticmethod   
+        _log(logLevel.error, error)
+
+    @staticmethod
     def criticalError(error: Exception, terminate_in_debug_mode: bool = False) -> (NoReturn | None):
         """
         a critcal error\n
-        send a purple colored error message to stdout when not in production mode\n
+        send an error message to stdout when not in production mode\n
         error will not terminate when in debug mode (can be overwritten with 'terminate_in_debug_mode')
         """
         if not data.debugging or terminate_in_debug_mode:
-        # add log message
             raise error
-        else: 
-            print("Critical Error in debug mode!")
-            print("The program may not function properly from this point forwards!")
-            print(error)
-            
-    @staticmethod       
+        else:
+            _log(logLevel.critical, f"Critical Error in debug mode!\nThe program may not function properly from this point forwards!\n{error}")
+
+    @staticmethod
     def fatalError(error: Exception) -> NoReturn:
         """
         a fatal error (program will always terminate)\n
         send a purple background error message to stdout when not in production mode
         """
         # add log message
-        raise error
\ No newline at end of file
+        raise error
+
+
+# messages that are still queued when the program ends are written
+atexit.register(Messenger.flush)
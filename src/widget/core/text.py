@@ -1,14 +1,21 @@
 import sdl2
 import sdl2.sdlttf as sdlttf
+from ctypes import addressof
 from typing import TYPE_CHECKING, Union
 from ...core.utils.font import Font
 from ...color import Color
 from ...typedef import screen_unit
 from ...core.window.rect import Rect
+from ...core.utils.resource_manager import shared_resources
+from ...core.window.frame_pipeline import DeferredTexture, current_pipeline
+from ...enum import resourceType
 
 if TYPE_CHECKING:
     from ...core.window.window import Window
 
+# opened fonts are shared by all texts with the same font file and size, they are owned by 'shared_resources'
+_open_fonts: dict[tuple[str, int], sdlttf.TTF_Font] = {}
+
 
 class Text:
     def __init__(self, window: 'Window', text: str, font: Font, color: Color = Color.BLACK):
@@ -16,7 +23,7 @@ class Text:
         self.text = str(text)
         self.font_path = font.path
         self.font_size = font.size
-        self.color = sdl2.SDL_Color(*color)  # Convert to SDL_Color
+        self.color = Color.pack(color).sdl_color
         self.font = self._open_font(self.font_path, self.font_size)
 
         # Optional variables for extra decorations that you might use
@@ -37,12 +44,17 @@ class Text:
         # Initialize texture and size
         self.texture, self.width, self.height = self._get_cached_texture(self.text)
 
-    def _open_font(self, path, size):
+    @staticmethod
+    def _open_font(path, size):
         if not isinstance(path, str):
             path = path.value[0]  # Adjust based on how Font.path is structured
-        font = sdlttf.TTF_OpenFont(path.encode('utf-8'), size)
-        if not font:
-            raise RuntimeError(f"Failed to load font from path: {path}")
+        font = _open_fonts.get((path, size))
+        # the font was closed when the last window was closed
+        if font is None or font not in shared_resources:
+            font = sdlttf.TTF_OpenFont(path.encode('utf-8'), size)
+            if not font:
+                raise RuntimeError(f"Failed to load font from path: {path}")
+            _open_fonts[(path, size)] = shared_resources.track(font, resourceType.font)
         return font
 
     def _get_cached_texture(self, text: str) -> Union[tuple[sdl2.SDL_Texture, int, int], None]:
@@ -54,33 +66,36 @@ class Text:
         # Create a cache key that is unique for the text, font size, and color
         cache_key = (text, self.font_size, self.color.r, self.color.g, self.color.b, self.color.a)
         if cache_key in self.texture_cache:
+            self.window.stats.text_cache_hits += 1
             return self.texture_cache[cache_key]
 
         if not text:
             return None, 0, 0
 
+        self.window.stats.text_cache_misses += 1
+
         # Check if the text contains newlines
         if self._newline_char in text:
             texture, total_width, total_height = self._render_multiline_text(text)
         else:
-            # Simple single-line render
-            surface = sdlttf.TTF_RenderUTF8_Blended(
-                self.font, text.encode('utf-8'), self.color)
-            if not surface:
-                raise RuntimeError("Failed to render text surface")
-            texture = sdl2.SDL_CreateTextureFromSurface(
-                self.window._renderer.sdlrenderer, surface)
-            if not texture:
-                sdl2.SDL_FreeSurface(surface)
-                raise RuntimeError("Failed to create texture from surface")
-            total_width = surface.contents.w
-            total_height = surface.contents.h
-            sdl2.SDL_FreeSurface(surface)
+            texture, total_width, total_height = self._render_single_line_text(text)
 
         # Cache and return the texture along with its dimensions
         self.texture_cache[cache_key] = (texture, total_width, total_height)
         return texture, total_width, total_height
 
+    def _render_single_line_text(self, text: str) -> tuple[sdl2.SDL_Texture, int, int]:
+        """
+        Render a single line of text into a texture.
+        """
+        surface = sdlttf.TTF_RenderUTF8_Blended(
+            self.font, text.encode('utf-8'), self.color)
+        if not surface:
+            raise RuntimeError("Failed to render text surface")
+        width = surface.contents.w
+        height = surface.contents.h
+        return self._upload(surface), width, height
+
     def _render_multiline_text(self, text: str) -> tuple[sdl2.SDL_Texture, int, int]:
         """
         Render multi-line text (lines separated by "\n") into a single texture.
@@ -124,14 +139,66 @@ class Text:
             sdl2.SDL_FreeSurface(surf)  # Free the individual line surface
 
         # Create a texture from the combined surface
-        texture = sdl2.SDL_CreateTextureFromSurface(self.window._renderer.sdlrenderer, new_surface)
-        if not texture:
-            sdl2.SDL_FreeSurface(new_surface)
-            raise RuntimeError("Failed to create texture from multi-line surface")
         width = new_surface.contents.w
         height = new_surface.contents.h
-        sdl2.SDL_FreeSurface(new_surface)
-        return texture, width, height
+        return self._upload(new_surface), width, height
+
+    def _upload(self, surface: sdl2.SDL_Surface) -> Union[sdl2.SDL_Texture, DeferredTexture]:
+        """
+        Create the texture of a rendered surface, the surface is freed.
+        On the worker thread of a pipelined window the texture is created on the main thread before the frame is shown.
+        """
+        pipeline = current_pipeline()
+        if pipeline is not None:
+            return pipeline.defer_texture(surface, self._create_texture)
+        return self._create_texture(surface)
+
+    def _create_texture(self, surface: sdl2.SDL_Surface) -> sdl2.SDL_Texture:
+        texture = sdl2.SDL_CreateTextureFromSurface(self.window._renderer.sdlrenderer, surface)
+        sdl2.SDL_FreeSurface(surface)
+        if not texture:
+            raise RuntimeError("Failed to create texture from surface")
+        self.window.resources.track(texture, resourceType.texture, self)
+        self.window.stats.texture_uploads += 1
+        return texture
+
+    def _release_texture(self, texture: Union[sdl2.SDL_Texture, DeferredTexture]) -> None:
+        if isinstance(texture, DeferredTexture):
+            texture.cancel(self.window.resources)
+        else:
+            self.window.resources.release(texture)
+
+    @staticmethod
+    def _texture_id(texture: Union[sdl2.SDL_Texture, DeferredTexture]) -> int:
+        return id(texture) if isinstance(texture, DeferredTexture) else addressof(texture.contents)
+
+    def clear_cache(self) -> None:
+        """
+        Destroy all cached textures except the one that is currently shown\n
+        Useful for text that changes often, every new text is cached as a new texture
+        """
+        current = self._texture_id(self.texture) if self.texture else None
+        # the same texture can be cached under multiple keys, so textures are collected by address
+        textures = {self._texture_id(cached[0]): cached[0] for cached in self.texture_cache.values() if cached[0]}
+        for address, texture in textures.items():
+            if address != current:
+                self._release_texture(texture)
+        current_text = self.leading + self.text + self.trailing
+        self.texture_cache = {}
+        if self.texture is not None:
+            self.texture_cache[(current_text, self.font_size, self.color.r, self.color.g, self.color.b, self.color.a)] = (self.texture, self.width, self.height)
+
+    def destroy(self) -> None:
+        """
+        Destroy all textures of the text, including the one that is shown\n
+        The text draws nothing until its text is changed, the font stays open for the other texts
+        """
+        for texture, _, _ in self.texture_cache.values():
+            if isinstance(texture, DeferredTexture):
+                texture.cancel(self.window.resources)
+        self.window.resources.release_owner(self)
+        self.texture_cache = {}
+        self.texture, self.width, self.height = None, 0, 0
     
     def set_newline_char(self, newline_char: str):
         """
@@ -177,13 +244,7 @@ class Text:
         self.position = (x, y)
 
     def draw(self):  # TODO fix this
-        # Create a destination rect using your custom Rect class
-        dest_rect = Rect(int(self.position[0]), int(self.position[1]), self.width, self.height)
-        # Create an SDL_Rect from the custom Rect when calling SDL functions
-        sdl_dest_rect = sdl2.SDL_Rect(dest_rect.x, dest_rect.y, dest_rect.w, dest_rect.h)
-
-        sdl2.SDL_RenderCopy(self.window._renderer.sdlrenderer,
-                            self.texture, None, sdl_dest_rect)
+        self.window.draw.texture(self.texture, self.position[0], self.position[1], self.width, self.height)
 
     def draw_in_rect(self, rect: Rect, align_percent_x=50, align_percent_y=50):
         """
@@ -200,6 +261,7 @@ class Text:
                         align_percent_y, self.color.r, self.color.g, self.color.b, self.color.a)
 
             if cache_key in self.texture_cache:
+                self.window.stats.text_cache_hits += 1
                 texture, text_width, text_height = self.texture_cache[cache_key]
             else:
                 # Render and measure similarly, handling newlines as well
@@ -214,11 +276,7 @@ class Text:
             pos_x = rect.x + (rect.w - text_width) * (align_percent_x / 100)
             pos_y = rect.y + (rect.h - text_height) * (align_percent_y / 100)
 
-            dest_rect = Rect(int(pos_x), int(pos_y), text_width, text_height)
-            sdl_dest_rect = sdl2.SDL_Rect(dest_rect.x, dest_rect.y, dest_rect.w, dest_rect.h)
-
-            sdl2.SDL_RenderCopy(self.window._renderer.sdlrenderer,
-                                texture, None, sdl_dest_rect)
+            self.window.draw.texture(texture, pos_x, pos_y, text_width, text_height)
 
     def hover(self, target_position, speed):
         self.target_position = target_position
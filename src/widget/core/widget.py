@@ -2,7 +2,11 @@ from ...core.window.interactive_rect import InteractiveRect
 from ...color import Color
 from ...typedef import RGBAvalue, RGBvalue, screen_unit
 from ...core.window.window import Window
-from typing import Union
+from ...enum import easing, animationProperty
+from typing import TYPE_CHECKING, Callable, Iterable, Sequence, Union
+
+if TYPE_CHECKING:
+    from .text import Text
 
 
 class Widget(InteractiveRect):
@@ -10,12 +14,80 @@ class Widget(InteractiveRect):
         super().__init__(window, x, y, width, height)
         self._border_width = None
         self._border_color = Color.BLACK
-        self._color = Color._handle_rgb_rgba(color)
+        self._color = Color.pack(color)
+        self._layer = 0
+        self._z_index = 0
+        self._render_key = None
+        self.window._add_widget(self)
 
     def set_color(self, color: RGBAvalue | RGBvalue):
-        self._color = Color._handle_rgb_rgba(color)
+        self._color = Color.pack(color)
 
     def set_border(self, width: screen_unit, color: Union[RGBvalue, RGBAvalue] = Color.BLACK) -> None:
         self._border_width = width
         self._border_color = color
 
+    def set_layer(self, layer: int) -> None:
+        """
+        Widgets on a higher layer are always drawn above widgets on a lower layer
+        """
+        if layer != self._layer:
+            self._layer = layer
+            self.window._render_list.reorder(self)
+
+    def set_z_index(self, z_index: int) -> None:
+        """
+        The draw order of widgets within the same layer, a higher z-index is drawn above a lower one
+        """
+        if z_index != self._z_index:
+            self._z_index = z_index
+            self.window._render_list.reorder(self)
+
+    def get_layer(self) -> int:
+        return self._layer
+
+    def get_z_index(self) -> int:
+        return self._z_index
+
+    def _corner_radius(self) -> Union[screen_unit, tuple[screen_unit]]:
+        return 0
+
+    def _is_opaque(self) -> bool:
+        """
+        An opaque widget fully hides everything beneath its rect, widgets below it can be skipped while drawing
+        """
+        if type(self).draw is Widget.draw:
+            return False  # draws nothing, so it hides nothing
+        if len(self._color) == 4 and self._color[3] != 255:
+            return False
+        radius = self._corner_radius()
+        return radius == 0 or radius == (0, 0, 0, 0)
+
+    def animate(self, prop: animationProperty, target: float | Sequence[float], duration: float, easing_function: easing = easing.in_out_quad,
+                delay: float = 0, on_complete: Callable[['Widget'], None] | None = None) -> None:
+        """
+        Tween a property of the widget to a target value with the animator of the window, see 'Animator.animate'
+        """
+        self.window.animator.animate(self, prop, target, duration, easing_function, delay, on_complete)
+
+    def destroy(self) -> None:
+        """
+        Remove the widget from its window, it won't be cycled or drawn by the window anymore\n
+        The textures of its texts and the other resources it owns in 'window.resources' are freed
+        """
+        self.window.animator.cancel(self)
+        for text in self._owned_texts():
+            text.destroy()
+        self.window.resources.release_owner(self)
+        self.window._remove_widget(self)
+
+    def _owned_texts(self) -> Iterable['Text']:
+        """
+        The texts that are only drawn by this widget, they are destroyed with it
+        """
+        return ()
+
+    def draw(self) -> None:
+        """
+        Draw the widget, widgets that only handle input don't draw anything
+        """
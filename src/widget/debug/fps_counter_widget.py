@@ -1,7 +1,6 @@
 from typing import Union, TYPE_CHECKING
 
 from ...typedef import screen_unit, RGBAvalue, RGBvalue
-from ...core.handler.fps_counter import FPSCounter
 from ...widget.core.text import Text
 from ...enum import corner
 from ...core.utils.font import Font
@@ -18,8 +17,7 @@ class FPScounterWidget:
     def __init__(self, window: 'Window', position: Union[corner, Coordinate], font_size: int = 12, color: Union[RGBvalue, RGBAvalue] = Color.GREEN) -> None:
         self.window = window
         self._font = Font(fonts.ARIAL, font_size)
-        self._fps_counter = FPSCounter()
-        self._color = Color._handle_rgb_rgba(color)
+        self._color = Color.pack(color)
         self._text = Text(window, 0.0, self._font, self._color)
         self._position = position
 
@@ -54,11 +52,10 @@ class FPScounterWidget:
                 f"{_corner} with type {type(_corner)} is not a valid instance of 'Coordinate' or enum 'corner' while positioning an FPScounterWidget"))
 
     def set_color(self, color: Union[RGBvalue, RGBAvalue]) -> None:
-        self._color = Color._handle_rgb_rgba(color)
+        self._color = Color.pack(color)
 
     def draw(self) -> None:
-        self._fps_counter.tick()
-        self._text.set_text(f"{round(self._fps_counter.get_fps(), 2)} FPS")
+        self._text.set_text(f"{round(self.window.get_fps(), 2)} FPS")
 
         if self._locked_corner_position:
             self._calculate_corner_position(self._position)
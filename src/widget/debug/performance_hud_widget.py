@@ -0,0 +1,196 @@
+from typing import Union, TYPE_CHECKING
+import numpy as np
+
+from ...typedef import screen_unit, RGBAvalue, RGBvalue
+from ...widget.core.text import Text
+from ...enum import corner
+from ...core.utils.font import Font
+from ...core.utils.cache.font_cache import fonts
+from ...core.handler.timer import Timer
+from ...color import Color
+from ...messenger import Messenger
+from ...core.utils.coordinate import Coordinate
+
+if TYPE_CHECKING:
+    from ...core.window.window import Window
+
+
+class PerformanceHUDWidget:
+    """
+    A performance overlay with a rolling frame time graph, frame time percentiles and the render counters of the window.\n
+    The text is only updated every 'update_interval' seconds and the graph is drawn with a single geometry submit,
+    so the overlay barely influences the numbers it shows.\n
+    The counters always show the last finished frame.
+    """
+
+    def __init__(self, window: 'Window', position: Union[corner, Coordinate] = corner.top_left, font_size: int = 12, color: Union[RGBvalue, RGBAvalue] = Color.GREEN,
+                 background_color: Union[RGBvalue, RGBAvalue] = (0, 0, 0, 160), history: int = 240, bar_width: screen_unit = 1, graph_height: screen_unit = 60, update_interval: float = 0.25) -> None:
+        self.window = window
+        self._font = Font(fonts.ARIAL, font_size)
+        self._color = Color.pack(color)
+        self._background_color = Color.pack(background_color)
+        self._text = Text(window, "", self._font, self._color)
+        self._position = position
+        self._update_timer = Timer(update_interval)
+
+        # rolling frame times
+        self._history = history
+        self._frame_times = np.zeros(history, dtype=np.float32)
+        self._frame_index = 0
+        self._samples = 0
+        self._last_sampled_frame = -1
+
+        # cache lookups since the last text update
+        self._cache_lookups = {"geometry": [0, 0], "text": [0, 0]}
+
+        # graph geometry: a background quad followed by a quad per bar
+        self._bar_width = bar_width
+        self._graph_width = history * bar_width
+        self._graph_height = graph_height
+        quads = history + 1
+        self._graph_vertices = np.zeros((quads * 4, 2), dtype=np.float32)
+        self._graph_colors = np.zeros((quads * 4, 4), dtype=np.uint8)
+        self._graph_colors[:4] = self._background_color if len(self._background_color) == 4 else (*self._background_color, 255)
+        first_vertices = np.arange(quads, dtype=np.int32)[:, None] * 4
+        self._graph_indices = (first_vertices + np.array([0, 1, 2, 2, 3, 0], dtype=np.int32)).flatten()
+        bar_x = np.arange(history, dtype=np.float32) * bar_width
+        self._bar_x = np.column_stack((bar_x, bar_x + bar_width, bar_x + bar_width, bar_x))  # x of each bar corner in quad order
+
+        self.x = 0
+        self.y = 0
+        if isinstance(position, Coordinate):
+            self._locked_corner_position = False
+            self.x = position.x
+            self.y = position.y
+        else:
+            self._locked_corner_position = True
+            self._calculate_corner_position(position)
+
+    def _calculate_corner_position(self, _corner) -> None:
+        width = max(self._text.width, self._graph_width)
+        height = self._text.height + self._graph_height
+        if _corner == corner.top_left:
+            self.x = 0
+            self.y = 0
+
+        elif _corner == corner.top_right:
+            self.x = self.window.width - width
+            self.y = 0
+
+        elif _corner == corner.bottom_left:
+            self.x = 0
+            self.y = self.window.height - height
+
+        elif _corner == corner.bottom_right:
+            self.x = self.window.width - width
+            self.y = self.window.height - height
+
+        else:
+            Messenger.fatalError(TypeError(
+                f"{_corner} with type {type(_corner)} is not a valid instance of 'Coordinate' or enum 'corner' while positioning a PerformanceHUDWidget"))
+
+    def set_color(self, color: Union[RGBvalue, RGBAvalue]) -> None:
+        self._color = Color.pack(color)
+
+    def _sample(self) -> None:
+        """
+        store the frame time and cache lookups of the last frame, once per frame
+        """
+        if self.window.frame_counter == self._last_sampled_frame:
+            return
+        self._last_sampled_frame = self.window.frame_counter
+
+        self._frame_times[self._frame_index] = self.window.get_present_interval()
+        self._frame_index = (self._frame_index + 1) % self._history
+        self._samples = min(self._samples + 1, self._history)
+
+        last = self.window.stats.last
+        self._cache_lookups["geometry"][0] += last["geometry_cache_hits"]
+        self._cache_lookups["geometry"][1] += last["geometry_cache_hits"] + last["geometry_cache_misses"]
+        self._cache_lookups["text"][0] += last["text_cache_hits"]
+        self._cache_lookups["text"][1] += last["text_cache_hits"] + last["text_cache_misses"]
+
+    def _recorded_frame_times(self) -> np.ndarray:
+        """
+        the recorded frame times, oldest first
+        """
+        if self._samples < self._history:
+            return self._frame_times[:self._samples]
+        return np.roll(self._frame_times, -self._frame_index)
+
+    def _frame_budget(self) -> float:
+        if self.window._vsync:
+            return self.window._refresh_interval
+        if self.window._fps > 0:
+            return 1 / self.window._fps
+        return 1 / 60
+
+    def _hit_rate(self, cache: str) -> str:
+        hits, lookups = self._cache_lookups[cache]
+        self._cache_lookups[cache] = [0, 0]
+        if lookups == 0:
+            return "-"
+        return f"{hits / lookups:.0%}"
+
+    def _update_text(self) -> None:
+        frame_times = self._recorded_frame_times()
+        frame_times = frame_times[frame_times > 0]
+        if len(frame_times) == 0:
+            return
+        mean = frame_times.mean()
+        p99 = np.percentile(frame_times, 99)
+        worst = np.sort(frame_times)[-max(1, len(frame_times) // 100):]  # slowest 1% of the frames
+        last = self.window.stats.last
+        latency = self.window.latency.summary()
+        latency_text = f"input latency p50 {latency['p50'] * 1000:.1f} ms  p99 {latency['p99'] * 1000:.1f} ms" if latency["count"] else "input latency -"
+
+        self._text.set_text("\n".join((
+            f"{1 / mean:.1f} FPS  {mean * 1000:.2f} ms",
+            f"p99 {p99 * 1000:.2f} ms  1% low {1 / worst.mean():.1f} FPS",
+            f"draw calls {last['draw_calls']}  vertices {last['vertices']}  culled widgets {last['culled_widgets']}",
+            f"texture uploads {last['texture_uploads']}  live textures {last['live_textures']}",
+            f"cache hits geometry {self._hit_rate('geometry')}  text {self._hit_rate('text')}",
+            latency_text,
+        )))
+        self._text.clear_cache()
+
+        if self._locked_corner_position:
+            self._calculate_corner_position(self._position)
+        self._text.set_position(self.x, self.y)
+
+    def _draw_graph(self) -> None:
+        x = self.x
+        y = self.y + self._text.height
+        width = max(self._text.width, self._graph_width)
+        bottom = y + self._graph_height
+        budget = self._frame_budget()
+
+        self._graph_vertices[:4] = ((x, y), (x + width, y), (x + width, bottom), (x, bottom))
+
+        frame_times = self._recorded_frame_times()
+        bars = len(frame_times)
+        # frames at 2x the frame budget fill the graph
+        heights = np.minimum(frame_times / (budget * 2), 1) * self._graph_height
+        bar_vertices = self._graph_vertices[4:4 + bars * 4].reshape(bars, 4, 2)
+        bar_vertices[:, :, 0] = self._bar_x[:bars] + x
+        bar_vertices[:, 0:2, 1] = (bottom - heights)[:, None]
+        bar_vertices[:, 2:4, 1] = bottom
+
+        bar_colors = self._graph_colors[4:4 + bars * 4].reshape(bars, 4, 4)
+        bar_colors[:] = Color.GREEN
+        bar_colors[frame_times > budget * 1.05] = Color.YELLOW
+        bar_colors[frame_times > budget * 2] = Color.RED
+
+        vertex_count = 4 + bars * 4
+        self.window.draw._render_geometry(self._graph_vertices[:vertex_count], self._graph_indices[:(1 + bars) * 6],
+                                          self._color, self._graph_colors[:vertex_count])
+
+    def draw(self) -> None:
+        self._sample()
+        if self._update_timer.is_ringing():
+            self._update_timer.reset()
+            self._update_text()
+
+        self._draw_graph()
+        if self._text.texture is not None:
+            self._text.draw()
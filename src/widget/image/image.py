@@ -0,0 +1,45 @@
+import sdl2
+from typing import TYPE_CHECKING, Union
+from ...widget.core.widget import Widget
+from ...typedef import screen_unit, RGBAvalue, RGBvalue
+from ...color import Color
+
+if TYPE_CHECKING:
+    from ...core.window.window import Window
+
+
+class Image(Widget):
+    """
+    An image file drawn in the rect of the widget.\n
+    The file is decoded and scaled to the size of the widget on a background thread the first time the image is drawn,
+    until then the rect is filled with the placeholder color. Textures are shared through the texture cache of the window,
+    so images with the same path and size only take video memory once and images that aren't drawn for a while are freed.
+    """
+
+    def __init__(self, window: 'Window', x: screen_unit, y: screen_unit, width: screen_unit, height: screen_unit, path: str,
+                 placeholder_color: Union[RGBvalue, RGBAvalue] = Color.LIGHT_GRAY) -> None:
+        super().__init__(window, x, y, width, height, placeholder_color)
+        self._path = path
+
+    def set_image(self, path: str) -> None:
+        self._path = path
+
+    def get_image(self) -> str:
+        return self._path
+
+    def _texture(self) -> tuple[sdl2.SDL_Texture, int, int] | None:
+        return self.window.textures.request(self._path, self.w, self.h)
+
+    def is_loaded(self) -> bool:
+        return (self._path, int(self.w), int(self.h)) in self.window.textures
+
+    def _is_opaque(self) -> bool:
+        # images can have transparent pixels
+        return False
+
+    def draw(self) -> None:
+        texture = self._texture()
+        if texture is None:
+            self.window.draw.rectangle(self.x, self.y, self.w, self.h, self._color)
+            return
+        self.window.draw.texture(texture[0], self.x, self.y, self.w, self.h)
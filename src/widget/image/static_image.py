@@ -0,0 +1,27 @@
+import sdl2
+from typing import TYPE_CHECKING, Union
+from .image import Image
+from ...typedef import screen_unit, RGBAvalue, RGBvalue
+from ...color import Color
+
+if TYPE_CHECKING:
+    from ...core.window.window import Window
+
+
+class StaticImage(Image):
+    """
+    An image that is loaded when it is created, for small images that have to be visible in the first frame like icons.\n
+    Loading blocks until the file is decoded, use 'Image' for large images or many images at once
+    """
+
+    def __init__(self, window: 'Window', x: screen_unit, y: screen_unit, width: screen_unit, height: screen_unit, path: str,
+                 placeholder_color: Union[RGBvalue, RGBAvalue] = Color.LIGHT_GRAY) -> None:
+        super().__init__(window, x, y, width, height, path, placeholder_color)
+        self._texture()
+
+    def set_image(self, path: str) -> None:
+        super().set_image(path)
+        self._texture()
+
+    def _texture(self) -> tuple[sdl2.SDL_Texture, int, int] | None:
+        return self.window.textures.load(self._path, self.w, self.h)
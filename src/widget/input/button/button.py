@@ -1,5 +1,5 @@
 from time import perf_counter
-from typing import TYPE_CHECKING, Union, Annotated, Any
+from typing import TYPE_CHECKING, Union, Annotated, Any, Iterable
 from ....widget.core.widget import Widget
 from ....enum import mouseButton, mouseCursor
 from ....typedef import RGBAvalue, RGBvalue, screen_unit, percent
@@ -11,6 +11,9 @@ from ....core.utils.font import Font
 from ....annotated_var import unchanged
 from ....messenger import Messenger
 
+if TYPE_CHECKING:
+    from ....core.window.texture_atlas import TextureAtlas
+
 class Button(Widget):
     def __init__(self, window: Window, x: screen_unit, y: screen_unit, width: screen_unit, height: screen_unit, color: RGBvalue | RGBAvalue = Color.WHITE, radius: int = 0):
         super().__init__(window, x, y, width, height, color)
@@ -23,6 +26,8 @@ class Button(Widget):
         self._double_click_timer = 0
         self._double_click_interval = 0.5 # default on windows os
         self._text_position = (50, 50)
+        self._icon_size: tuple[screen_unit, screen_unit] | None = None
+        self._icon_position = (50, 50)
         
         
     def _cycle(self):
@@ -38,6 +43,8 @@ class Button(Widget):
                 self.window.mouse.set_cursor(mouseCursor.ARROW)
         
     def set_text(self, text: Any, font: Font, color: Union[RGBvalue, RGBAvalue] = Color.WHITE, position: Union[tuple[xPos, yPos], tuple[Annotated[percent, 2]]] = unchanged) -> None:
+        if self.text is not None:
+            self.text.destroy()
         self.text = Text(self.window, text, font, color)
         if position != None:
             self.set_text_position(position)
@@ -59,14 +66,29 @@ class Button(Widget):
         if self._text_position != (x, y):
             self._text_position = (x, y)
     
-    def set_icon(self):
-        raise NotImplementedError
+    def set_icon(self, atlas: 'TextureAtlas', name: str, size: tuple[screen_unit, screen_unit] | None = None,
+                 position: Union[tuple[xPos, yPos], tuple[Annotated[percent, 2]]] = (xPos.center, yPos.center)) -> None:
+        """
+        Show an image of a texture atlas on the button, icons of the same atlas share a texture\n
+        :param size: the size of the icon, the size of the image when not given
+        :param position: the position of the icon in the button, like the text position
+        """
+        region = atlas.get(name)
+        self.icon = (atlas, name)
+        self._icon_size = size if size is not None else (region.w, region.h)
+        self._icon_position = tuple(value.value if isinstance(value, (xPos, yPos)) else value for value in position)
+
+    def remove_icon(self) -> None:
+        self.icon = None
     
     def set_radius(self, radius: screen_unit = 0):
         self._radius = radius
     
     def set_individual_radius(self, top_left: screen_unit = 0, top_right: screen_unit = 0, bottom_left: screen_unit = 0, bottom_right: screen_unit = 0):
         self._radius = (top_left, top_right, bottom_left, bottom_right)
+        
+    def _corner_radius(self):
+        return self._radius
     
     def is_double_clicked(self, mouse_button: mouseButton = mouseButton.left, overwrite_widget_already_pressed: bool = False, overwrite_deactivated: bool = False):
         if self.is_clicked(mouse_button, overwrite_widget_already_pressed, overwrite_deactivated):
@@ -74,7 +96,7 @@ class Button(Widget):
                 self._double_click_timer = 0
                 return True
             self._double_click_timer = perf_counter()
-        if self.window.mouse.is_mouse_clicked_outside_rect(self.pack(), mouse_button):
+        if self.window.mouse.is_mouse_clicked(mouse_button) and not self.is_mouse_over():
             self._double_click_timer = 0
         return False
 
@@ -90,9 +112,17 @@ class Button(Widget):
             self._click_time = perf_counter()
         return self.is_pressing(mouse_button, overwrite_widget_already_pressed, overwrite_deactivated) and (perf_counter() - self._click_time >= seconds)
     
+    def _owned_texts(self) -> Iterable[Text]:
+        return () if self.text is None else (self.text,)
+
     def draw(self):
         self.window.draw.rectangle(*self.unpack(), self._color, self._radius)
         
+        if self.icon != None:
+            width, height = self._icon_size
+            x = self.x + (self.w - width) * self._icon_position[0] / 100
+            y = self.y + (self.h - height) * self._icon_position[1] / 100
+            self.window.draw.sprite(*self.icon, x, y, width, height)
         if self.text != None:
-            self.text.draw_in_rect(self.pack(), *self._text_position)
+            self.text.draw_in_rect(self, *self._text_position)
     
\ No newline at end of file
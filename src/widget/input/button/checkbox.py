@@ -1,7 +1,51 @@
+from typing import Callable, Union
 from ....widget.core.widget import Widget
 from ....color import Color
-from ....typedef import screen_unit
+from ....typedef import screen_unit, RGBvalue, RGBAvalue
 
 class Checkbox(Widget):
-    def __init__(self, window, x, y, width, height, color = Color.WHITE):
-        super().__init__(window, x, y, width, height, color)
\ No newline at end of file
+    def __init__(self, window, x: screen_unit, y: screen_unit, width: screen_unit, height: screen_unit, color: Union[RGBvalue, RGBAvalue] = Color.WHITE,
+                 check_color: Union[RGBvalue, RGBAvalue] = Color.BLACK, checked: bool = False, on_change: Callable[[bool], None] | None = None):
+        """
+        A box that is checked and unchecked by clicking it.\n
+        :param check_color: The color of the border and the check mark in RGB/RGBA format.\n
+        :param on_change: called with the new state when the checkbox is clicked.\n
+        """
+        super().__init__(window, x, y, width, height, color)
+        self.set_border(1, check_color)
+        self._check_color = Color.pack(check_color)
+        self._checked = checked
+        self.on_change = on_change
+
+    def _cycle(self):
+        super()._cycle()
+        if self.is_clicked():
+            self._checked = not self._checked
+            if self.on_change is not None:
+                self.on_change(self._checked)
+
+    def is_checked(self) -> bool:
+        return self._checked
+
+    def set_checked(self, checked: bool) -> None:
+        """
+        Check or uncheck the box, 'on_change' is not called
+        """
+        self._checked = checked
+
+    def draw(self) -> None:
+        draw = self.window.draw
+        draw.rectangle(self.x, self.y, self.w, self.h, self._color)
+        right, bottom = self.x + self.w - 1, self.y + self.h - 1
+        draw.line(self.x, self.y, right, self.y, self._border_color)
+        draw.line(right, self.y, right, bottom, self._border_color)
+        draw.line(right, bottom, self.x, bottom, self._border_color)
+        draw.line(self.x, bottom, self.x, self.y, self._border_color)
+        if self._checked:
+            # a check mark from the left middle down to the bottom third and up to the top right
+            left, middle = self.x + self.w * 0.2, self.y + self.h * 0.5
+            low_x, low_y = self.x + self.w * 0.42, self.y + self.h * 0.75
+            top_x, top_y = self.x + self.w * 0.8, self.y + self.h * 0.25
+            for offset in (0, 1):
+                draw.line(left, middle + offset, low_x, low_y + offset, self._check_color)
+                draw.line(low_x, low_y + offset, top_x, top_y + offset, self._check_color)
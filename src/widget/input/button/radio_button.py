@@ -3,7 +3,6 @@ from typing import TYPE_CHECKING, Union
 from ....widget.core.widget import Widget
 from ....color import Color
 from ....typedef import screen_unit, RGBvalue, RGBAvalue
-from ....enum import mouseButton
 
 if TYPE_CHECKING:
     from ....core.window.window import Window
@@ -35,8 +34,6 @@ class RadioButton(Widget):
         if self.window.shared_data.get(self.id) is None or default_activate:
             self.window.shared_data[self.id] = self.oid()
             self._active = True
-            
-        self.window._widgets[self.oid()] = self
 
     def _cycle(self):
         super()._cycle()
@@ -53,7 +50,7 @@ class RadioButton(Widget):
         if self.window.shared_data[self.id] == self.oid():
             self.window.shared_data[self.id] = None
             
-        self.window._widgets.pop(self.oid())
+        self.window._remove_widget(self)
 
     def draw(self) -> None:
         self.window.draw.circle_with_border(
@@ -63,6 +60,9 @@ class RadioButton(Widget):
             self.window.draw.circle(
                 self.x + self._radius, self.y + self._radius, self._radius - 4, self._active_color)
 
+    def _is_opaque(self) -> bool:
+        return False # a circle never hides its full rect
+
     def is_active(self) -> bool:
         """
         Returns if the current radio button is active or not
@@ -71,14 +71,7 @@ class RadioButton(Widget):
 
 
     # overwrite of mouse interactions for circle
-    def is_mouse_over(self) -> bool:
-        return self.window.mouse.is_mouse_in_circle((self.x + self._radius, self.y + self._radius), self._radius)
-    
-    def is_clicked(self, mouse_button = mouseButton.left, overwrite_widget_already_pressed = False, overwrite_deactivated = False):
-        return self._eligible_for_click(overwrite_widget_already_pressed, overwrite_deactivated) and self.window.mouse.is_mouse_clicked_in_circle((self.x + self._radius, self.y + self._radius), self._radius, mouse_button)
-    
-    def is_released(self, mouse_button = mouseButton.left, overwrite_widget_already_pressed = False, overwrite_deactivated = False):
-        return self._eligible_for_click(overwrite_widget_already_pressed, overwrite_deactivated) and self.window.mouse.is_mouse_released_in_circle((self.x + self._radius, self.y + self._radius), self._radius, mouse_button)
-
-    def is_pressing(self, mouse_button = mouseButton.left, overwrite_widget_already_pressed = False, overwrite_deactivated = False):
-        return self._eligible_for_click(overwrite_widget_already_pressed, overwrite_deactivated) and self.window.mouse.is_mouse_pressing_in_circle((self.x + self._radius, self.y + self._radius), self._radius, mouse_button)
+    def _contains_point(self, x: screen_unit, y: screen_unit) -> bool:
+        dx = x - (self.x + self._radius)
+        dy = y - (self.y + self._radius)
+        return dx * dx + dy * dy <= self._radius * self._radius
@@ -0,0 +1,299 @@
+import sdl2
+import numpy as np
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Sequence, Union
+from ...core.widget import Widget
+from ...core.text import Text
+from ....core.utils.font import Font
+from ....core.utils.text_index import TextIndex
+from ....core.handler.keyboard_input import KeyboardInput
+from ....enum import key
+from ....typedef import screen_unit, RGBAvalue, RGBvalue
+from ....color import Color
+from ....messenger import Messenger
+
+if TYPE_CHECKING:
+    from ....core.window.window import Window
+
+# an open select is drawn above the widgets next to it
+_OPEN_LAYER = 1 << 16
+
+
+class Select(Widget):
+    """
+    A dropdown to pick one of many options, stays fast with tens of thousands of options.\n
+    Clicking the select opens the option list below it, typing filters the options: queries shorter than 3 characters
+    match the start of an option, longer ones match anywhere in it, both are looked up in a 'TextIndex'.
+    Only the rows in view are drawn, the label textures are rendered when an option scrolls into view and the last
+    'cache_size' of them are kept, so scrolling back and forth doesn't render them again.\n
+    UP / DOWN move the highlight, RETURN picks the highlighted option, ESCAPE or a click outside closes the list.
+    ```
+    select = Select(window, 10, 10, 200, 30, Font(fonts.ARIAL, 14), skus, on_change=lambda index, sku: print(sku))
+    ```
+    :param options: every option is shown as str(option)
+    :param visible_rows: the amount of rows the open list shows at once
+    :param on_change: called with the index and the option when an option is picked
+    """
+
+    def __init__(self, window: 'Window', x: screen_unit, y: screen_unit, width: screen_unit, height: screen_unit, font: Font, options: Sequence[Any] = (),
+                 visible_rows: int = 8, text_color: Union[RGBvalue, RGBAvalue] = Color.BLACK, background_color: Union[RGBvalue, RGBAvalue] = Color.WHITE,
+                 highlight_color: Union[RGBvalue, RGBAvalue] = Color.LIGHT_GRAY, placeholder: str = "", padding: screen_unit = 4,
+                 cache_size: int = 128, on_change: Callable[[int, Any], None] | None = None) -> None:
+        super().__init__(window, x, y, width, height, background_color)
+        self._font = font
+        self._text_color = text_color
+        self._highlight_color = Color.pack(highlight_color)
+        self._row_height = sdl2.sdlttf.TTF_FontLineSkip(Text._open_font(font.path, font.size))
+        self._visible_rows = visible_rows
+        self._padding = padding
+        self._cache_size = max(cache_size, visible_rows)
+        self.placeholder = placeholder
+        self.on_change = on_change
+
+        self._closed_height = height
+        self._closed_layer = self._layer
+        self._open = False
+        self._keyboard_input = KeyboardInput(window)
+        self._label = Text(window, placeholder, font, text_color)
+
+        self._options: list[Any] = []
+        self._index = TextIndex(())
+        self._filter = ""
+        self._filtered = np.zeros(0, dtype=np.int32)  # option indices that match the filter, in option order
+        self._selected: int | None = None
+        self._highlighted = 0  # position in the filtered options
+        self._top = 0  # position in the filtered options of the first row in view
+
+        self._texts: OrderedDict[int, Text] = OrderedDict()  # option index -> Text, least recently drawn first
+        self._text_pool: list[Text] = []  # Texts of the options before the last 'set_options'
+        self.set_options(options)
+
+    ###########
+    # options #
+    ###########
+    def set_options(self, options: Sequence[Any]) -> None:
+        """
+        replace all options, the selection and the filter are reset
+        """
+        self._options = list(options)
+        self._index = TextIndex(str(option) for option in self._options)
+        # the cached Texts show labels of the old options, they are relabeled when they are reused
+        self._text_pool.extend(self._texts.values())
+        self._texts.clear()
+        self.select(None)
+        self.set_filter("")
+
+    def get_options(self) -> list[Any]:
+        return self._options
+
+    def get_option_count(self) -> int:
+        return len(self._options)
+
+    def select(self, index: int | None) -> None:
+        """
+        select the option at an index, None clears the selection, 'on_change' is not called
+        """
+        if index is not None and not 0 <= index < len(self._options):
+            Messenger.fatalError(IndexError(f"option index {index} out of range for {len(self._options)} options"))
+        self._selected = index
+        self._show_selection()
+
+    def _show_selection(self) -> None:
+        self._label.set_text(self.placeholder if self._selected is None else self._options[self._selected])
+
+    def get_selected_index(self) -> int | None:
+        return self._selected
+
+    def get_selected(self) -> Any:
+        """
+        the selected option, None when nothing is selected
+        """
+        return None if self._selected is None else self._options[self._selected]
+
+    def _pick(self, position: int) -> None:
+        index = int(self._filtered[position])
+        changed = index != self._selected
+        self.select(index)
+        self.close()
+        if changed and self.on_change is not None:
+            self.on_change(index, self._options[index])
+
+    #############
+    # filtering #
+    #############
+    def set_filter(self, query: str) -> None:
+        """
+        only show the options that match the query, an empty query shows all options
+        """
+        self._filter = query
+        self._filtered = self._index.search(query)
+        self._label.clear_cache()  # every query is rendered with and without the caret, the old ones aren't shown again
+        self._highlighted = 0
+        self._top = 0
+        if self._open:
+            self._fit_list()
+
+    def get_filter(self) -> str:
+        return self._filter
+
+    def get_filtered_count(self) -> int:
+        return len(self._filtered)
+
+    def get_filtered_indices(self) -> np.ndarray:
+        return self._filtered
+
+    ##############
+    # open state #
+    ##############
+    def is_open(self) -> bool:
+        return self._open
+
+    def open(self) -> None:
+        if self._open:
+            return
+        self._open = True
+        self._closed_layer = self._layer
+        self.set_layer(_OPEN_LAYER)
+        self._keyboard_input.clear_input()
+        self._keyboard_input.activate()
+        self.set_filter("")
+        if self._selected is not None:
+            self._highlight(int(np.searchsorted(self._filtered, self._selected)))
+
+    def close(self) -> None:
+        if not self._open:
+            return
+        self._open = False
+        self._keyboard_input.deactivate()
+        self.set_layer(self._closed_layer)
+        self._show_selection()
+        self._label.clear_cache()
+        self.h = self._closed_height
+
+    def _fit_list(self) -> None:
+        """
+        grow the rect over the rows of the open list, so clicks and the spatial index of the window cover them
+        """
+        self.h = self._closed_height + min(len(self._filtered), self._visible_rows) * self._row_height
+
+    def _highlight(self, position: int) -> None:
+        """
+        highlight a row and scroll it into view
+        """
+        if not len(self._filtered):
+            return
+        self._highlighted = max(0, min(position, len(self._filtered) - 1))
+        if self._highlighted < self._top:
+            self._top = self._highlighted
+        elif self._highlighted >= self._top + self._visible_rows:
+            self._top = self._highlighted - self._visible_rows + 1
+
+    def scroll_by(self, rows: int) -> None:
+        self._top = max(0, min(self._top + rows, len(self._filtered) - self._visible_rows))
+
+    def get_visible_options(self) -> np.ndarray:
+        """
+        the option indices of the rows in view of the open list
+        """
+        return self._filtered[self._top:self._top + self._visible_rows]
+
+    def _row_at(self, y: screen_unit) -> int | None:
+        """
+        the position in the filtered options of the row at a y position in the window
+        """
+        row = int((y - self.y - self._closed_height) // self._row_height)
+        if row < 0 or self._top + row >= len(self._filtered):
+            return None
+        return self._top + row
+
+    def _cycle(self) -> None:
+        super()._cycle()
+        mouse = self.window.mouse
+        if not self._open:
+            if self.is_clicked():
+                self.open()
+            return
+
+        if mouse.is_mouse_clicked() and not self.is_mouse_over():
+            self.close()
+            return
+        keyboard = self.window.keyboard
+        if keyboard.is_key_clicked(key.ESCAPE):
+            self.close()
+            return
+        if self.is_clicked():
+            position = self._row_at(mouse.get_position()[1])
+            if position is not None:
+                self._pick(position)
+            elif mouse.get_position()[1] <= self.y + self._closed_height:
+                self.close()
+            return
+        if keyboard.is_key_clicked(key.RETURN) and len(self._filtered):
+            self._pick(self._highlighted)
+            return
+
+        if keyboard.is_key_clicked(key.DOWN):
+            self._highlight(self._highlighted + 1)
+        elif keyboard.is_key_clicked(key.UP):
+            self._highlight(self._highlighted - 1)
+        if self.is_mouse_over():
+            _, wheel_y = mouse.get_wheel()
+            if wheel_y:
+                self.scroll_by(-wheel_y * 3)
+
+        self._keyboard_input._get_input()
+        if self._keyboard_input._input != self._filter:
+            self.set_filter(self._keyboard_input._input)
+
+    ######################
+    # label text caching #
+    ######################
+    def _option_text(self, index: int) -> Text:
+        text = self._texts.get(index)
+        if text is not None:
+            self._texts.move_to_end(index)
+            return text
+        if len(self._texts) >= self._cache_size:
+            # the least recently drawn Text shows the new label, it keeps only that texture
+            _, text = self._texts.popitem(last=False)
+            text.set_text(self._options[index])
+            text.clear_cache()
+        elif self._text_pool:
+            text = self._text_pool.pop()
+            text.set_text(self._options[index])
+            text.clear_cache()
+        else:
+            text = Text(self.window, self._options[index], self._font, self._text_color)
+        self._texts[index] = text
+        return text
+
+    def get_cached_label_count(self) -> int:
+        return len(self._texts)
+
+    def _owned_texts(self) -> Iterable[Text]:
+        return [self._label, *self._texts.values(), *self._text_pool]
+
+    def draw(self) -> None:
+        draw = self.window.draw
+        draw.rectangle(self.x, self.y, self.w, self._closed_height, self._color)
+        draw.set_clip(self)
+        if self._open:
+            # the open select shows the filter with a caret in place of the selected option, the keys are read in '_cycle'
+            self._label.set_text(self._keyboard_input._input_with_caret())
+        label = self._label
+        if label.texture is not None:
+            label.set_position(self.x + self._padding, self.y + (self._closed_height - label.height) / 2)
+            label.draw()
+
+        if self._open:
+            top = self.y + self._closed_height
+            draw.rectangle(self.x, top, self.w, self.h - self._closed_height, self._color)
+            for row, index in enumerate(self.get_visible_options().tolist()):
+                y = top + row * self._row_height
+                if self._top + row == self._highlighted:
+                    draw.rectangle(self.x, y, self.w, self._row_height, self._highlight_color)
+                text = self._option_text(index)
+                if text.texture is not None:
+                    text.set_position(self.x + self._padding, y)
+                    text.draw()
+        draw.set_clip(None)
@@ -1,5 +1,5 @@
 import sdl2.ext
-from typing import Callable, TYPE_CHECKING, Union
+from typing import Callable, TYPE_CHECKING, Iterable, Union
 
 from ....core.window.window import Window
 from ...core.widget import Widget
@@ -28,8 +28,6 @@ class Form(Widget):
             
         self.text_widget = Text(window, self.input, font, text_color)
 
-        self.window._widgets[self.oid()] = self
-
     def _cycle(self) -> None:
         super()._cycle()
 
@@ -37,7 +35,7 @@ class Form(Widget):
             # caret (text cursor) handler
             
 
-            if self.window.mouse.is_mouse_clicked_outside_rect(self.pack()):
+            if self.window.mouse.is_mouse_clicked() and not self.is_mouse_over():
                 self.deactivate()
                 return  # skip input cycle
 
@@ -48,11 +46,11 @@ class Form(Widget):
                 self.input = self._keyboard_input.get_input_string() # TODO fix caret being placed in the wrong place
                 self.text_widget.set_text(self.input)
         else:
-            if self.window.mouse.is_mouse_clicked_in_rect(self.pack()):
+            if self.window.mouse.is_mouse_clicked() and self.is_mouse_over():
                 self.activate()
 
     def __del__(self):
-        self.window._widgets.pop(self.oid())
+        self.window._remove_widget(self)
 
     def activate(self) -> None:
         """
@@ -74,6 +72,9 @@ class Form(Widget):
         self.input = u""
         return input
 
+    def _owned_texts(self) -> Iterable[Text]:
+        return (self.text_widget,)
+
     def draw(self):
         self.window.draw.rectangle(*self.unpack(), self._color)
-        self.text_widget.draw_in_rect(self.pack(), 0)
+        self.text_widget.draw_in_rect(self, 0)
@@ -0,0 +1,173 @@
+import sdl2
+from typing import TYPE_CHECKING, Any, Iterable, Sequence, Union
+from ...widget.core.widget import Widget
+from ...widget.core.text import Text
+from ...core.utils.font import Font
+from ...core.utils.fenwick_tree import FenwickTree
+from ...typedef import screen_unit, RGBAvalue, RGBvalue
+from ...color import Color
+
+if TYPE_CHECKING:
+    from ...core.window.window import Window
+
+
+class ListView(Widget):
+    """
+    A scrollable list of text rows that stays fast with any number of rows.\n
+    Only the rows in view (plus 'overscan' rows above and below) have a Text, the Texts of rows that scroll out of view
+    are reused for the rows that scroll in, so memory and frame time don't grow with the row count.
+    Rows can have their own height, the heights are kept in a prefix sum tree to find the row at a scroll offset in O(log n).\n
+    Scrolls with the mouse wheel while the mouse is over the list. A list that is scrolled to the bottom keeps following new rows.
+    """
+
+    def __init__(self, window: 'Window', x: screen_unit, y: screen_unit, width: screen_unit, height: screen_unit, font: Font, rows: Sequence[Any] = (),
+                 text_color: Union[RGBvalue, RGBAvalue] = Color.BLACK, background_color: Union[RGBvalue, RGBAvalue] = Color.WHITE,
+                 row_height: screen_unit | None = None, overscan: int = 3, padding: screen_unit = 4) -> None:
+        super().__init__(window, x, y, width, height, background_color)
+        self._font = font
+        self._text_color = text_color
+        self._row_height = row_height if row_height is not None else sdl2.sdlttf.TTF_FontLineSkip(Text._open_font(font.path, font.size))
+        self._overscan = overscan
+        self._padding = padding
+        self.scroll_speed: screen_unit = self._row_height * 3
+
+        self._rows: list[Any] = []
+        self._heights = FenwickTree()
+        self._scroll = 0
+        self._follow_tail = True
+
+        self._realized: dict[int, Text] = {}  # row index -> Text of the rows in view
+        self._text_pool: list[Text] = []  # Texts of rows that scrolled out of view
+        self.set_rows(rows)
+
+    ########
+    # rows #
+    ########
+    def set_rows(self, rows: Sequence[Any], row_heights: Sequence[screen_unit] | None = None) -> None:
+        """
+        replace all rows, every row is drawn as str(row)\n
+        :param row_heights: a height per row, all rows get the default row height when not given
+        """
+        self._rows = list(rows)
+        self._heights = FenwickTree(row_heights if row_heights is not None else [self._row_height] * len(self._rows))
+        for index in list(self._realized):
+            self._release(index)
+        self.scroll_to(self._scroll)
+
+    def append_row(self, row: Any, height: screen_unit | None = None) -> None:
+        follow = self._follow_tail and self._scroll >= self._max_scroll()
+        self._rows.append(row)
+        self._heights.append(height if height is not None else self._row_height)
+        if follow:
+            self.scroll_to(self._max_scroll())
+
+    def set_row(self, index: int, row: Any) -> None:
+        self._rows[index] = row
+        text = self._realized.get(index)
+        if text is not None:
+            self._show_row(text, row)
+
+    def set_row_height(self, index: int, height: screen_unit) -> None:
+        self._heights.set(index, height)
+        self.scroll_to(self._scroll)
+
+    def get_row(self, index: int) -> Any:
+        return self._rows[index]
+
+    def get_row_count(self) -> int:
+        return len(self._rows)
+
+    def row_at(self, y: screen_unit) -> int | None:
+        """
+        the index of the row at a y position in the window, None when there is no row
+        """
+        offset = y - self.y + self._scroll
+        if not self._rows or y < self.y or y > self.y + self.h or offset >= self._heights.total():
+            return None
+        return self._heights.find(offset)
+
+    #############
+    # scrolling #
+    #############
+    def _max_scroll(self) -> screen_unit:
+        return max(self._heights.total() - self.h, 0)
+
+    def scroll_to(self, offset: screen_unit) -> None:
+        """
+        scroll so the top of the list is 'offset' pixels below the top of the first row
+        """
+        self._scroll = max(0, min(offset, self._max_scroll()))
+        self._follow_tail = self._scroll >= self._max_scroll()
+
+    def scroll_by(self, delta: screen_unit) -> None:
+        self.scroll_to(self._scroll + delta)
+
+    def scroll_to_row(self, index: int) -> None:
+        """
+        scroll so a row is at the top of the list, or as close as possible
+        """
+        self.scroll_to(self._heights.prefix_sum(index))
+
+    def get_scroll_offset(self) -> screen_unit:
+        return self._scroll
+
+    def get_visible_rows(self) -> range:
+        """
+        the indices of the rows that have a Text, the rows in view plus the overscan
+        """
+        if not self._rows:
+            return range(0)
+        first = self._heights.find(self._scroll)
+        last = self._heights.find(self._scroll + self.h)
+        return range(max(first - self._overscan, 0), min(last + 1 + self._overscan, len(self._rows)))
+
+    ######################
+    # row text recycling #
+    ######################
+    def _show_row(self, text: Text, row: Any) -> None:
+        text.set_text(row)
+        # a recycled Text keeps only the texture of its current row
+        text.clear_cache()
+
+    def _realize(self, index: int) -> Text:
+        text = self._text_pool.pop() if self._text_pool else Text(self.window, "", self._font, self._text_color)
+        self._show_row(text, self._rows[index])
+        self._realized[index] = text
+        return text
+
+    def _release(self, index: int) -> None:
+        self._text_pool.append(self._realized.pop(index))
+
+    def _update_realized_rows(self) -> range:
+        visible = self.get_visible_rows()
+        for index in [index for index in self._realized if index not in visible]:
+            self._release(index)
+        return visible
+
+    def _cycle(self) -> None:
+        super()._cycle()
+        if self.is_mouse_over():
+            _, wheel_y = self.window.mouse.get_wheel()
+            if wheel_y:
+                self.scroll_by(-wheel_y * self.scroll_speed)
+
+    def _owned_texts(self) -> Iterable[Text]:
+        return [*self._realized.values(), *self._text_pool]
+
+    def draw(self) -> None:
+        self.window.draw.rectangle(self.x, self.y, self.w, self.h, self._color)
+        visible = self._update_realized_rows()
+        if not visible:
+            return
+
+        self.window.draw.set_clip(self)
+        y = self.y + self._heights.prefix_sum(visible.start) - self._scroll
+        x = self.x + self._padding
+        for index in visible:
+            height = self._heights[index]
+            text = self._realized.get(index) or self._realize(index)
+            if text.texture is not None:
+                text.set_position(x, y + (height - text.height) / 2)
+                text.draw()
+            y += height
+        self.window.draw.set_clip(None)
@@ -1,5 +1,5 @@
 from ...widget.core.widget import Widget
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Iterable, Union
 from ...typedef import screen_unit, RGBAvalue, RGBvalue, percent
 from ...core.utils.font import Font
 from ...color import Color
@@ -15,6 +15,9 @@ class TextBox(Widget):
         self.text: Text = Text(self.window, text, font, text_color)
         
         
+    def _owned_texts(self) -> Iterable[Text]:
+        return (self.text,)
+
     def draw(self, text_x: Union[percent, xPos] = 50, text_y: Union[percent, yPos] = 50) -> None:
         
         self.window.draw.rectangle(self.x, self.y, self.w, self.h, self._color)
@@ -0,0 +1,90 @@
+import pytest
+from src.core.handler.animator import Animator
+from src.enum import easing, animationProperty
+
+class MockWidget:
+    """The widget attributes the animator reads and writes."""
+    handles = 0
+
+    def __init__(self, x=0, y=0):
+        MockWidget.handles += 1
+        self._handle = MockWidget.handles
+        self.x, self.y, self.w, self.h = x, y, 10, 10
+        self._color = (0, 0, 0, 255)
+        self._radius = 0
+        self.geometry_updates = 0
+
+    def reposition(self, x, y):
+        self.x, self.y = x, y
+        self.geometry_updates += 1
+
+    def resize(self, w, h):
+        self.w, self.h = w, h
+        self.geometry_updates += 1
+
+    def _corner_radius(self):
+        return self._radius
+
+def test_linear_position():
+    animator = Animator()
+    widget = MockWidget()
+    animator.animate(widget, animationProperty.position, (100, 50), 1, easing.linear, start_time=0)
+    animator.update(0.5)
+    assert (widget.x, widget.y) == (50, 25) and widget.geometry_updates == 1
+    animator.update(2)
+    assert (widget.x, widget.y) == (100, 50)
+    assert len(animator) == 0
+
+@pytest.mark.parametrize("function, expected", [(easing.in_quad, 25), (easing.out_quad, 75), (easing.in_out_quad, 50),
+                                                (easing.in_cubic, 12.5), (easing.out_cubic, 87.5), (easing.in_out_cubic, 50)])
+def test_easing_halfway(function, expected):
+    animator = Animator()
+    widget = MockWidget()
+    animator.animate(widget, animationProperty.radius, 100, 1, function, start_time=0)
+    animator.update(0.5)
+    assert widget._radius == pytest.approx(expected)
+
+def test_out_back_overshoots():
+    animator = Animator()
+    widget = MockWidget()
+    animator.animate(widget, animationProperty.radius, 100, 1, easing.out_back, start_time=0)
+    animator.update(0.7)
+    assert widget._radius > 100
+
+def test_color_alpha_and_delay():
+    animator = Animator()
+    widget = MockWidget()
+    animator.animate(widget, animationProperty.color, (200, 100, 0), 1, easing.linear, start_time=0)
+    animator.animate(widget, animationProperty.alpha, 0, 1, easing.linear, delay=1, start_time=0)
+    animator.update(0.5)
+    assert widget._color == (100, 50, 0, 255)
+    animator.update(1.5)
+    assert widget._color == (200, 100, 0, 128)
+
+def test_replace_and_cancel():
+    animator = Animator()
+    widget, other = MockWidget(), MockWidget()
+    animator.animate(widget, animationProperty.position, (100, 0), 1, easing.linear, start_time=0)
+    animator.animate(other, animationProperty.position, (0, 100), 1, easing.linear, start_time=0)
+    animator.animate(widget, animationProperty.position, (0, 100), 1, easing.linear, start_time=0)
+    assert len(animator) == 2
+    animator.cancel(widget)
+    assert not animator.is_animating(widget) and animator.is_animating(other, animationProperty.position)
+    animator.update(1)
+    assert (widget.x, widget.y) == (0, 0) and (other.x, other.y) == (0, 100)
+
+def test_many_tweens_and_callbacks():
+    animator = Animator(capacity=4)
+    widgets = [MockWidget() for _ in range(100)]
+    done = []
+    for i, widget in enumerate(widgets):
+        animator.animate(widget, animationProperty.size, (20, 20), 0.5 + (i % 2) * 0.5, easing.linear, on_complete=done.append, start_time=0)
+    animator.update(0.5)
+    assert len(animator) == 50
+    assert sorted(w._handle for w in done) == [w._handle for w in widgets[::2]]
+    animator.update(1)
+    assert len(done) == 100 and all(w.w == 20 for w in widgets)
+
+def test_invalid_target():
+    with pytest.raises(ValueError):
+        Animator().animate(MockWidget(), animationProperty.position, (1, 2, 3), 1)
@@ -0,0 +1,14 @@
+import pytest
+from src.core.handler.fps_counter import FPSCounter
+
+def test_tick_with_timestamp():
+    counter = FPSCounter()
+    start = counter.last_time
+    assert counter.tick(start + 0.25) == pytest.approx(0.25)
+    assert counter.tick(start + 0.5) == pytest.approx(0.25)
+    assert counter.get_fps() == pytest.approx(4), "2 frames presented in 0.5 seconds"
+
+def test_tick_without_timestamp():
+    counter = FPSCounter()
+    assert counter.tick() >= 0
+    assert counter.frame_count == 1
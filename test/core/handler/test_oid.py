@@ -0,0 +1,20 @@
+import gc
+import pytest
+from src.core.handler.OID import OID
+
+def test_oids_are_unique_integers():
+    oids = [OID() for _ in range(100)]
+    handles = [oid() for oid in oids]
+    assert all(isinstance(handle, int) for handle in handles)
+    assert len(set(handles)) == 100
+
+def test_released_index_is_reused_with_new_generation():
+    oid = OID()
+    handle, index, generation = oid(), oid.index, oid.generation
+    del oid
+    gc.collect()
+
+    new_oid = OID()
+    assert new_oid.index == index
+    assert new_oid.generation == generation + 1
+    assert new_oid() != handle
@@ -0,0 +1,33 @@
+import random
+import pytest
+from src.core.utils.fenwick_tree import FenwickTree
+
+def test_prefix_sums():
+    values = [random.randint(1, 50) for _ in range(500)]
+    tree = FenwickTree(values)
+    for count in (0, 1, 7, 250, 500):
+        assert tree.prefix_sum(count) == sum(values[:count])
+    assert tree.total() == sum(values)
+
+def test_set():
+    tree = FenwickTree([10] * 100)
+    tree.set(50, 30)
+    assert tree[50] == 30
+    assert tree.prefix_sum(51) == 530
+    assert tree.total() == 1020
+
+def test_append_matches_build():
+    values = [random.randint(1, 50) for _ in range(300)]
+    appended = FenwickTree()
+    for value in values:
+        appended.append(value)
+    assert appended._tree == FenwickTree(values)._tree
+
+@pytest.mark.parametrize("position, expected", [(0, 0), (9, 0), (10, 1), (29, 1), (30, 2), (59, 2), (60, 2), (-5, 0)])
+def test_find(position, expected):
+    tree = FenwickTree([10, 20, 30])
+    assert tree.find(position) == expected
+
+def test_find_uniform_rows():
+    tree = FenwickTree([18] * 100000)
+    assert tree.find(18 * 54321 + 5) == 54321
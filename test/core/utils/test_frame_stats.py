@@ -0,0 +1,15 @@
+import pytest
+from src.core.utils.frame_stats import FrameStats
+
+def test_new_frame_resets_counters():
+    stats = FrameStats()
+    stats.draw_calls += 3
+    stats.vertices += 12
+    stats.live_textures += 2
+    stats.new_frame()
+
+    assert stats.last["draw_calls"] == 3
+    assert stats.last["vertices"] == 12
+    assert stats.draw_calls == 0 and stats.vertices == 0
+    assert stats.live_textures == 2, "live textures are not a per frame counter"
+    assert stats.frame == 1
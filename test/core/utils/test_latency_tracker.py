@@ -0,0 +1,36 @@
+import pytest
+from time import perf_counter
+from src.core.utils.latency_tracker import LatencyTracker
+
+def test_presented_resolves_pending_inputs():
+    tracker = LatencyTracker()
+    tracker._pending = [10.0, 10.5]
+    tracker.presented(11.0)
+
+    assert list(tracker.latencies()) == [1.0, 0.5]
+    tracker.presented(12.0)
+    assert len(tracker.latencies()) == 2, "inputs are only resolved by the first present after them"
+
+def test_ring_buffer_keeps_newest():
+    tracker = LatencyTracker(capacity=3)
+    for latency in (1, 2, 3, 4, 5):
+        tracker._pending = [0.0]
+        tracker.presented(float(latency))
+
+    assert list(tracker.latencies()) == [3, 4, 5]
+
+def test_summary():
+    tracker = LatencyTracker()
+    assert tracker.summary() == {"count": 0}
+
+    tracker._pending = [0.0] * 100
+    tracker.presented(0.01)
+    summary = tracker.summary()
+    assert summary["count"] == 100
+    assert summary["p99"] == pytest.approx(0.01)
+
+def test_add_inputs_converts_sdl_ticks():
+    tracker = LatencyTracker()
+    tracker.add_inputs([0])
+    assert len(tracker._pending) == 1
+    assert tracker._pending[0] <= perf_counter()
@@ -0,0 +1,82 @@
+import json
+import threading
+import pytest
+from src.core.utils.profiler import Profiler
+
+def test_disabled_profiler_records_nothing():
+    profiler = Profiler(capacity=16)
+    with profiler.span("idle"):
+        pass
+    assert profiler.spans() == []
+
+def test_nested_spans():
+    profiler = Profiler(capacity=16)
+    profiler.enable(instrument=False)
+    with profiler.span("outer"):
+        with profiler.span("inner"):
+            pass
+    names = [name for name, _, _ in profiler.spans()]
+    assert names == ["inner", "outer"], "spans are recorded when they end"
+    summary = profiler.summary()
+    assert summary["outer"]["total"] >= summary["inner"]["total"]
+
+def test_profile_decorator():
+    profiler = Profiler(capacity=16)
+
+    @profiler.profile("work")
+    def work(value):
+        return value * 2
+
+    assert work(2) == 4
+    assert profiler.spans() == [], "nothing is recorded before enabling"
+    profiler.enable(instrument=False)
+    assert work(3) == 6
+    assert profiler.summary()["work"]["count"] == 1
+
+def test_ring_buffer_overwrites_oldest():
+    profiler = Profiler(capacity=4)
+    profiler.enable(instrument=False)
+    for i in range(6):
+        with profiler.span(str(i)):
+            pass
+    assert [name for name, _, _ in profiler.spans()] == ["2", "3", "4", "5"]
+
+def test_export_chrome_trace(tmp_path):
+    profiler = Profiler(capacity=8)
+    profiler.enable(instrument=False)
+    with profiler.span("frame"):
+        pass
+    path = tmp_path / "trace.json"
+    profiler.export_chrome_trace(str(path))
+    events = json.loads(path.read_text())["traceEvents"]
+    assert len(events) == 1
+    assert events[0]["name"] == "frame" and events[0]["ph"] == "X"
+    assert events[0]["dur"] >= 0
+
+def test_instrument_and_restore():
+    class Subject:
+        def method(self):
+            return 1
+
+    original = Subject.method
+    profiler = Profiler(capacity=8)
+    profiler.instrument(Subject, "method")
+    profiler.enable(instrument=False)
+    assert Subject().method() == 1
+    profiler.disable()
+    assert Subject.method is original
+    assert profiler.summary()["Subject.method"]["count"] == 1
+
+def test_span_finished_late_on_another_thread_keeps_newer_spans():
+    profiler = Profiler(capacity=16)
+    profiler.enable(instrument=False)
+    for _ in range(6):
+        with profiler.span("main"):
+            pass
+    # a span on the worker thread that took its slot before the last main thread spans but ends after them
+    profiler._counter = iter([2])
+    worker = threading.Thread(target=profiler._record, args=(profiler._intern("worker"), 0.0, 1.0))
+    worker.start()
+    worker.join()
+    names = [name for name, _, _ in profiler.spans()]
+    assert len(names) == 6 and names[2] == "worker"
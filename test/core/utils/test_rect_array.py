@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from src.core.window.rect import Rect
+from src.core.window.rect_array import RectArray
+
+def test_interop_with_rect():
+    rects = RectArray([Rect(0, 0, 10, 10), (5, 5, 20, 20)])
+    assert len(rects) == 2
+    assert rects[1].unpack() == (5, 5, 20, 20)
+    rects[0] = Rect(1, 2, 3, 4)
+    assert [rect.unpack() for rect in rects.to_rects()] == [(1, 2, 3, 4), (5, 5, 20, 20)]
+    assert isinstance(rects[:1], RectArray)
+
+@pytest.mark.parametrize("x, y", [(100, 100), (99, 100), (300, 120), (301, 120), (200, 200), (200, 201)])
+def test_point_matches_rect(x, y):
+    rect = Rect(100, 100, 200, 100)
+    assert RectArray([rect]).collide_with_point(x, y)[0] == rect.collide_with_point(x, y)
+
+def test_rect_collision_matches_sdl():
+    rects = RectArray([(0, 0, 10, 10), (10, 0, 10, 10), (5, 5, 10, 10), (0, 0, 0, 10)])
+    probe = Rect(0, 0, 10, 10)
+    expected = [probe.collide_with_rect(rect) for rect in rects]
+    assert list(rects.collide_with_rect(probe)) == expected == [True, False, True, False]
+
+def test_colliding_pairs():
+    rects = RectArray([(0, 0, 10, 10), (5, 5, 10, 10), (100, 100, 5, 5), (8, 8, 1, 1)])
+    pairs = {tuple(pair) for pair in rects.colliding_pairs()}
+    assert pairs == {(0, 1), (0, 3), (1, 3)}
+
+def test_union():
+    rects = RectArray([(0, 0, 10, 10), (20, 30, 5, 5)])
+    assert rects.union().unpack() == Rect(0, 0, 10, 10).union(Rect(20, 30, 5, 5)).unpack()
+
+def test_expand_and_translate_match_rect():
+    rect = Rect(100, 200, 400, 150)
+    rects = RectArray([rect])
+    rect.expand(20)
+    rects.expand(20)
+    assert rects[0].unpack() == rect.unpack()
+
+    rects.shrink(20)
+    rects.translate(5, -5)
+    assert rects[0].unpack() == (105, 195, 400, 150)
+
+def test_abs():
+    rects = RectArray([(10, 10, -5, -5)])
+    rects.abs()
+    assert rects[0].unpack() == (5, 5, 5, 5)
@@ -0,0 +1,74 @@
+import sdl2
+import pytest
+from src import data
+from src.core.utils.resource_manager import ResourceManager
+from src.core.utils.frame_stats import FrameStats
+from src.enum import resourceType
+
+class MockRenderer:
+    def __init__(self):
+        self.surface = sdl2.SDL_CreateRGBSurfaceWithFormat(0, 64, 64, 32, sdl2.SDL_PIXELFORMAT_ARGB8888)
+        self.sdlrenderer = sdl2.SDL_CreateSoftwareRenderer(self.surface)
+
+class Owner:
+    pass
+
+@pytest.fixture
+def renderer():
+    return MockRenderer()
+
+def texture(renderer):
+    return sdl2.SDL_CreateTexture(renderer.sdlrenderer, sdl2.SDL_PIXELFORMAT_ARGB8888, sdl2.SDL_TEXTUREACCESS_STATIC, 4, 4)
+
+def surface():
+    return sdl2.SDL_CreateRGBSurfaceWithFormat(0, 4, 4, 32, sdl2.SDL_PIXELFORMAT_ARGB8888)
+
+def test_track_and_release(renderer):
+    stats = FrameStats()
+    resources = ResourceManager(stats)
+    tracked = resources.track(texture(renderer), resourceType.texture)
+    assert tracked in resources and stats.live_textures == 1
+    assert resources.release(tracked)
+    assert tracked not in resources and stats.live_textures == 0
+    assert not resources.release(tracked), "a resource is only freed once"
+
+def test_track_twice_fails(renderer):
+    resources = ResourceManager()
+    tracked = resources.track(surface(), resourceType.surface)
+    with pytest.raises(ValueError):
+        resources.track(tracked, resourceType.surface)
+    resources.release_all()
+
+def test_release_owner(renderer):
+    stats = FrameStats()
+    resources = ResourceManager(stats)
+    first, second = Owner(), Owner()
+    for _ in range(3):
+        resources.track(texture(renderer), resourceType.texture, first)
+    resources.track(surface(), resourceType.surface, first)
+    kept = resources.track(texture(renderer), resourceType.texture, second)
+    assert resources.get_owned_count(first) == 4
+    assert resources.release_owner(first) == 4
+    assert resources.get_owned_count(first) == 0 and resources.release_owner(first) == 0
+    assert kept in resources and stats.live_textures == 1
+    assert resources.get_live_counts() == {"texture": 1, "surface": 0, "font": 0, "cursor": 0}
+
+def test_release_all(renderer):
+    stats = FrameStats()
+    resources = ResourceManager(stats)
+    resources.track(texture(renderer), resourceType.texture, Owner())
+    resources.track(surface(), resourceType.surface)
+    assert resources.release_all() == 2
+    assert len(resources) == 0 and stats.live_textures == 0
+
+def test_report_stacks_in_debug_mode(renderer, monkeypatch):
+    monkeypatch.setattr(data, "debugging", False)
+    resources = ResourceManager()
+    resources.track(surface(), resourceType.surface)
+    assert "created at" not in resources.report()
+    monkeypatch.setattr(data, "debugging", True)
+    resources.track(surface(), resourceType.surface)
+    report = resources.report()
+    assert report.startswith("live resources: 0 texture, 2 surface")
+    assert "1 surface created at" in report and "test_report_stacks_in_debug_mode" in report
+    resources.release_all()
@@ -0,0 +1,38 @@
+import random
+import pytest
+from src.core.utils.skyline_packer import SkylinePacker
+
+def overlaps(a, b):
+    return a[0] < b[0] + b[2] and b[0] < a[0] + a[2] and a[1] < b[1] + b[3] and b[1] < a[1] + a[3]
+
+def test_first_rect_bottom_left():
+    packer = SkylinePacker(100, 100)
+    assert packer.insert(30, 20) == (0, 0)
+    assert packer.insert(30, 20) == (30, 0)
+
+def test_fills_lowest_gap_first():
+    packer = SkylinePacker(100, 100)
+    packer.insert(60, 50)
+    packer.insert(40, 10)
+    assert packer.insert(40, 10) == (60, 10)
+
+def test_full_returns_none():
+    packer = SkylinePacker(10, 10)
+    assert packer.insert(10, 10) == (0, 0)
+    assert packer.insert(1, 1) is None
+    assert packer.insert(11, 1) is None and packer.insert(0, 5) is None
+
+def test_random_rects_dont_overlap():
+    random.seed(3)
+    packer = SkylinePacker(256, 256)
+    placed = []
+    for _ in range(300):
+        w, h = random.randint(1, 32), random.randint(1, 32)
+        position = packer.insert(w, h)
+        if position is not None:
+            rect = (*position, w, h)
+            assert rect[0] + w <= 256 and rect[1] + h <= 256
+            assert not any(overlaps(rect, other) for other in placed)
+            placed.append(rect)
+    assert packer.occupancy() == pytest.approx(sum(w * h for *_, w, h in placed) / 256 ** 2)
+    assert packer.occupancy() > 0.7
@@ -0,0 +1,52 @@
+import gc
+import pytest
+from src.core.handler.OID import OID
+from src.core.utils.slot_map import SlotMap
+
+def test_insert_lookup_remove():
+    slots = SlotMap()
+    oids = [OID() for _ in range(10)]
+    for i, oid in enumerate(oids):
+        slots[oid()] = i
+
+    assert len(slots) == 10
+    assert slots[oids[3]()] == 3
+    del slots[oids[3]()]
+    assert oids[3]() not in slots
+    assert sorted(slots.values()) == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+    assert all(slots[oid()] == i for i, oid in enumerate(oids) if i != 3), "the moved value is still found"
+
+def test_pop_default():
+    slots = SlotMap()
+    oid = OID()
+    assert slots.pop(oid(), None) is None
+    with pytest.raises(KeyError):
+        slots.pop(oid())
+    slots[oid()] = "a"
+    assert slots.pop(oid()) == "a"
+    assert len(slots) == 0
+
+def test_stale_handle_is_missing():
+    slots = SlotMap()
+    oid = OID()
+    stale = oid()
+    slots[stale] = "old"
+    del slots[stale]
+    del oid
+    gc.collect()
+
+    new_oid = OID()
+    slots[new_oid()] = "new"
+    assert stale not in slots
+    assert slots.get(stale) is None
+    assert slots[new_oid()] == "new"
+
+def test_many_widgets():
+    slots = SlotMap()
+    oids = [OID() for _ in range(10000)]
+    for oid in oids:
+        slots[oid()] = oid
+    for oid in oids[::2]:
+        del slots[oid()]
+    assert len(slots) == 5000
+    assert all(slots[oid()] is oid for oid in oids[1::2])
@@ -0,0 +1,51 @@
+import pytest
+from src.core.utils.spatial_grid import SpatialGrid
+
+def test_query_point():
+    grid = SpatialGrid(cell_size=64)
+    grid.insert("a", 10, 10, 50, 50)
+    grid.insert("b", 40, 40, 100, 100)
+    grid.insert("c", 300, 300, 10, 10)
+
+    assert sorted(grid.query_point(20, 20)) == ["a"]
+    assert sorted(grid.query_point(50, 50)) == ["a", "b"]
+    assert sorted(grid.query_point(60, 60)) == ["a", "b"], "edges are included"
+    assert grid.query_point(200, 10) == []
+
+def test_query_rect():
+    grid = SpatialGrid(cell_size=32)
+    grid.insert("a", 0, 0, 10, 10)
+    grid.insert("b", 100, 100, 10, 10)
+    grid.insert("c", 500, 0, 10, 10)
+
+    assert grid.query_rect(5, 5, 100, 100) == {"a", "b"}
+    assert grid.query_rect(200, 200, 10, 10) == set()
+
+def test_update_moves_item():
+    grid = SpatialGrid(cell_size=64)
+    grid.insert("a", 0, 0, 10, 10)
+    grid.update("a", 200, 200, 10, 10)
+
+    assert grid.query_point(5, 5) == []
+    assert grid.query_point(205, 205) == ["a"]
+    assert (0, 0) not in grid._cells, "empty cells are removed"
+
+def test_remove():
+    grid = SpatialGrid()
+    grid.insert("a", 0, 0, 10, 10)
+    grid.remove("a")
+
+    assert "a" not in grid
+    assert len(grid) == 0
+    assert grid.query_point(5, 5) == []
+
+def test_negative_size_and_negative_coordinates():
+    grid = SpatialGrid(cell_size=16)
+    grid.insert("a", 10, 10, -30, -30)
+
+    assert grid.query_point(-15, -15) == ["a"]
+    assert grid.query_point(11, 11) == []
+
+def test_invalid_cell_size():
+    with pytest.raises(ValueError):
+        SpatialGrid(0)
@@ -0,0 +1,49 @@
+import random
+from src.core.utils.text_index import TextIndex
+
+LABELS = ["Apple", "apricot", "Banana", "pineapple", "grape", "Grapefruit", "", "ab", "Äpfel", "papaya pap"]
+
+def brute_force(labels, query):
+    query = query.casefold()
+    if len(query) < 3:
+        return [i for i, label in enumerate(labels) if label.casefold().startswith(query)]
+    return [i for i, label in enumerate(labels) if query in label.casefold()]
+
+def test_empty_query_matches_all():
+    assert TextIndex(LABELS).search("").tolist() == list(range(len(LABELS)))
+
+def test_short_query_matches_prefix():
+    index = TextIndex(LABELS)
+    assert index.search("ap").tolist() == [0, 1]
+    assert index.search("GR").tolist() == [4, 5]
+    assert index.search("äp").tolist() == [8]
+
+def test_long_query_matches_anywhere():
+    index = TextIndex(LABELS)
+    assert index.search("APPLE").tolist() == [0, 3]
+    assert index.search("ape").tolist() == [4, 5]
+    assert index.search("xyz").tolist() == []
+
+def test_label_with_repeated_match_is_returned_once():
+    assert TextIndex(LABELS).search("pap").tolist() == [9]
+
+def test_typing_narrows_matches():
+    index = TextIndex(LABELS)
+    for query in ["g", "gr", "gra", "grap", "grapef", "grapefx"]:
+        assert index.search(query).tolist() == brute_force(LABELS, query)
+    # deleting a character searches the whole index again
+    assert index.search("gra").tolist() == brute_force(LABELS, "gra")
+
+def test_matches_brute_force():
+    rng = random.Random(4)
+    labels = ["".join(rng.choice("abcAB -") for _ in range(rng.randint(0, 12))) for _ in range(500)]
+    index = TextIndex(labels)
+    for _ in range(300):
+        query = "".join(rng.choice("abc -") for _ in range(rng.randint(1, 5)))
+        assert index.search(query).tolist() == brute_force(labels, query)
+
+def test_empty_index():
+    index = TextIndex([])
+    assert len(index) == 0
+    assert index.search("abc").tolist() == []
+    assert index.search("a").tolist() == []
@@ -0,0 +1,82 @@
+import time
+import pytest
+import sdl2
+from src.core.utils.cache.texture_cache import TextureCache
+from src.core.utils.frame_stats import FrameStats
+from src.core.utils.resource_manager import ResourceManager
+
+class MockRenderer:
+    def __init__(self):
+        self.surface = sdl2.SDL_CreateRGBSurfaceWithFormat(0, 64, 64, 32, sdl2.SDL_PIXELFORMAT_ARGB8888)
+        self.sdlrenderer = sdl2.SDL_CreateSoftwareRenderer(self.surface)
+
+class MockWindow:
+    """A window with a software renderer, textures don't need a real window."""
+    def __init__(self):
+        self._renderer = MockRenderer()
+        self.stats = FrameStats()
+        self.resources = ResourceManager(self.stats)
+        self.frame_counter = 0
+
+@pytest.fixture
+def image_path(tmp_path):
+    surface = sdl2.SDL_CreateRGBSurfaceWithFormat(0, 20, 10, 32, sdl2.SDL_PIXELFORMAT_ARGB8888)
+    path = str(tmp_path / "image.bmp")
+    sdl2.SDL_SaveBMP(surface, path.encode())
+    sdl2.SDL_FreeSurface(surface)
+    return path
+
+def request_until_loaded(cache, *key):
+    for _ in range(200):
+        texture = cache.request(*key)
+        if texture is not None:
+            return texture
+        time.sleep(0.005)
+
+def test_request_decodes_in_background(image_path):
+    window = MockWindow()
+    cache = TextureCache(window)
+    assert cache.request(image_path, 40, 30) is None
+    assert cache.is_pending(image_path, 40, 30)
+
+    _, width, height = request_until_loaded(cache, image_path, 40, 30)
+    assert (width, height) == (40, 30)
+    assert window.stats.texture_uploads == 1
+    assert cache.request(image_path, 40, 30)[1:] == (40, 30)
+    assert window.stats.texture_uploads == 1
+
+def test_load_keeps_file_size(image_path):
+    window = MockWindow()
+    cache = TextureCache(window)
+    assert cache.load(image_path)[1:] == (20, 10)
+    assert cache.get_memory_usage() == 20 * 10 * 4
+
+def test_least_recently_used_is_evicted(image_path):
+    window = MockWindow()
+    cache = TextureCache(window, max_bytes=3 * 10 * 10 * 4)
+    for size in (10, 11, 12):
+        cache.load(image_path, size, 10)
+        if size == 11:
+            cache.load(image_path, 10, 10)  # keep the first texture in use
+    assert (image_path, 10, 10) in cache
+    assert (image_path, 11, 10) not in cache
+    assert len(cache) == 2 and window.stats.live_textures == 2
+
+def test_upload_limit_per_frame(image_path):
+    window = MockWindow()
+    cache = TextureCache(window, max_uploads_per_frame=1)
+    keys = [(image_path, size, size) for size in range(1, 4)]
+    for key in keys:
+        cache.request(*key)
+    for key in keys:
+        while not cache._pending[key].done():
+            time.sleep(0.005)
+
+    assert sum(cache.request(*key) is not None for key in keys) == 1
+    window.frame_counter += 1
+    assert sum(cache.request(*key) is not None for key in keys) == 2
+
+def test_missing_file(tmp_path):
+    cache = TextureCache(MockWindow())
+    assert cache.load(str(tmp_path / "missing.png")) is None
+    assert cache.request(str(tmp_path / "missing.png")) is None
@@ -0,0 +1,91 @@
+import json
+import threading
+import time
+import pytest
+from src.core.utils.widget_costs import WidgetCosts
+from src.core.utils.frame_stats import FrameStats
+from src.core.window import frame_pipeline
+from src.core.window.frame_pipeline import FramePipeline
+from src.widget.core.widget import Widget
+
+class MockWindow:
+    def __init__(self):
+        self.stats = FrameStats()
+        self.widget_costs = WidgetCosts(self)
+
+class CostlyWidget(Widget):
+    """A widget that doesn't register at a window, its cycle and draw take 'cost' seconds."""
+    def __init__(self, window, handle, cost, draw_calls=1):
+        self.window, self._handle, self.cost, self.draw_calls = window, handle, cost, draw_calls
+
+    def _cycle(self):
+        time.sleep(self.cost)
+
+    def draw(self):
+        time.sleep(self.cost)
+        self.window.stats.draw_calls += self.draw_calls
+        self.window.stats.text_cache_misses += 1
+
+@pytest.fixture
+def window():
+    window = MockWindow()
+    yield window
+    window.widget_costs.disable()
+
+def test_draw_methods_are_never_patched(window):
+    original = CostlyWidget.__dict__["draw"]
+    window.widget_costs.enable()
+    assert CostlyWidget.__dict__["draw"] is original
+    window.widget_costs.disable()
+    assert CostlyWidget.__dict__["draw"] is original
+
+def test_costs_per_widget(window):
+    cheap, costly = CostlyWidget(window, 1, 0), CostlyWidget(window, 2, 0.002, draw_calls=3)
+    costs = window.widget_costs
+    cheap.draw()
+    assert costs.get(1) is None  # only the draws of 'Window.draw_widgets' are measured
+
+    costs.enable()
+    for _ in range(3):
+        costs._cycle_widgets([cheap, costly])
+        costs._draw_widgets([cheap, costly])
+    top = costs.top(2)
+    assert [row["oid"] for row in top] == [2, 1]
+    assert top[0]["widget"] == "CostlyWidget"
+    assert top[0]["cycles"] == 3 and top[0]["draws"] == 3
+    assert top[0]["draw_calls"] == 9 and top[0]["rasterizations"] == 3
+    assert top[0]["cycle_mean"] >= 0.002 and top[0]["draw_mean"] >= 0.002
+    assert top[0]["total"] >= 0.012
+    assert costs.top(1, sort_by="draw_calls")[0]["oid"] == 2
+    assert "CostlyWidget" in costs.table()
+
+def test_dump_and_clear(window, tmp_path):
+    costs = window.widget_costs
+    costs.enable()
+    costs._draw_widgets([CostlyWidget(window, 7, 0)])
+    path = tmp_path / "costs.json"
+    costs.dump(str(path))
+    assert [row["oid"] for row in json.loads(path.read_text())] == [7]
+    costs.clear()
+    assert costs.top() == []
+
+def test_invalid_sort_key(window):
+    with pytest.raises(ValueError):
+        window.widget_costs.top(sort_by="color")
+
+class UploadingWidget(CostlyWidget):
+    """Makes a texture in every draw, on the worker of a pipelined window it is created on the main thread later."""
+    def draw(self):
+        frame_pipeline.current_pipeline().defer_texture(None, None)
+
+def test_uploads_of_a_pipelined_window(window):
+    pipeline = FramePipeline(window)
+    costs = window.widget_costs
+    costs.enable()
+    def frame():
+        frame_pipeline._local.pipeline = pipeline
+        costs._draw_widgets([CostlyWidget(window, 1, 0), UploadingWidget(window, 2, 0)])
+    thread = threading.Thread(target=frame)
+    thread.start()
+    thread.join()
+    assert costs.get(1)["texture_uploads"] == 0 and costs.get(2)["texture_uploads"] == 1
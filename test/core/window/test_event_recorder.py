@@ -0,0 +1,41 @@
+import pytest
+import sdl2
+from src.core.window.event_recorder import EventRecorder, EventReplay
+from src.exceptions import InvalidRecordingError
+
+def motion_event(x, y):
+    event = sdl2.SDL_Event()
+    event.type = sdl2.SDL_MOUSEMOTION
+    event.motion.x, event.motion.y = x, y
+    return event
+
+def test_record_and_replay(tmp_path):
+    path = tmp_path / "session.plev"
+    with EventRecorder(str(path)) as recorder:
+        recorder.record([motion_event(1, 2)])
+        recorder.record([])
+        recorder.record([motion_event(3, 4), motion_event(5, 6)])
+        recorder.record([])
+        recorder.record([])
+
+    replay = EventReplay(str(path))
+    assert replay.frame_count == 5, "empty frames at the end are kept"
+
+    frames = [[(event.motion.x, event.motion.y) for event in replay.next_frame()] for _ in range(5)]
+    assert frames == [[(1, 2)], [], [(3, 4), (5, 6)], [], []]
+    assert replay.finished
+
+def test_empty_frames_are_not_stored(tmp_path):
+    path = tmp_path / "session.plev"
+    with EventRecorder(str(path)) as recorder:
+        for _ in range(1000):
+            recorder.record([])
+
+    assert path.stat().st_size < 100
+    assert EventReplay(str(path)).frame_count == 1000
+
+def test_invalid_recording(tmp_path):
+    path = tmp_path / "not_a_recording.plev"
+    path.write_bytes(b"definitely not events")
+    with pytest.raises(InvalidRecordingError):
+        EventReplay(str(path))
@@ -0,0 +1,155 @@
+import ctypes
+import threading
+import pytest
+import sdl2
+from src.core.window.draw import Draw
+from src.core.window.frame_pipeline import DeferredTexture, FramePipeline, current_pipeline
+from src.core.utils.frame_stats import FrameStats
+from src.core.utils.resource_manager import ResourceManager
+from src.enum import resourceType
+
+class MockRenderer:
+    def __init__(self):
+        self.surface = sdl2.SDL_CreateRGBSurfaceWithFormat(0, 64, 64, 32, sdl2.SDL_PIXELFORMAT_ARGB8888)
+        self.sdlrenderer = sdl2.SDL_CreateSoftwareRenderer(self.surface)
+
+class MockWindow:
+    size = (64, 64)
+
+def pixel(renderer, x, y):
+    contents = renderer.surface.contents
+    return ctypes.cast(contents.pixels, ctypes.POINTER(ctypes.c_uint32))[y * contents.pitch // 4 + x]
+
+def draw_scene(draw):
+    draw.rectangle(0, 0, 32, 32, (255, 0, 0))
+    draw.set_clip(sdl2.SDL_Rect(32, 0, 32, 64))
+    draw.rectangle(0, 32, 64, 32, (0, 0, 255))
+    draw.set_clip(None)
+    draw.line(0, 63, 63, 63, (0, 255, 0))
+
+def render(record):
+    renderer = MockRenderer()
+    draw = Draw(MockWindow(), renderer, FrameStats())
+    if record:
+        draw._begin_recording()
+        draw_scene(draw)
+        commands = draw._end_recording()
+        assert pixel(renderer, 10, 10) == 0, "nothing is drawn while recording"
+        draw._submit(commands)
+    else:
+        draw_scene(draw)
+    return renderer, draw
+
+def test_recorded_frame_draws_the_same():
+    direct, direct_draw = render(False)
+    recorded, recorded_draw = render(True)
+    for x, y in ((10, 10), (10, 40), (40, 40), (20, 63)):
+        assert pixel(recorded, x, y) == pixel(direct, x, y)
+    assert pixel(recorded, 10, 40) == 0, "the clip is recorded"
+    assert recorded_draw._stats.draw_calls == direct_draw._stats.draw_calls
+
+def test_recorded_commands_are_immutable():
+    draw = Draw(MockWindow(), MockRenderer())
+    draw._begin_recording()
+    draw.rectangle(0, 0, 10, 10, (255, 0, 0))
+    draw.rectangle(20, 0, 10, 10, (0, 255, 0))
+    commands = draw._end_recording()
+    assert isinstance(commands, tuple) and len(commands) == 2
+    _, _, vertices, indices = commands[0]
+    assert not vertices.flags.writeable and not indices.flags.writeable
+    assert commands[0][2] is not commands[1][2], "every command has its own vertices"
+
+def texture_maker(renderer, resources):
+    def create(surface):
+        texture = sdl2.SDL_CreateTextureFromSurface(renderer.sdlrenderer, surface)
+        sdl2.SDL_FreeSurface(surface)
+        return resources.track(texture, resourceType.texture)
+    return create
+
+def new_surface():
+    return sdl2.SDL_CreateRGBSurfaceWithFormat(0, 4, 4, 32, sdl2.SDL_PIXELFORMAT_ARGB8888)
+
+def test_deferred_texture():
+    renderer, resources = MockRenderer(), ResourceManager()
+    texture = DeferredTexture(new_surface(), texture_maker(renderer, resources))
+    assert texture() is None
+    texture._resolve()
+    assert texture() is not None and texture() in resources
+    texture._resolve()
+    assert len(resources) == 1, "a texture is only created once"
+    texture.cancel(resources)
+    assert len(resources) == 0
+
+def test_cancelled_texture_is_never_created():
+    renderer, resources = MockRenderer(), ResourceManager()
+    texture = DeferredTexture(new_surface(), texture_maker(renderer, resources))
+    texture.cancel(resources)
+    texture._resolve()
+    assert texture() is None and len(resources) == 0
+
+def test_deferred_frees():
+    renderer, stats = MockRenderer(), FrameStats()
+    resources = ResourceManager(stats)
+    texture = resources.track(sdl2.SDL_CreateTexture(renderer.sdlrenderer, sdl2.SDL_PIXELFORMAT_ARGB8888,
+                                                     sdl2.SDL_TEXTUREACCESS_STATIC, 4, 4), resourceType.texture)
+    resources._start_deferring()
+    resources.release(texture)
+    assert texture not in resources and stats.live_textures == 0
+    deferred = resources._take_deferred()
+    assert deferred == ((sdl2.SDL_DestroyTexture, texture),)
+    assert resources._take_deferred() == ()
+    assert resources._stop_deferring() == ()
+    for destroy, resource in deferred:
+        destroy(resource)
+
+def test_current_pipeline_only_on_the_worker():
+    pipeline = FramePipeline.__new__(FramePipeline)
+    found = []
+    def work():
+        from src.core.window import frame_pipeline
+        frame_pipeline._local.pipeline = pipeline
+        found.append(current_pipeline())
+    thread = threading.Thread(target=work)
+    thread.start()
+    thread.join()
+    assert found == [pipeline] and current_pipeline() is None
+
+class RunningWindow:
+    """The parts of a window 'FramePipeline.run' uses, the events close it in frame 'close_frame' and other windows stay open."""
+    def __init__(self, close_frame):
+        self.close_frame, self.frame_counter, self._closed = close_frame, 0, False
+        self._renderer = MockRenderer()
+        self.stats = FrameStats()
+        self.resources = ResourceManager(self.stats)
+        self.draw = Draw(MockWindow(), self._renderer, self.stats)
+        self.pipeline = FramePipeline(self)
+        self.presented = 0
+
+    def is_init_frame(self):
+        return self.frame_counter <= 1
+
+    def _handle_events(self, fps):
+        if self.frame_counter == self.close_frame:
+            self.close()
+
+    def _update_frame(self):
+        pass
+
+    def _present(self, new_frame=True):
+        self.presented += 1
+
+    def close(self, quit_program=False):
+        self.pipeline.stop()
+        self._closed = True
+
+@pytest.mark.parametrize("close_in_update, presented", [(False, 2), (True, 3)])
+def test_run_returns_when_the_window_is_closed(close_in_update, presented):
+    window = RunningWindow(close_frame=None if close_in_update else 4)
+    def update():
+        if close_in_update and window.frame_counter == 4:
+            window.pipeline.request_close(False)
+    thread = threading.Thread(target=window.pipeline.run, args=(update, (0, 0, 0), 60), daemon=True)
+    thread.start()
+    thread.join(5)
+    assert not thread.is_alive(), "the frame loop stops after the window is closed"
+    assert not window.pipeline.is_running() and window.presented == presented
@@ -0,0 +1,56 @@
+import pytest
+import numpy as np
+from src.core.window.gradient import Gradient, LinearGradient, RadialGradient
+from src.exceptions import ColorError
+
+SQUARE = np.array([[0, 0], [100, 0], [100, 100], [0, 100]], dtype=np.float32)
+SQUARE_INDICES = np.array([0, 1, 2, 2, 3, 0], dtype=np.int32)
+
+def test_two_color_linear_gradient_keeps_the_corners():
+    vertices, indices, colors = LinearGradient([(0, 0, 0), (255, 255, 255)])._apply(SQUARE, SQUARE_INDICES)
+    assert len(vertices) == 4 and indices.tolist() == SQUARE_INDICES.tolist()
+    assert colors.tolist() == [[0, 0, 0, 255], [0, 0, 0, 255], [255, 255, 255, 255], [255, 255, 255, 255]]
+
+def test_horizontal_gradient():
+    _, _, colors = LinearGradient([(0, 0, 0, 0), (200, 100, 50, 255)], start=(0, 0), end=(1, 0))._apply(SQUARE, SQUARE_INDICES)
+    assert colors[:, 0].tolist() == [0, 200, 200, 0]
+    assert colors[:, 3].tolist() == [0, 255, 255, 0]
+
+def test_more_colors_split_the_shape():
+    gradient = LinearGradient([(255, 0, 0), (0, 255, 0), (0, 0, 255)])
+    vertices, indices, colors = gradient._apply(SQUARE, SQUARE_INDICES)
+    assert len(vertices) > 4 and len(indices) == len(vertices)
+    # the middle color shows where the vertices are halfway down
+    middle = np.isclose(vertices[:, 1], 50)
+    assert middle.any()
+    assert (colors[middle] == (0, 255, 0, 255)).all()
+
+def test_gradient_past_its_end_is_split():
+    gradient = LinearGradient([(0, 0, 0), (255, 255, 255)], start=(0, 0), end=(0, 0.5))
+    vertices, _, colors = gradient._apply(SQUARE, SQUARE_INDICES)
+    assert len(vertices) > 4
+    assert (colors[vertices[:, 1] >= 50, 0] == 255).all()
+
+def test_radial_gradient():
+    gradient = RadialGradient([(255, 255, 255), (0, 0, 0)])
+    vertices, _, colors = gradient._apply(SQUARE, SQUARE_INDICES)
+    center = (vertices == (50, 50)).all(axis=1)
+    corner = (vertices == (0, 0)).all(axis=1)
+    assert center.any() and (colors[center, 0] == 255).all()
+    assert (colors[corner, 0] == 0).all()
+
+def test_gradient_follows_the_shape():
+    gradient = LinearGradient([(0, 0, 0), (255, 255, 255)])
+    _, _, colors = gradient._apply(SQUARE, SQUARE_INDICES)
+    _, _, moved_colors = gradient._apply(SQUARE * 2 + 300, SQUARE_INDICES)
+    assert colors.tolist() == moved_colors.tolist()
+
+def test_invalid_gradients():
+    with pytest.raises(ColorError):
+        LinearGradient([(0, 0, 0)])
+    with pytest.raises(ValueError):
+        LinearGradient([(0, 0, 0), (1, 1, 1)], offsets=[0.5])
+    with pytest.raises(ValueError):
+        RadialGradient([(0, 0, 0), (1, 1, 1)], offsets=[1, 0])
+    with pytest.raises(TypeError):
+        Gradient([(0, 0, 0), (1, 1, 1)])  # only the subclasses place the colors
@@ -0,0 +1,89 @@
+import pytest
+import sdl2
+from src.core.window.interactive_rect import InteractiveRect
+from src.core.window.mouse import Mouse
+from src.core.window.window import Window
+from src.core.utils.spatial_grid import SpatialGrid
+from src.enum import mouseButton
+
+class MockWindow:
+    """A window with only the mouse, rects that aren't widgets don't need more."""
+    def __init__(self):
+        self.mouse = Mouse()
+
+class IndexedWindow(MockWindow):
+    """A window that keeps its rects in a spatial index, like the widgets of a window."""
+    _update_pointer_targets = Window._update_pointer_targets
+    _update_pointer_target = Window._update_pointer_target
+
+    def __init__(self):
+        super().__init__()
+        self._widgets, self._spatial_index, self._pointer_targets = {}, SpatialGrid(), set()
+
+    def add(self, rect):
+        self._widgets[rect._handle] = rect
+        self._spatial_index.insert(rect._handle, rect.x, rect.y, rect.w, rect.h)
+        rect._indexed = True
+
+def mouse_frame(mouse, x, y, button_event_type=None):
+    mouse._begin_frame()
+    event = sdl2.SDL_Event()
+    event.type = sdl2.SDL_MOUSEMOTION
+    event.motion.x, event.motion.y = x, y
+    mouse._handle_event(event)
+    if button_event_type is not None:
+        event = sdl2.SDL_Event()
+        event.type = button_event_type
+        event.button.button = sdl2.SDL_BUTTON_LEFT
+        event.button.x, event.button.y = x, y
+        mouse._handle_event(event)
+    mouse._end_frame()
+
+@pytest.mark.parametrize("x, y, expected", [(100, 100, True), (99, 100, False), (300, 120, True), (301, 120, False), (200, 200, True), (200, 201, False)])
+def test_point_collision(x, y, expected):
+    rect = InteractiveRect(MockWindow(), 100, 100, 200, 100)
+    assert rect.point_collision(x, y) == expected
+
+def test_click_press_release():
+    window = MockWindow()
+    rect = InteractiveRect(window, 0, 0, 10, 10)
+
+    mouse_frame(window.mouse, 5, 5, sdl2.SDL_MOUSEBUTTONDOWN)
+    rect._cycle()
+    assert rect.is_mouse_over() and rect.is_clicked()
+
+    mouse_frame(window.mouse, 6, 6)
+    rect._cycle()
+    assert rect.is_pressing() and not rect.is_clicked()
+
+    mouse_frame(window.mouse, 6, 6, sdl2.SDL_MOUSEBUTTONUP)
+    assert rect.is_released(mouseButton.left)
+    rect._cycle()
+    assert not rect.is_pressing()
+
+def test_disabled_rect_is_not_clicked():
+    window = MockWindow()
+    rect = InteractiveRect(window, 0, 0, 10, 10)
+    rect.disable()
+    mouse_frame(window.mouse, 5, 5, sdl2.SDL_MOUSEBUTTONDOWN)
+    assert not rect.is_clicked()
+    assert rect.is_clicked(overwrite_deactivated=True)
+
+def test_setting_fields_updates_the_spatial_index():
+    window = IndexedWindow()
+    rect = InteractiveRect(window, 0, 0, 10, 10)
+    window.add(rect)
+    mouse_frame(window.mouse, 205, 5, sdl2.SDL_MOUSEBUTTONDOWN)
+    window._update_pointer_targets()
+    assert not rect.is_mouse_over()
+
+    rect.x = 200
+    assert rect.is_mouse_over() and rect.is_clicked()
+    assert sdl2.SDL_Rect.x.__get__(rect) == 200, "SDL reads the same geometry"
+    window._update_pointer_targets()
+    assert rect.is_mouse_over(), "the next frame finds the rect at its new position"
+    rect.y = 20
+    assert not rect.is_mouse_over()
+    rect.expand(40)  # the rect methods set the fields as well
+    window._update_pointer_targets()
+    assert rect.is_mouse_over()
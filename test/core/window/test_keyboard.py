@@ -0,0 +1,64 @@
+import pytest
+import sdl2
+from src.core.window.keyboard import Keyboard
+from src.enum import key, keyModifier
+
+def key_event(event_type, keycode, repeat=0, mod=0):
+    event = sdl2.SDL_Event()
+    event.type = event_type
+    event.key.keysym.sym = keycode
+    event.key.keysym.scancode = sdl2.SDL_GetScancodeFromKey(keycode)
+    event.key.keysym.mod = mod
+    event.key.repeat = repeat
+    return event
+
+def run_frame(keyboard, *events):
+    keyboard._reset_keys()
+    for event in events:
+        keyboard._handle_event(event)
+    keyboard._end_frame()
+
+def test_key_edges():
+    keyboard = Keyboard(track_state=True)
+    run_frame(keyboard, key_event(sdl2.SDL_KEYDOWN, sdl2.SDLK_a))
+    assert keyboard.is_key_clicked(key.A)
+    assert keyboard.is_key_pressed(key.A)
+    assert keyboard.active_keys == [sdl2.SDLK_a]
+
+    run_frame(keyboard)
+    assert not keyboard.is_key_clicked(key.A)
+    assert keyboard.is_key_pressed(key.A)
+
+    run_frame(keyboard, key_event(sdl2.SDL_KEYUP, sdl2.SDLK_a))
+    assert keyboard.is_key_released(key.A)
+    assert not keyboard.is_key_pressed(key.A)
+    assert keyboard.active_keys == []
+
+def test_release_without_press():
+    keyboard = Keyboard(track_state=True)
+    run_frame(keyboard, key_event(sdl2.SDL_KEYUP, sdl2.SDLK_b))
+    assert keyboard.is_key_released(key.B)
+    assert keyboard.released_keys == [sdl2.SDLK_b]
+
+def test_key_repeat():
+    keyboard = Keyboard(track_state=True)
+    run_frame(keyboard, key_event(sdl2.SDL_KEYDOWN, sdl2.SDLK_a))
+    run_frame(keyboard, key_event(sdl2.SDL_KEYDOWN, sdl2.SDLK_a, repeat=1))
+
+    assert not keyboard.is_key_clicked(key.A), "a key repeat is not a new click"
+    assert keyboard.clicked_keys == [sdl2.SDLK_a], "text input still receives key repeats"
+
+def test_rollover():
+    keyboard = Keyboard(track_state=True)
+    run_frame(keyboard, *(key_event(sdl2.SDL_KEYDOWN, keycode) for keycode in (sdl2.SDLK_a, sdl2.SDLK_s, sdl2.SDLK_d, sdl2.SDLK_f)))
+    run_frame(keyboard, key_event(sdl2.SDL_KEYUP, sdl2.SDLK_s))
+
+    assert [keyboard.is_key_pressed(k) for k in (key.A, key.S, key.D, key.F)] == [True, False, True, True]
+
+def test_modifiers():
+    keyboard = Keyboard(track_state=True)
+    run_frame(keyboard, key_event(sdl2.SDL_KEYDOWN, sdl2.SDLK_LSHIFT, mod=sdl2.KMOD_LSHIFT))
+
+    assert keyboard.is_modifier_active(keyModifier.SHIFT)
+    assert keyboard.is_modifier_active(keyModifier.LSHIFT)
+    assert not keyboard.is_modifier_active(keyModifier.CTRL)
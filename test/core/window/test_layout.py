@@ -0,0 +1,77 @@
+import pytest
+from src.core.window.layout import LayoutItem, FlexLayout, GridLayout
+from src.enum import layoutDirection, layoutAlign, layoutJustify
+
+class MockWidget:
+    """Only the geometry a layout item touches, counts the geometry updates."""
+    def __init__(self, w, h):
+        self.x, self.y, self.w, self.h = 0, 0, w, h
+        self.updates = 0
+
+    def _set_rect(self, x, y, w, h):
+        self.x, self.y, self.w, self.h = x, y, w, h
+        self.updates += 1
+
+    def geometry(self):
+        return self.x, self.y, self.w, self.h
+
+def test_row_with_grow():
+    a, b = MockWidget(100, 20), MockWidget(50, 20)
+    row = FlexLayout(gap=10, padding=5).add(LayoutItem(a), LayoutItem(b, grow=1))
+    row.layout(0, 0, 400, 100)
+    assert a.geometry() == (5, 5, 100, 90)
+    assert b.geometry() == (115, 5, 280, 90)
+
+def test_column_shrink_and_align():
+    a, b = MockWidget(30, 100), MockWidget(60, 300)
+    column = FlexLayout(layoutDirection.vertical, align=layoutAlign.center).add(LayoutItem(a), LayoutItem(b))
+    column.layout(0, 0, 100, 200)
+    assert a.geometry() == (35, 0, 30, 50)
+    assert b.geometry() == (20, 50, 60, 150)
+
+@pytest.mark.parametrize("justify, expected", [(layoutJustify.start, [0, 20]), (layoutJustify.center, [40, 60]),
+                                               (layoutJustify.end, [80, 100]), (layoutJustify.space_between, [0, 100])])
+def test_justify(justify, expected):
+    widgets = [MockWidget(20, 20), MockWidget(20, 20)]
+    FlexLayout(justify=justify).add(*(LayoutItem(w) for w in widgets)).layout(0, 0, 120, 20)
+    assert [w.x for w in widgets] == expected
+
+def test_percentage_and_limits():
+    a, b = MockWidget(10, 10), MockWidget(10, 10)
+    row = FlexLayout().add(LayoutItem(a, width="25%"), LayoutItem(b, grow=1, max_width=100))
+    row.layout(0, 0, 400, 50)
+    assert a.w == 100 and b.w == 100 and b.x == 100
+
+def test_grid():
+    widgets = [MockWidget(1, 1) for _ in range(5)]
+    GridLayout(2, row_height=30, gap=10).add(*(LayoutItem(w) for w in widgets)).layout(0, 0, 210, 500)
+    assert widgets[0].geometry() == (0, 0, 100, 30)
+    assert widgets[3].geometry() == (110, 40, 100, 30)
+    assert widgets[4].geometry() == (0, 80, 100, 30)
+
+def test_clean_layout_is_skipped():
+    widgets = [MockWidget(20, 20) for _ in range(4)]
+    left, right = FlexLayout().add(LayoutItem(widgets[0]), LayoutItem(widgets[1])), FlexLayout().add(LayoutItem(widgets[2]), LayoutItem(widgets[3]))
+    root = FlexLayout(layoutDirection.vertical).add(left, right)
+    root.layout(0, 0, 200, 200)
+    updates = [w.updates for w in widgets]
+
+    root.layout(0, 0, 200, 200)
+    assert [w.updates for w in widgets] == updates
+
+    # only the row of the changed widget is laid out again
+    right.children[0].set_natural_size(40, 20)
+    root.layout(0, 0, 200, 200)
+    assert [w.updates for w in widgets][:2] == updates[:2]
+    assert widgets[2].w == 40 and widgets[3].x == 40
+
+def test_moved_layout_shifts_children():
+    a = MockWidget(20, 20)
+    row = FlexLayout().add(LayoutItem(a))
+    row.layout(0, 0, 100, 20)
+    row.layout(10, 30, 100, 20)
+    assert (a.x, a.y) == (10, 30)
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        LayoutItem(MockWidget(1, 1), width="50px")
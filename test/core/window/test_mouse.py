@@ -0,0 +1,84 @@
+import pytest
+import sdl2
+from src.core.window.mouse import Mouse
+from src.core.window.rect import Rect
+from src.enum import mouseButton
+
+def motion_event(x, y, xrel=0, yrel=0):
+    event = sdl2.SDL_Event()
+    event.type = sdl2.SDL_MOUSEMOTION
+    event.motion.x, event.motion.y = x, y
+    event.motion.xrel, event.motion.yrel = xrel, yrel
+    return event
+
+def button_event(event_type, button, x=0, y=0):
+    event = sdl2.SDL_Event()
+    event.type = event_type
+    event.button.button = button
+    event.button.x, event.button.y = x, y
+    return event
+
+def wheel_event(y):
+    event = sdl2.SDL_Event()
+    event.type = sdl2.SDL_MOUSEWHEEL
+    event.wheel.y = y
+    return event
+
+def run_frame(mouse, *events):
+    mouse._begin_frame()
+    for event in events:
+        mouse._handle_event(event)
+    mouse._end_frame()
+
+def test_position_and_motion_history():
+    mouse = Mouse()
+    run_frame(mouse, motion_event(10, 10), motion_event(15, 20, 5, 10), motion_event(30, 25, 15, 5))
+
+    assert mouse.get_position() == (30, 25)
+    assert [(motion.x, motion.y) for motion in mouse.get_motion_history()] == [(10, 10), (15, 20), (30, 25)]
+
+    run_frame(mouse, motion_event(40, 25))
+    assert mouse.get_motion() == (10, 0)
+    assert len(mouse.get_motion_history()) == 1
+
+def test_button_edges():
+    mouse = Mouse()
+    run_frame(mouse, button_event(sdl2.SDL_MOUSEBUTTONDOWN, sdl2.SDL_BUTTON_LEFT, 5, 5))
+    assert mouse.is_mouse_clicked(mouseButton.left)
+    assert mouse.is_mouse_pressing(mouseButton.left)
+    assert mouse.is_mouse_clicked_in_rect(Rect(0, 0, 10, 10))
+
+    run_frame(mouse)
+    assert not mouse.is_mouse_clicked(mouseButton.left)
+    assert mouse.is_mouse_pressing(mouseButton.left)
+
+    run_frame(mouse, button_event(sdl2.SDL_MOUSEBUTTONUP, sdl2.SDL_BUTTON_LEFT, 5, 5))
+    assert mouse.is_mouse_released(mouseButton.left)
+    assert not mouse.is_mouse_pressing(mouseButton.left)
+
+def test_click_and_release_in_one_frame():
+    mouse = Mouse()
+    run_frame(mouse, button_event(sdl2.SDL_MOUSEBUTTONDOWN, sdl2.SDL_BUTTON_RIGHT), button_event(sdl2.SDL_MOUSEBUTTONUP, sdl2.SDL_BUTTON_RIGHT))
+
+    assert mouse.is_mouse_clicked(mouseButton.right)
+    assert mouse.is_mouse_released(mouseButton.right)
+    assert not mouse.is_mouse_pressing(mouseButton.right)
+
+def test_wheel():
+    mouse = Mouse()
+    run_frame(mouse, wheel_event(1), wheel_event(2))
+    assert mouse.get_wheel() == (0, 3)
+    assert mouse.isScrolledUp() and not mouse.isScrolledDown()
+
+    run_frame(mouse)
+    assert not mouse.isScrolled()
+
+def test_snapshot_is_immutable():
+    mouse = Mouse()
+    run_frame(mouse, motion_event(1, 2))
+    state = mouse.get_state()
+    run_frame(mouse, motion_event(3, 4))
+
+    assert (state.x, state.y) == (1, 2), "a new frame creates a new snapshot"
+    with pytest.raises(AttributeError):
+        state.x = 5
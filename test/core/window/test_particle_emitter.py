@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from src.core.window.particle_emitter import ParticleEmitter
+
+class MockDraw:
+    def __init__(self):
+        self.calls = []
+
+    def quads(self, centers, sizes, colors, atlas=None, name=None):
+        self.calls.append((centers.copy(), np.array(sizes), colors.copy()))
+
+class MockWindow:
+    def __init__(self):
+        self.draw = MockDraw()
+
+def test_rate_emits_over_time():
+    emitter = ParticleEmitter(MockWindow(), 0, 0, rate=100, lifetime=(10, 10), seed=1)
+    for _ in range(10):
+        emitter.update(0.0125)
+    assert emitter.get_particle_count() == 12
+
+def test_particles_move_with_gravity():
+    emitter = ParticleEmitter(MockWindow(), 10, 20, rate=0, speed=(100, 100), angle=(0, 0), gravity=(0, 10), lifetime=(5, 5))
+    emitter.burst(3)
+    emitter.update(1)
+    slots = np.flatnonzero(emitter._alive)
+    assert np.allclose(emitter._positions[slots], (110, 30))
+
+def test_dead_slots_are_reused():
+    emitter = ParticleEmitter(MockWindow(), 0, 0, capacity=8, rate=0, lifetime=(1, 1))
+    emitter.burst(8)
+    emitter.burst(1)  # full
+    assert emitter.get_particle_count() == 8
+    emitter.update(1.5)
+    assert emitter.get_particle_count() == 0
+    emitter.burst(5)
+    assert emitter.get_particle_count() == 5
+    assert len(set(np.flatnonzero(emitter._alive))) == 5
+
+def test_draw_interpolates_size_and_color():
+    window = MockWindow()
+    emitter = ParticleEmitter(window, 0, 0, rate=0, lifetime=(2, 2), size=10, end_size=0, color=(255, 0, 0, 255), end_color=(0, 0, 255, 55))
+    emitter.burst(2)
+    emitter.update(1)
+    emitter.draw()
+    (centers, sizes, colors), = window.draw.calls
+    assert len(centers) == 2
+    assert np.allclose(sizes, 5)
+    assert colors[0].tolist() == [127, 0, 127, 155]
+
+def test_no_draw_without_particles():
+    window = MockWindow()
+    ParticleEmitter(window, 0, 0).draw()
+    assert window.draw.calls == []
+
+def test_invalid_capacity():
+    with pytest.raises(ValueError):
+        ParticleEmitter(MockWindow(), 0, 0, capacity=0)
@@ -0,0 +1,51 @@
+import math
+import pytest
+from src.core.window import window as window_module
+from src.core.window.event import Event
+from src.core.window.window import Window
+from src.enum import presentMode
+
+class MockRenderer:
+    sdlrenderer = None
+
+def adaptive_window(fps, refresh_rate):
+    """A window with only the present timing, made without opening an SDL window."""
+    window = Window.__new__(Window)
+    window._renderer = MockRenderer()
+    window._event = Event(fps)
+    window._refresh_interval = 1 / refresh_rate
+    window._adaptive_streak = 0
+    window._present_mode = presentMode.immediate
+    window._vsync = False
+    window.set_present_mode(presentMode.adaptive)
+    return window
+
+def present_frame(window, work, fps):
+    """Present a frame that took 'work' seconds, paced the way the clock and the display would pace it."""
+    interval = work
+    if fps != -1 and not window._event.vsync:
+        interval = max(interval, 1 / fps)  # the clock sleeps up to the fps
+    if window._vsync:
+        interval = math.ceil(interval / window._refresh_interval) * window._refresh_interval
+    window._present_interval = interval
+    window._adapt_vsync()
+
+@pytest.fixture(autouse=True)
+def set_vsync(monkeypatch):
+    monkeypatch.setattr(window_module.sdl2, "SDL_RenderSetVSync", lambda renderer, vsync: 0)
+
+def test_adaptive_vsync_turns_back_on_below_the_refresh_rate():
+    fps = 60
+    window = adaptive_window(fps, refresh_rate=144)
+    assert window._vsync
+    for _ in range(3):
+        present_frame(window, 0.02, fps)
+    assert not window._vsync, "frames that miss the refresh turn vsync off"
+    for _ in range(3):
+        present_frame(window, 0.003, fps)
+    assert window._vsync, "the fps doesn't keep vsync off once frames fit in a refresh again"
+
+def test_immediate_mode_sleeps_for_the_fps():
+    window = adaptive_window(60, refresh_rate=144)
+    window.set_present_mode(presentMode.immediate)
+    assert not window._vsync and not window._event.vsync
@@ -0,0 +1,76 @@
+import pytest
+from src.core.window.render_list import RenderList
+
+class MockWidget:
+    """A mock widget with the attributes the render list uses."""
+    def __init__(self, x, y, w, h, opaque=True, layer=0, z_index=0):
+        self.x, self.y, self.w, self.h = x, y, w, h
+        self._opaque = opaque
+        self._layer = layer
+        self._z_index = z_index
+        self._render_key = None
+
+    def _is_opaque(self):
+        return self._opaque
+
+def test_insert_sorts_on_layer_and_z_index():
+    render_list = RenderList()
+    top = MockWidget(0, 0, 10, 10, layer=1)
+    middle = MockWidget(0, 0, 10, 10, z_index=5)
+    bottom = MockWidget(0, 0, 10, 10)
+    for widget in (top, middle, bottom):
+        render_list.insert(widget)
+    assert list(render_list) == [bottom, middle, top]
+
+def test_same_z_index_keeps_insertion_order():
+    render_list = RenderList()
+    first, second = MockWidget(0, 0, 10, 10), MockWidget(0, 0, 10, 10)
+    render_list.insert(first)
+    render_list.insert(second)
+    assert list(render_list) == [first, second]
+
+def test_remove_and_reorder():
+    render_list = RenderList()
+    a, b, c = MockWidget(0, 0, 1, 1), MockWidget(0, 0, 1, 1), MockWidget(0, 0, 1, 1)
+    for widget in (a, b, c):
+        render_list.insert(widget)
+    render_list.remove(b)
+    assert list(render_list) == [a, c] and b not in render_list
+    a._z_index = 1
+    render_list.reorder(a)
+    assert list(render_list) == [c, a]
+    with pytest.raises(ValueError):
+        render_list.remove(b)
+
+def test_cull_widget_covered_by_one_opaque_widget():
+    render_list = RenderList()
+    hidden = MockWidget(10, 10, 20, 20)
+    cover = MockWidget(0, 0, 100, 100, z_index=1)
+    render_list.insert(hidden)
+    render_list.insert(cover)
+    assert render_list.visible_widgets(800, 600) == ([cover], 1)
+
+def test_cull_widget_covered_by_multiple_opaque_widgets():
+    render_list = RenderList()
+    hidden = MockWidget(10, 10, 80, 20)
+    render_list.insert(hidden)
+    render_list.insert(MockWidget(0, 0, 50, 50, z_index=1))
+    render_list.insert(MockWidget(50, 0, 50, 50, z_index=1))
+    visible, culled = render_list.visible_widgets(800, 600)
+    assert hidden not in visible and culled == 1
+
+def test_transparent_and_partial_cover_is_drawn():
+    render_list = RenderList()
+    partly_hidden = MockWidget(10, 10, 80, 20)
+    behind_glass = MockWidget(200, 200, 10, 10)
+    render_list.insert(partly_hidden)
+    render_list.insert(behind_glass)
+    render_list.insert(MockWidget(0, 0, 50, 50, z_index=1))
+    render_list.insert(MockWidget(190, 190, 50, 50, opaque=False, z_index=1))
+    visible, culled = render_list.visible_widgets(800, 600)
+    assert partly_hidden in visible and behind_glass in visible and culled == 0
+
+def test_cull_widget_outside_viewport():
+    render_list = RenderList()
+    render_list.insert(MockWidget(900, 10, 20, 20))
+    assert render_list.visible_widgets(800, 600) == ([], 1)
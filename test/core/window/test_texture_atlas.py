@@ -0,0 +1,129 @@
+import ctypes
+import json
+import threading
+import pytest
+import sdl2
+from src.core.window import frame_pipeline
+from src.core.window.frame_pipeline import DeferredTexture, FramePipeline
+from src.core.window.texture_atlas import TextureAtlas
+from src.core.utils.frame_stats import FrameStats
+from src.core.utils.resource_manager import ResourceManager
+
+class MockRenderer:
+    def __init__(self):
+        self.surface = sdl2.SDL_CreateRGBSurfaceWithFormat(0, 64, 64, 32, sdl2.SDL_PIXELFORMAT_ARGB8888)
+        self.sdlrenderer = sdl2.SDL_CreateSoftwareRenderer(self.surface)
+
+class MockWindow:
+    """A window with a software renderer, textures don't need a real window."""
+    def __init__(self):
+        self._renderer = MockRenderer()
+        self.stats = FrameStats()
+        self.resources = ResourceManager(self.stats)
+
+def surface(width, height, color=0xFFFF0000):
+    image = sdl2.SDL_CreateRGBSurfaceWithFormat(0, width, height, 32, sdl2.SDL_PIXELFORMAT_ARGB8888)
+    sdl2.SDL_FillRect(image, None, color)
+    return image
+
+def pixel(image, x, y):
+    contents = image.contents
+    return ctypes.cast(contents.pixels, ctypes.POINTER(ctypes.c_uint32))[y * contents.pitch // 4 + x]
+
+def test_pack_with_padding():
+    atlas = TextureAtlas(MockWindow(), page_size=64, padding=1)
+    first = atlas.add_surface("a", surface(10, 10))
+    second = atlas.add_surface("b", surface(10, 10, 0xFF00FF00))
+    assert (first.x, first.y) == (1, 1)
+    assert (second.x, second.y) == (13, 1)
+    assert pixel(atlas._pages[0].surface, 13, 1) == 0xFF00FF00
+    assert pixel(atlas._pages[0].surface, 12, 1) == 0
+
+def test_new_page_when_full():
+    atlas = TextureAtlas(MockWindow(), page_size=32, padding=0)
+    for i in range(5):
+        atlas.add_surface(str(i), surface(16, 16))
+    assert atlas.get_page_count() == 2
+    assert atlas.get("4").page == 1
+
+def test_too_large_and_duplicate():
+    atlas = TextureAtlas(MockWindow(), page_size=32)
+    with pytest.raises(ValueError):
+        atlas.add_surface("large", surface(32, 32))
+    atlas.add_surface("a", surface(4, 4))
+    with pytest.raises(KeyError):
+        atlas.add_surface("a", surface(4, 4))
+
+def test_texture_uploaded_once_per_change():
+    window = MockWindow()
+    atlas = TextureAtlas(window, page_size=32)
+    atlas.add_surface("a", surface(4, 4))
+    atlas._get_texture(0)
+    atlas._get_texture(0)
+    assert window.stats.texture_uploads == 1 and window.stats.live_textures == 1
+    atlas.add_surface("b", surface(4, 4))
+    atlas._get_texture(0)
+    assert window.stats.texture_uploads == 2 and window.stats.live_textures == 1
+    atlas.destroy()
+    assert window.stats.live_textures == 0 and len(atlas) == 0
+
+def on_worker(pipeline, work):
+    """run 'work' on a thread that is the worker of 'pipeline', like the update of a pipelined window"""
+    def run():
+        frame_pipeline._local.pipeline = pipeline
+        work()
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+
+def test_pipelined_frames_upload_a_copy_of_the_page():
+    window = MockWindow()
+    atlas = TextureAtlas(window, page_size=32, padding=0)
+    pipeline = FramePipeline(window)
+    textures = []
+    def first_frame():
+        atlas.add_surface("a", surface(4, 4))
+        textures.append(atlas._frame_texture(0))
+        textures.append(atlas._frame_texture(0))
+        atlas.add_surface("b", surface(4, 4, 0xFF00FF00))  # made by the next update while the frame is submitted
+    on_worker(pipeline, first_frame)
+    upload, same_frame = textures
+    assert isinstance(upload, DeferredTexture) and upload() is None
+    assert pixel(upload._surface, 4, 0) == 0, "the frame uploads the page as it was drawn"
+    upload._resolve()
+    assert upload() is not None and same_frame() is upload()
+    assert window.stats.texture_uploads == 1
+    on_worker(pipeline, lambda: textures.append(atlas._frame_texture(0)))
+    assert isinstance(textures[-1], DeferredTexture), "the image added after the copy is uploaded with the next frame"
+    textures[-1]._resolve()
+    assert window.stats.texture_uploads == 2 and window.stats.live_textures == 1
+
+def test_destroyed_atlas_in_a_pipelined_frame():
+    window = MockWindow()
+    atlas = TextureAtlas(window, page_size=32)
+    pipeline = FramePipeline(window)
+    textures = []
+    def frames():
+        atlas.add_surface("a", surface(4, 4))
+        textures.append(atlas._frame_texture(0))
+        atlas.destroy()  # the next update destroys the atlas before the frame is submitted
+    on_worker(pipeline, frames)
+    upload = textures[0]
+    upload._resolve()
+    assert upload() is None and len(window.resources) == 0
+
+def test_save_and_load(tmp_path):
+    window = MockWindow()
+    atlas = TextureAtlas(window, page_size=32)
+    atlas.add_surface("a", surface(8, 8))
+    atlas.add_surface("b", surface(4, 6, 0xFF0000FF))
+    path = str(tmp_path / "icons.json")
+    atlas.save(path)
+    assert json.load(open(path))["pages"] == ["icons_0.png"]
+
+    loaded = TextureAtlas.load(window, path)
+    assert loaded.get("b") == atlas.get("b")
+    region = loaded.get("b")
+    assert pixel(loaded._pages[0].surface, region.x, region.y) == 0xFF0000FF
+    loaded.add_surface("c", surface(4, 4))
+    assert loaded.get("c").page == 1
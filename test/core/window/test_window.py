@@ -0,0 +1,42 @@
+from src.core.utils.slot_map import SlotMap
+from src.core.window.window import Window
+
+class MockWidgetCosts:
+    _enabled = False
+
+class MockRenderList:
+    def __contains__(self, widget):
+        return False
+
+class MockWidget:
+    """Counts its cycles, in its first cycle it destroys the widgets in 'destroys'."""
+    _indexed = False
+
+    def __init__(self, window, handle):
+        self.window, self._handle, self.destroys, self.cycles = window, handle, (), 0
+        window._widgets[handle] = self
+
+    def _cycle(self):
+        self.cycles += 1
+        for widget in self.destroys:
+            self.window._remove_widget(widget)
+
+def cycling_window(count):
+    window = Window.__new__(Window)
+    window._widgets, window._render_list, window.widget_costs = SlotMap(), MockRenderList(), MockWidgetCosts()
+    window._removed_while_cycling = None
+    return window, [MockWidget(window, handle) for handle in range(1, count + 1)]
+
+def test_widget_destroyed_in_its_cycle_skips_no_widget():
+    window, (first, *others) = cycling_window(4)
+    first.destroys = (first,)
+    window._cycle_widgets()
+    assert first.cycles == 1 and [widget.cycles for widget in others] == [1, 1, 1]
+    assert len(window._widgets) == 3 and 1 not in window._widgets
+
+def test_widget_destroyed_earlier_in_the_cycle_is_not_cycled():
+    window, (first, second, third) = cycling_window(3)
+    first.destroys = (third,)
+    window._cycle_widgets()
+    assert (first.cycles, second.cycles, third.cycles) == (1, 1, 0)
+    assert list(window._widgets.values()) == [first, second]
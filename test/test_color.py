@@ -1,5 +1,6 @@
 import pytest
-from src.color import Color
+import numpy as np
+from src.color import Color, PackedColor
 from src.exceptions import ColorError
 
 def test_random_color():
@@ -27,4 +28,40 @@ def test_color_handler(capsys):
         
         Color._handle_rgb_rgba((256, 0, 0))
         captured = capsys.readouterr()
-        assert "out of range" in captured.out
\ No newline at end of file
+        assert "out of range" in captured.out
+def test_packed_color():
+    color = PackedColor(255, 128, 0)
+    assert color == (255, 128, 0, 255)
+    assert color.packed == 0xFF8000FF
+    assert PackedColor.from_packed(color.packed) == color
+    assert (color.sdl_color.r, color.sdl_color.g, color.sdl_color.b, color.sdl_color.a) == (255, 128, 0, 255)
+    assert color.sdl_color is color.sdl_color
+    with pytest.raises(ColorError):
+        PackedColor(256, 0, 0)
+    with pytest.raises(ColorError):
+        PackedColor(0.5, 0, 0)
+
+def test_constants_are_packed():
+    assert isinstance(Color.RED, PackedColor)
+    assert Color.RED == (255, 0, 0, 255)
+    assert Color.GRAY is Color.GREY
+    assert Color._handle_rgb_rgba(Color.RED) is Color.RED
+
+def test_pack_is_memoized():
+    assert Color.pack(Color.BLUE) is Color.BLUE
+    color = Color.pack([10, 20, 30])
+    assert color == (10, 20, 30, 255)
+    assert Color.pack((10, 20, 30)) is color
+    with pytest.raises(ColorError):
+        Color.pack((10, 20))
+
+def test_pack_array():
+    rgba = np.array([[1, 2, 3, 4], [5, 6, 7, 8]], dtype=np.uint8)
+    assert Color.pack_array(rgba) is rgba
+    assert Color.pack_array([[1, 2, 3], [4, 5, 6]]).tolist() == [[1, 2, 3, 255], [4, 5, 6, 255]]
+    packed = np.array([Color.RED.packed, PackedColor(1, 2, 3, 4).packed], dtype=np.uint32)
+    assert Color.pack_array(packed).tolist() == [[255, 0, 0, 255], [1, 2, 3, 4]]
+    with pytest.raises(ColorError):
+        Color.pack_array([[0, 0, 300]])
+    with pytest.raises(ColorError):
+        Color.pack_array([[0, 0]])
@@ -1,9 +1,52 @@
 import pytest
 
 from src.messenger import Messenger
+from src.enum import logLevel
 
 def test_info(capsys):
     Messenger.info("This is useful info!")
+    Messenger.flush()
     read = capsys.readouterr()
     
-    assert read.out == "This is useful info!\n"
\ No newline at end of file
+    assert read.out == "This is useful info!\n"
+
+def test_level_filter(capsys):
+    Messenger.configure(level=logLevel.warning)
+    try:
+        Messenger.info("hidden")
+        Messenger.warning("shown")
+        Messenger.flush()
+    finally:
+        Messenger.configure(level=logLevel.info)
+    assert capsys.readouterr().out == "shown\n"
+
+def test_rate_limit(capsys):
+    Messenger.configure(rate_limit=3)
+    try:
+        for i in range(10):
+            Messenger.info(f"message {i}")
+        Messenger.flush()
+    finally:
+        Messenger.configure(rate_limit=10)
+    assert capsys.readouterr().out == "message 0\nmessage 1\nmessage 2\n"
+
+def test_repeated_messages_are_counted(capsys):
+    for _ in range(4):
+        Messenger.warning("same")
+    Messenger.flush()
+    assert capsys.readouterr().out == "same\nlast message repeated 3 times\n"
+
+def test_log_file_rotation(tmp_path, capsys):
+    log_file = tmp_path / "plang.log"
+    Messenger.configure(log_file_location=str(log_file), console=False, max_file_bytes=100, backup_count=2, rate_limit=0)
+    try:
+        for i in range(20):
+            Messenger.error(f"error number {i}")
+        Messenger.flush()
+    finally:
+        Messenger.configure(log_file_location="", console=True, max_file_bytes=1024 * 1024, backup_count=3, rate_limit=10)
+        Messenger.flush()
+    assert capsys.readouterr().out == ""
+    assert "ERROR: error number 19" in log_file.read_text()
+    assert (tmp_path / "plang.log.1").exists() and (tmp_path / "plang.log.2").exists()
+    assert not (tmp_path / "plang.log.3").exists()
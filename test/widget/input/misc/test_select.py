@@ -0,0 +1,85 @@
+import pytest
+import sdl2
+from src.core.window.keyboard import Keyboard
+from src.core.window.mouse import Mouse
+from src.widget.input.misc import select as select_module
+from src.widget.input.misc.select import Select
+
+class MockText:
+    """A text that keeps its string and the strings it cached, it never renders."""
+    def __init__(self, window, text, font, color):
+        self.text, self.texture = text, None
+        self.cached = {text}
+
+    @staticmethod
+    def _open_font(path, size):
+        return None
+
+    def set_text(self, text):
+        self.text = text
+        self.cached.add(text)
+
+    def clear_cache(self):
+        self.cached = {self.text}
+
+class MockDraw:
+    def rectangle(self, *args):
+        pass
+
+    def set_clip(self, rect):
+        pass
+
+class MockRenderList:
+    def reorder(self, widget):
+        pass
+
+class MockWindow:
+    """A window with the input and the hooks a select uses, widgets aren't registered."""
+    def __init__(self):
+        self.keyboard, self.mouse = Keyboard(), Mouse()
+        self.draw, self._render_list = MockDraw(), MockRenderList()
+
+    def _add_widget(self, widget):
+        pass
+
+class MockFont:
+    path, size = "", 14
+
+@pytest.fixture
+def select(monkeypatch):
+    monkeypatch.setattr(select_module, "Text", MockText)
+    monkeypatch.setattr(sdl2.sdlttf, "TTF_FontLineSkip", lambda font: 16)
+    return Select(MockWindow(), 0, 0, 100, 20, MockFont(), ["green", "grey", "blue"])
+
+def type_frame(window, *keycodes):
+    keyboard = window.keyboard
+    keyboard._reset_keys()
+    for keycode in keycodes:
+        event = sdl2.SDL_Event()
+        event.type = sdl2.SDL_KEYDOWN
+        event.key.keysym.sym = keycode
+        event.key.keysym.scancode = sdl2.SDL_GetScancodeFromKey(keycode)
+        keyboard._handle_event(event)
+    keyboard._end_frame()
+
+def test_typing_filters_once_per_frame(select):
+    select.open()
+    for keycode in (sdl2.SDLK_g, sdl2.SDLK_r):
+        type_frame(select.window, keycode)
+        select._cycle()
+        select.draw()
+    assert select.get_filter() == "gr"
+    assert select.get_filtered_count() == 2
+    assert select._label.text.replace("|", "") == "gr", "drawing doesn't read the typed keys again"
+
+def test_label_cache_stays_small_while_typing(select):
+    select.open()
+    for keycode in (sdl2.SDLK_g, sdl2.SDLK_r, sdl2.SDLK_e, sdl2.SDLK_e, sdl2.SDLK_n):
+        type_frame(select.window, keycode)
+        select._cycle()
+        select.draw()
+        select._keyboard_input._caret_status = not select._keyboard_input._caret_status
+        select.draw()
+        assert len(select._label.cached) <= 3, "only the shown query, with and without the caret, is cached"
+    select.close()
+    assert select._label.cached == {select._label.text}